@@ -0,0 +1,109 @@
+"""
+Benchmark for the throughput of the engine, in commands per second.
+
+The same `COMMANDS_COUNT` commands, which alternately create a package and assign it to one of
+the open routes (`PACKAGES_PER_ROUTE` per route), are run through the interactive loop, with
+every menu answer read from stdin, and through `Engine.run_batch`, with one fully specified
+command per line. Batches are run as text lines and as JSON lines, writing the journal after
+every command or once every `GROUP_SIZE` commands. Each run starts from an empty state in its
+own directory and writes its output to /dev/null.
+
+Run from the repository root:
+    python benchmarks/bench_batch_engine.py
+"""
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+from core.command_factory import CommandFactory
+from core.engine import Engine
+from models.constants.employee_role import EmployeeRole
+
+
+COMMANDS_COUNT = 20_000
+PACKAGES_PER_ROUTE = 50
+GROUP_SIZE = 100
+
+
+def build_app_data() -> tuple[ApplicationData, list[tuple[int, int]]]:
+    app_data = ApplicationData()
+    app_data.login(app_data.create_employee("bench", "Bench", "Mark", "password", EmployeeRole.MANAGER))
+    routes_ids = [app_data.create_route("SYD,MEL,BRI", "2055-02-16 06:00").id
+                  for _ in range(COMMANDS_COUNT // 2 // PACKAGES_PER_ROUTE)]
+    # IDs are unique across runs, so the IDs of the packages the commands create follow this one.
+    first_id = app_data.create_package("SYD", "MEL", 1, "customer@example.com").id + 1
+    return app_data, [(first_id + i, routes_ids[i // PACKAGES_PER_ROUTE]) for i in range(COMMANDS_COUNT // 2)]
+
+
+def interactive_input(assignments: list[tuple[int, int]]) -> str:
+    lines = []
+    for package_id, route_id in assignments:
+        lines += ["5", "SYD", "MEL", "1", "customer@example.com", "10", str(package_id), str(route_id)]
+    return "\n".join(lines + ["exit"]) + "\n"
+
+
+def text_lines(assignments: list[tuple[int, int]]) -> list[str]:
+    lines = []
+    for package_id, route_id in assignments:
+        lines += ["createpackage SYD MEL 1 customer@example.com", f"assignpackagetoroute {package_id} {route_id}"]
+    return lines
+
+
+def json_lines(assignments: list[tuple[int, int]]) -> list[str]:
+    lines = []
+    for package_id, route_id in assignments:
+        lines += [json.dumps({"command": "createpackage", "params": ["SYD", "MEL", 1, "customer@example.com"]}),
+                  json.dumps({"command": "assignpackagetoroute", "params": [package_id, route_id]})]
+    return lines
+
+
+def run(mode: str, group_size: int) -> float:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cwd = os.getcwd()
+        os.chdir(temp_dir)
+        try:
+            app_data, assignments = build_app_data()
+            ApplicationState.open_journal(app_data, group_size)
+            engine = Engine(CommandFactory(app_data), ApplicationState.commit)
+            with open(os.devnull, "w") as devnull:
+                if mode == "interactive":
+                    stdin = StringIO(interactive_input(assignments))
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(devnull):
+                        sys.stdin, original_stdin = stdin, sys.stdin
+                        try:
+                            engine.start()
+                        finally:
+                            sys.stdin = original_stdin
+                else:
+                    lines = text_lines(assignments) if mode == "text" else json_lines(assignments)
+                    start = time.perf_counter()
+                    failed_count = engine.run_batch(lines, devnull)
+                    assert failed_count == 0
+                elapsed = time.perf_counter() - start
+            assert all(app_data.find_package_by_id(package_id).is_assigned for package_id, _ in assignments)
+            ApplicationState.close(app_data)
+        finally:
+            ApplicationState.wait_for_checkpoint()
+            os.chdir(cwd)
+    return COMMANDS_COUNT / elapsed
+
+
+def main():
+    print(f"{COMMANDS_COUNT:,} commands")
+    print(f"{'mode':>12} | {'journal group':>13} | {'commands/s':>10}")
+    for mode, group_size in (("interactive", 1), ("text", 1), ("text", GROUP_SIZE), ("json", GROUP_SIZE)):
+        print(f"{mode:>12} | {group_size:>13} | {run(mode, group_size):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for saving and loading 1M packages in the JSON and the compact binary state format.
+
+The state is generated directly in the dictionary format of `ApplicationData.to_json`, so only
+the file formats are measured: writing the dictionary to a file and reading it back.
+
+Run from the repository root:
+    python benchmarks/bench_binary_state.py
+"""
+import io
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.binary_state import BinaryState
+
+
+PACKAGES_COUNT = 1_000_000
+ROUTES_COUNT = 10_000
+HUBS = ("SYD", "MEL", "ADL", "ASP", "BRI", "DAR", "PER")
+
+
+def build_state(packages_count: int, routes_count: int) -> dict:
+    departure_time = datetime(2055, 2, 16, 6, 0)
+    routes = [{"locations": ",".join(HUBS[i % 7:] + HUBS[:i % 7]),
+               "departure_time": (departure_time + timedelta(hours=i)).isoformat(),
+               "id": i + 1, "assigned_truck_id": None, "assigned_package_ids": [], "load": 0}
+              for i in range(routes_count)]
+    packages = []
+    for i in range(packages_count):
+        route = routes[i % routes_count] if i % 2 else None
+        if route is not None:
+            route["assigned_package_ids"].append(i + 1)
+            route["load"] += 12.5
+        packages.append({"id": i + 1, "start_location": HUBS[i % 7], "end_location": HUBS[(i + 3) % 7],
+                         "weight": 12.5, "customer_email": f"customer{i % 50_000}@example.com",
+                         "departure_time": route["departure_time"] if route else None,
+                         "estimated_arrival_time": (datetime.fromisoformat(route["departure_time"])
+                                                    + timedelta(hours=(i + 3) % 7 * 11.3)).isoformat()
+                         if route else None,
+                         "is_assigned": route is not None, "route_id": route["id"] if route else None})
+    trucks = [{"id": 1001 + i, "name": "Scania", "capacity": 42000, "max_range": 8000, "assigned_route_id": None}
+              for i in range(40)]
+    return {"trucks": trucks, "routes": routes, "packages": packages, "employees": []}
+
+
+def measure(save, load) -> tuple[float, float, int]:
+    f = io.BytesIO()
+    start = time.perf_counter()
+    save(f)
+    save_time = time.perf_counter() - start
+    size = f.tell()
+    f.seek(0)
+    start = time.perf_counter()
+    load(f)
+    load_time = time.perf_counter() - start
+    return save_time, load_time, size
+
+
+def main():
+    data = build_state(PACKAGES_COUNT, ROUTES_COUNT)
+    formats = {
+        "JSON (indent=4)": (lambda f: f.write(json.dumps(data, indent=4).encode()), json.load),
+        "binary": (lambda f: BinaryState.dump(data, f), BinaryState.load),
+    }
+    print(f"{PACKAGES_COUNT:,} packages, {ROUTES_COUNT:,} routes")
+    print(f"{'format':>16} | {'save':>7} | {'load':>7} | {'size':>9}")
+    for name, (save, load) in formats.items():
+        save_time, load_time, size = measure(save, load)
+        print(f"{name:>16} | {save_time:>6.2f}s | {load_time:>6.2f}s | {size / 2 ** 20:>6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark for how long a checkpoint blocks the command loop.
+
+After `CHANGED_PACKAGES` package assignments, the changed entities are saved either on the
+calling thread with `save_data`, or with `checkpoint`, which only copies them and writes them on
+a background thread. The time the caller is blocked is printed for both, along with the time
+the background thread takes to finish.
+
+Run from the repository root:
+    python benchmarks/bench_checkpoint.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core import application_state
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+
+
+PACKAGES_COUNT = 300_000
+CHANGED_PACKAGES = 5000
+
+
+def build_app_data() -> tuple[ApplicationData, int, list[int]]:
+    app_data = ApplicationData()
+    route = app_data.create_route("SYD,MEL,BRI", "2055-02-16 06:00")
+    packages_ids = [app_data.create_package("SYD", "MEL", 10, "customer@example.com").id
+                    for _ in range(PACKAGES_COUNT)]
+    return app_data, route.id, packages_ids
+
+
+def change_packages(app_data: ApplicationData, route_id: int, packages_ids: list[int]) -> None:
+    for package_id in packages_ids:
+        app_data.assign_package_to_route(package_id, route_id)
+        ApplicationState.commit(app_data)
+
+
+def main():
+    original_dir = os.getcwd()
+    app_data, route_id, packages_ids = build_app_data()
+    step = PACKAGES_COUNT // 2 // CHANGED_PACKAGES
+    # Checkpoints are taken explicitly below.
+    application_state.COMPACTION_THRESHOLD = sys.maxsize
+    application_state.CHECKPOINT_INTERVAL = sys.maxsize
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            ApplicationState.save_data(app_data)
+            ApplicationState.open_journal(app_data, group_size=100)
+
+            change_packages(app_data, route_id, packages_ids[:PACKAGES_COUNT // 2:step])
+            start = time.perf_counter()
+            ApplicationState.save_data(app_data)
+            blocking_save = time.perf_counter() - start
+
+            change_packages(app_data, route_id, packages_ids[PACKAGES_COUNT // 2::step])
+            start = time.perf_counter()
+            ApplicationState.checkpoint(app_data)
+            checkpoint = time.perf_counter() - start
+            ApplicationState.wait_for_checkpoint()
+            background_write = time.perf_counter() - start
+
+            ApplicationState.close(app_data)
+        finally:
+            os.chdir(original_dir)
+
+    print(f"{'packages':>9} | {'changed':>7} | {'save_data blocks':>16} | {'checkpoint blocks':>17} | "
+          f"{'background write':>16}")
+    print(f"{PACKAGES_COUNT:>9} | {CHANGED_PACKAGES:>7} | {blocking_save:>15.3f}s | {checkpoint:>16.3f}s | "
+          f"{background_write:>15.3f}s")
+
+
+if __name__ == "__main__":
+    main()
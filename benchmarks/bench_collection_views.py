@@ -0,0 +1,41 @@
+"""
+Microbenchmark for the ApplicationData collection properties.
+
+Measures how long it takes to read `ApplicationData.trucks` as the fleet grows.
+The property returns a live view, so the access time should stay flat from
+one thousand to one million trucks.
+
+Run from the repository root:
+    python benchmarks/bench_collection_views.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from models.truck import Truck
+
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+ACCESSES = 100_000
+
+
+def build_app_data(size: int) -> ApplicationData:
+    app_data = ApplicationData()
+    for _ in range(size):
+        app_data._add_truck(Truck("Scania", 42000, 8000))
+    return app_data
+
+
+def main():
+    print(f"{'trucks':>10} | {'ns per access':>14}")
+    for size in SIZES:
+        app_data = build_app_data(size)
+        seconds = timeit.timeit(lambda: app_data.trucks, number=ACCESSES)
+        print(f"{size:>10} | {seconds / ACCESSES * 1e9:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
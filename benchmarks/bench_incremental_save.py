@@ -0,0 +1,65 @@
+"""
+Benchmark for `ApplicationState.save_data` when a few entities change in a large state.
+
+The first save writes every entity to the segmented store. Later saves rewrite only the
+segments holding changed entities, so their cost should stay flat as the state grows.
+A full single-file JSON dump, as written by earlier versions, is timed for comparison.
+
+Run from the repository root:
+    python benchmarks/bench_incremental_save.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+
+
+PACKAGE_COUNTS = (10_000, 100_000, 300_000)
+CHANGED_PACKAGES = 10
+
+
+def build_app_data(packages_count: int) -> tuple[ApplicationData, int, list[int]]:
+    app_data = ApplicationData()
+    route = app_data.create_route("SYD,MEL,BRI", "2055-02-16 06:00")
+    packages_ids = [app_data.create_package("SYD", "MEL", 10, "customer@example.com").id
+                    for _ in range(packages_count)]
+    return app_data, route.id, packages_ids
+
+
+def main():
+    original_dir = os.getcwd()
+    print(f"{'packages':>9} | {'full JSON dump':>14} | {'first save':>10} | {f'save {CHANGED_PACKAGES} changes':>15}")
+    for packages_count in PACKAGE_COUNTS:
+        app_data, route_id, packages_ids = build_app_data(packages_count)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                start = time.perf_counter()
+                with open("full.json", "w") as f:
+                    json.dump(app_data.to_json(), f, indent=4)
+                full_dump = time.perf_counter() - start
+
+                start = time.perf_counter()
+                ApplicationState.save_data(app_data)
+                first_save = time.perf_counter() - start
+
+                for package_id in packages_ids[::packages_count // CHANGED_PACKAGES]:
+                    app_data.assign_package_to_route(package_id, route_id)
+                start = time.perf_counter()
+                ApplicationState.save_data(app_data)
+                incremental_save = time.perf_counter() - start
+            finally:
+                os.chdir(original_dir)
+
+        print(f"{packages_count:>9} | {full_dump:>13.3f}s | {first_save:>9.3f}s | {incremental_save:>14.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark for `ApplicationState.load_data` in lazy mode on a large segmented store.
+
+An eager load builds every package at startup, running its constructor validation again.
+A lazy load builds only trucks, routes and employees and reads a package from its segment the
+first time it is used, so its startup time should not grow with the number of packages.
+
+Run from the repository root:
+    python benchmarks/bench_lazy_load.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+
+
+PACKAGE_COUNTS = (10_000, 100_000, 300_000)
+
+
+def build_app_data(packages_count: int) -> tuple[ApplicationData, int]:
+    app_data = ApplicationData()
+    app_data.create_route("SYD,MEL,BRI", "2055-02-16 06:00")
+    packages_ids = [app_data.create_package("SYD", "MEL", 10, "customer@example.com").id
+                    for _ in range(packages_count)]
+    return app_data, packages_ids[packages_count // 2]
+
+
+def main():
+    original_dir = os.getcwd()
+    print(f"{'packages':>9} | {'eager load':>10} | {'lazy load':>9} | {'first lookup':>12} | {'all unassigned':>14}")
+    for packages_count in PACKAGE_COUNTS:
+        app_data, package_id = build_app_data(packages_count)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                ApplicationState.save_data(app_data)
+                del app_data
+
+                start = time.perf_counter()
+                ApplicationState.load_data()
+                eager_load = time.perf_counter() - start
+
+                start = time.perf_counter()
+                app_data = ApplicationState.load_data(lazy=True)
+                lazy_load = time.perf_counter() - start
+
+                start = time.perf_counter()
+                app_data.find_package_by_id(package_id)
+                first_lookup = time.perf_counter() - start
+
+                start = time.perf_counter()
+                app_data.get_packages_by_assigned_status(False)
+                all_unassigned = time.perf_counter() - start
+            finally:
+                os.chdir(original_dir)
+
+        print(f"{packages_count:>9} | {eager_load:>9.3f}s | {lazy_load * 1000:>7.2f}ms | "
+              f"{first_lookup * 1000:>10.2f}ms | {all_unassigned:>13.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark for a reporting process that reads the fleet state from a memory-mapped snapshot.
+
+Each reader runs in a fresh process. It opens the state, looks up `LOOKUPS_COUNT` packages by ID
+and scans the weight of all unassigned packages. One reader imports the binary state into
+`ApplicationData`. The other maps the snapshot written by `export_data(..., "app_state.snap")`.
+The private memory of each process is reported (RssAnon). Pages of the mapped snapshot are
+file-backed and shared with every other process that maps it, so they are not included.
+
+Run from the repository root:
+    python benchmarks/bench_mapped_snapshot.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+from core.mapped_snapshot import MappedSnapshot
+
+
+PACKAGES_COUNT = 300_000
+ROUTES_COUNT = 3_000
+LOOKUPS_COUNT = 1_000
+LOCATIONS = ("SYD,MEL,ADL,ASP", "BRI,SYD,MEL", "PER,ADL,SYD,MEL,BRI")
+
+
+def build_app_data() -> ApplicationData:
+    app_data = ApplicationData()
+    routes = [app_data.create_route(LOCATIONS[i % len(LOCATIONS)], f"2055-02-{i % 28 + 1:02d} 06:00")
+              for i in range(ROUTES_COUNT)]
+    for i in range(PACKAGES_COUNT):
+        package = app_data.create_package("SYD", "MEL", 10, f"customer{i}@example.com")
+        if i % 2:
+            app_data.assign_package_to_route(package.id, routes[i % ROUTES_COUNT].id)
+    return app_data
+
+
+def private_rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    return 0
+
+
+def run(mode: str, file_name: str) -> None:
+    lookup_ids = range(1, PACKAGES_COUNT, PACKAGES_COUNT // LOOKUPS_COUNT)
+    start = time.perf_counter()
+    if mode == "import":
+        app_data = ApplicationState.import_data(file_name)
+        opened = time.perf_counter()
+        for package_id in lookup_ids:
+            app_data.find_package_by_id(package_id).to_json()
+        looked_up = time.perf_counter()
+        unassigned_weight = sum(package.weight for package in app_data.get_packages_by_assigned_status(False))
+    else:
+        snapshot = MappedSnapshot(file_name)
+        opened = time.perf_counter()
+        for package_id in lookup_ids:
+            snapshot.find("packages", package_id)
+        looked_up = time.perf_counter()
+        unassigned_weight = sum(weight for weight, is_assigned
+                                in zip(snapshot.column("packages", "weight"),
+                                       snapshot.column("packages", "is_assigned")) if not is_assigned)
+    scanned = time.perf_counter()
+    print(f"{mode:>8} | {opened - start:>8.3f}s | {(looked_up - opened) * 1000:>9.1f}ms | "
+          f"{scanned - looked_up:>6.3f}s | {private_rss_mb():>6.0f} MB | {unassigned_weight:.0f}")
+
+
+def main():
+    if len(sys.argv) == 3:
+        run(sys.argv[1], sys.argv[2])
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        binary_file_name = os.path.join(temp_dir, "app_state.bin")
+        snapshot_file_name = os.path.join(temp_dir, "app_state.snap")
+        app_data = build_app_data()
+        ApplicationState.export_data(app_data, binary_file_name)
+        ApplicationState.export_data(app_data, snapshot_file_name)
+        print(f"{PACKAGES_COUNT:,} packages, snapshot of {os.path.getsize(snapshot_file_name) / 2 ** 20:.0f} MB")
+        print(f"{'reader':>8} | {'open':>9} | {f'{LOOKUPS_COUNT} lookups':>11} | {'scan':>7} | {'private':>9} | weight")
+        subprocess.run([sys.executable, __file__, "import", binary_file_name], check=True)
+        subprocess.run([sys.executable, __file__, "snapshot", snapshot_file_name], check=True)
+
+
+if __name__ == "__main__":
+    main()
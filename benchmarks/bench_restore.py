@@ -0,0 +1,73 @@
+"""
+Benchmark for restoring saved entities with `restore` instead of `from_json`.
+
+`from_json` runs every constructor validation again and draws a new ID for each record, while
+`restore` sets the saved fields directly. The time per record is printed for both, along with
+the speedup. Each is the best of `REPEATS` passes over the records.
+
+Run from the repository root:
+    python benchmarks/bench_restore.py
+"""
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from models.constants.distances import Distance
+from models.employee import Employee
+from models.package import Package
+from models.route import Route
+from models.truck import Truck
+
+
+RECORDS_COUNT = 100_000
+ROUTES_WITH_PACKAGES = 1000
+REPEATS = 5
+
+
+def build_records() -> dict:
+    # Every route departs at a different time, and the packages are spread over the first
+    # ROUTES_WITH_PACKAGES routes, sharing their departure and arrival times.
+    route = Route("SYD,MEL,BRI,ADL", "2055-02-16 06:00")
+    routes = [{**route.to_json(), "id": route_id,
+               "departure_time": (route.departure_time + timedelta(minutes=route_id)).isoformat()}
+              for route_id in range(1, RECORDS_COUNT + 1)]
+    package = Package("SYD", "MEL", 10, "customer@example.com")
+    packages = [{**package.to_json(), "id": package_id,
+                 "departure_time": routes[package_id % ROUTES_WITH_PACKAGES]["departure_time"],
+                 "estimated_arrival_time": (route.stops["MEL"]
+                                            + timedelta(minutes=package_id % ROUTES_WITH_PACKAGES)).isoformat()}
+                for package_id in range(1, RECORDS_COUNT + 1)]
+    return {
+        Package: packages,
+        Route: routes,
+        Truck: [{**Truck("Scania", 42000, 8000).to_json(), "id": truck_id}
+                for truck_id in range(1001, RECORDS_COUNT + 1001)],
+        Employee: [{**Employee(f"user{i}", "John", "Doe", "password_1234", "Regular").to_json()}
+                   for i in range(RECORDS_COUNT)]}
+
+
+def time_per_record(create, records: list[dict]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for record in records:
+            create(record)
+        best = min(best, time.perf_counter() - start)
+    return best / len(records)
+
+
+def main():
+    Distance.load_network()
+    records = build_records()
+    print(f"{'model':>8} | {'from_json':>9} | {'restore':>9} | {'speedup':>7}")
+    for model, model_records in records.items():
+        from_json = time_per_record(model.from_json, model_records)
+        restore = time_per_record(model.restore, model_records)
+        print(f"{model.__name__:>8} | {from_json * 1e6:>7.2f}us | {restore * 1e6:>7.2f}us | {from_json / restore:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
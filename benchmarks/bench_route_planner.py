@@ -0,0 +1,65 @@
+"""
+Benchmark for RoutePlanner on networks of 5 to 200 hubs.
+
+Hubs are random points on a 4000 km square connected by straight roads. Sets up to
+`RoutePlanner.EXACT_SEARCH_LIMIT` hubs are solved exactly, larger ones with the
+nearest-neighbour + 2-opt/or-opt heuristic, which is compared with the plain
+nearest-neighbour order.
+
+Run from the repository root:
+    python benchmarks/bench_route_planner.py
+"""
+import math
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.route_planner import RoutePlanner
+from models.constants.distances import Distance
+
+
+HUB_COUNTS = (5, 8, 10, 20, 50, 100, 200)
+DEPARTURE_TIME = datetime(2055, 2, 16, 6, 0)
+
+
+def build_network(hubs_count: int, seed: int = 42) -> list[str]:
+    generator = random.Random(seed)
+    points = {f"H{i:03d}": (generator.uniform(0, 4000), generator.uniform(0, 4000)) for i in range(hubs_count)}
+    Distance.DISTANCES = {hub_1: {hub_2: round(math.dist(point_1, point_2))
+                                  for hub_2, point_2 in points.items() if hub_2 != hub_1}
+                          for hub_1, point_1 in points.items()}
+    return list(points)
+
+
+def nearest_neighbour_length(hubs: list[str]) -> int:
+    order, remaining, length = [hubs[0]], set(hubs[1:]), 0
+    while remaining:
+        nearest = min(remaining, key=lambda hub: Distance.get_distance(order[-1], hub))
+        length += Distance.get_distance(order[-1], nearest)
+        order.append(nearest)
+        remaining.remove(nearest)
+    return length
+
+
+def main():
+    original_distances = Distance.DISTANCES
+    print(f"{'hubs':>5} | {'method':>9} | {'seconds':>8} | {'km':>7} | {'nearest neighbour km':>20}")
+    try:
+        for hubs_count in HUB_COUNTS:
+            hubs = build_network(hubs_count)
+            start = time.perf_counter()
+            plan = RoutePlanner.plan(hubs, DEPARTURE_TIME)
+            elapsed = time.perf_counter() - start
+            method = "exact" if hubs_count <= RoutePlanner.EXACT_SEARCH_LIMIT else "heuristic"
+            print(f"{hubs_count:>5} | {method:>9} | {elapsed:>8.3f} | {plan.distance:>7} | "
+                  f"{nearest_neighbour_length(hubs):>20}")
+    finally:
+        Distance.DISTANCES = original_distances
+
+
+if __name__ == "__main__":
+    main()
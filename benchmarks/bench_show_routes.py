@@ -0,0 +1,47 @@
+"""
+Benchmark for `ShowRoutesCommand("all")` over a large number of routes.
+
+Each route's stop schedule is read several times while it is rendered
+(`stops`, `status`, `current_location`), so this measures the benefit of
+caching the schedule on the route.
+
+Run from the repository root:
+    python benchmarks/bench_show_routes.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from commands.show_routes import ShowRoutesCommand
+from models.constants.employee_role import EmployeeRole
+from models.employee import Employee
+
+
+ROUTES_COUNT = 100_000
+LOCATIONS = ("SYD,MEL,ADL,ASP", "BRI,SYD,MEL", "PER,ADL,MEL,SYD,BRI")
+
+
+def build_app_data(routes_count: int) -> ApplicationData:
+    app_data = ApplicationData()
+    for i in range(routes_count):
+        app_data.create_route(LOCATIONS[i % len(LOCATIONS)], f"2055-02-{i % 28 + 1:02d} 06:00")
+    app_data.login(Employee("benchmark", "Bench", "Mark", "password", EmployeeRole.MANAGER))
+    return app_data
+
+
+def main():
+    app_data = build_app_data(ROUTES_COUNT)
+    command = ShowRoutesCommand(["all"], app_data)
+
+    for run in ("cold", "warm"):
+        start = time.perf_counter()
+        command.execute()
+        elapsed = time.perf_counter() - start
+        print(f"ShowRoutesCommand(\"all\"), {ROUTES_COUNT} routes, {run} schedule cache: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark for keeping the application state in a SQLite database.
+
+Opening the database loads trucks, routes and employees only, so startup should not depend on
+the number of packages, and committing a command should cost one small transaction. Loading the
+segmented store, which builds every package at startup, is timed for comparison.
+
+Run from the repository root:
+    python benchmarks/bench_sqlite_store.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+
+
+PACKAGE_COUNTS = (10_000, 100_000, 300_000)
+
+
+def build_app_data(packages_count: int) -> tuple[ApplicationData, int, int]:
+    app_data = ApplicationData()
+    route = app_data.create_route("SYD,MEL,BRI", "2055-02-16 06:00")
+    packages_ids = [app_data.create_package("SYD", "MEL", 10, "customer@example.com").id
+                    for _ in range(packages_count)]
+    return app_data, route.id, packages_ids[packages_count // 2]
+
+
+def main():
+    original_dir = os.getcwd()
+    print(f"{'packages':>9} | {'load store':>10} | {'open database':>13} | {'find package':>12} | {'commit':>8}")
+    for packages_count in PACKAGE_COUNTS:
+        app_data, route_id, package_id = build_app_data(packages_count)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                ApplicationState.save_data(app_data)
+                del app_data
+
+                start = time.perf_counter()
+                ApplicationState.load_data()
+                load_store = time.perf_counter() - start
+
+                ApplicationState.close(ApplicationState.open_database())
+
+                start = time.perf_counter()
+                app_data = ApplicationState.open_database()
+                open_database = time.perf_counter() - start
+
+                start = time.perf_counter()
+                app_data.find_package_by_id(package_id)
+                find_package = time.perf_counter() - start
+
+                start = time.perf_counter()
+                app_data.assign_package_to_route(package_id, route_id)
+                ApplicationState.commit(app_data)
+                commit = time.perf_counter() - start
+
+                ApplicationState.close(app_data)
+            finally:
+                os.chdir(original_dir)
+
+        print(f"{packages_count:>9} | {load_store:>9.3f}s | {open_database * 1000:>11.2f}ms | "
+              f"{find_package * 1000:>10.2f}ms | {commit * 1000:>6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark for loading a large JSON state with `json.load` versus the streaming loader.
+
+Each loader runs in a fresh process, which reports its load time and its peak resident memory.
+A baseline process only builds the same objects from scratch, which gives the memory of the
+final object graph.
+
+Run from the repository root:
+    python benchmarks/bench_streaming_load.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skeleton"))
+
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+
+
+PACKAGES_COUNT = 300_000
+ROUTES_COUNT = 3_000
+LOCATIONS = ("SYD,MEL,ADL,ASP", "BRI,SYD,MEL", "PER,ADL,SYD,MEL,BRI")
+
+
+def build_app_data() -> ApplicationData:
+    app_data = ApplicationData()
+    routes = [app_data.create_route(LOCATIONS[i % len(LOCATIONS)], f"2055-02-{i % 28 + 1:02d} 06:00")
+              for i in range(ROUTES_COUNT)]
+    for i in range(PACKAGES_COUNT):
+        package = app_data.create_package("SYD", "MEL", 10, f"customer{i}@example.com")
+        if i % 2:
+            app_data.assign_package_to_route(package.id, routes[i % ROUTES_COUNT].id)
+    return app_data
+
+
+def peak_rss_kb() -> int:
+    # VmHWM is reset when the process starts, unlike ru_maxrss, which is inherited from the parent.
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return 0
+
+
+def run(mode: str, file_name: str) -> None:
+    start = time.perf_counter()
+    if mode == "objects only":
+        build_app_data()
+    elif mode == "json.load":
+        with open(file_name, "r") as f:
+            ApplicationData.from_json(json.load(f))
+    else:
+        ApplicationState.import_data(file_name)
+    elapsed = time.perf_counter() - start
+    peak_mb = peak_rss_kb() / 1024
+    print(f"{mode:>12} | {elapsed:>6.2f}s | {peak_mb:>7.0f} MB")
+
+
+def main():
+    if len(sys.argv) == 3:
+        run(sys.argv[1], sys.argv[2])
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_name = os.path.join(temp_dir, "app_state.json")
+        ApplicationState.export_data(build_app_data(), file_name)
+        print(f"{PACKAGES_COUNT:,} packages, {os.path.getsize(file_name) / 2 ** 20:.0f} MB of JSON")
+        print(f"{'loader':>12} | {'time':>7} | {'peak RSS':>10}")
+        for mode in ("objects only", "json.load", "streaming"):
+            subprocess.run([sys.executable, __file__, mode, file_name], check=True)
+
+
+if __name__ == "__main__":
+    main()
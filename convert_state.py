@@ -0,0 +1,27 @@
+"""
+Converts a saved application state between the JSON and the compact binary format, or exports
+the segmented store in `app_state/` to a single JSON or binary file.
+
+Usage:
+    python convert_state.py app_state.json app_state.bin
+    python convert_state.py app_state.bin app_state.json
+    python convert_state.py app_state app_state.json
+"""
+import os
+import sys
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+from core.binary_state import BinaryState
+from core.segmented_store import SegmentedStore
+from models.constants.distances import Distance
+
+
+if len(sys.argv) != 3:
+    print(__doc__)
+    sys.exit(1)
+
+Distance.load_network()
+if os.path.isdir(sys.argv[1]):
+    ApplicationState.export_data(ApplicationData.from_json(SegmentedStore(sys.argv[1]).read()), sys.argv[2])
+else:
+    BinaryState.convert(sys.argv[1], sys.argv[2])
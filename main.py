@@ -1,17 +1,60 @@
+import sys
 from core.application_data import ApplicationData
-from core.application_state import ApplicationState
+from core.application_state import ApplicationState, SNAPSHOT_FILE_NAME
 from core.command_factory import CommandFactory
 from core.engine import Engine
+from models.constants.distances import Distance
 
 
-app_data = ApplicationState.load_data()
+def show_load_progress(loaded_size: int, total_size: int):
+    if total_size:
+        print(f"\rLoading application state... {loaded_size * 100 // total_size}%",
+              end="\n" if loaded_size >= total_size else "")
 
-if app_data is None:
-    app_data = ApplicationData()
-    ApplicationState.seed_data(app_data)
+
+# Commands whose journal records are written together in batch mode.
+BATCH_JOURNAL_GROUP_SIZE = 100
+
+
+def batch_file_name() -> str | None:
+    if "--batch" not in sys.argv[1:]:
+        return None
+    index = sys.argv.index("--batch")
+    return sys.argv[index + 1] if index + 1 < len(sys.argv) else "-"
+
+
+Distance.load_network()
+batch = batch_file_name()
+# The results of a batch are written to stdout, so the load progress is not shown.
+progress = show_load_progress if batch is None else None
+
+if "--sqlite" in sys.argv[1:]:
+    app_data = ApplicationState.open_database(progress=progress)
+    if not app_data.trucks:
+        ApplicationState.seed_data(app_data)
+        ApplicationState.commit(app_data)
+else:
+    app_data = ApplicationState.load_data(progress, lazy=True)
+
+    if app_data is None:
+        app_data = ApplicationData()
+        ApplicationState.seed_data(app_data)
+        ApplicationState.save_data(app_data)
+
+    ApplicationState.open_journal(app_data, BATCH_JOURNAL_GROUP_SIZE if batch else 1,
+                                  SNAPSHOT_FILE_NAME if "--snapshot" in sys.argv[1:] else None)
 
 cmd_factory = CommandFactory(app_data)
-engine = Engine(cmd_factory)
+engine = Engine(cmd_factory, ApplicationState.commit)
 
-engine.start()
-ApplicationState.save_data(app_data)
+if batch is None:
+    engine.start()
+    ApplicationState.close(app_data)
+else:
+    if batch == "-":
+        failed_count = engine.run_batch(sys.stdin)
+    else:
+        with open(batch, "r", encoding="utf-8") as f:
+            failed_count = engine.run_batch(f)
+    ApplicationState.close(app_data)
+    sys.exit(1 if failed_count else 0)
@@ -1,51 +1,55 @@
 from errors.application_error import ApplicationError
-from commands.validation_helpers import validate_unknown_params_count, try_parse_int
+from commands.validation_helpers import try_parse_int
 from commands.base_command import BaseCommand
 from core.application_data import ApplicationData
 
 
 class BulkAssignPackagesCommand(BaseCommand):
     """
-    Command to assign multiple packages to a route in bulk.
+    Command to assign multiple packages to routes in bulk.
 
-    This command validates the input parameters, assigns packages to the specified route,
-    and logs the action. It stops assigning packages if the route's capacity is exceeded.
+    The first parameter is either a route ID, to assign all the given packages to that route,
+    or `AUTO_PLAN` to let the application pack the packages into the open routes by weight
+    and hub order. The second parameter is the list of package IDs; in auto mode an empty list
+    means every unassigned package.
+
+    The assignment is atomic: if any package cannot be assigned, none of them are.
     """
+    AUTO_PLAN = "auto"
+
     def __init__(self, params, app_data: ApplicationData):
         super().__init__(params, app_data)
 
     def execute(self) -> str:
         """
-        Executes the command to assign multiple packages to a route.
+        Executes the command to assign multiple packages to routes.
 
         Returns:
-            str: A confirmation message indicating which packages were assigned and
-            if the operation was terminated due to capacity constraints.
+            str: A confirmation message indicating which packages were assigned to which routes.
 
         Raises:
-            ApplicationError: If the route or any package does not exist, or if the route has no assigned truck.
+            ApplicationError: If no packages are given for a route, if the route or any package
+                              does not exist, or if any package cannot be assigned to the route.
         """
-        validate_unknown_params_count(self._params, min_count=2, max_count=102)
+        super().execute()
 
-        if self._requires_login() and not self._app_data.has_logged_in_employee:
-            self.logger.warning("Unauthorized access attempt detected.")
-            raise ValueError("You are not logged in! Please login first!" + BaseCommand.ROW_SEP)
+        route_id, packages_ids = self._params
+        packages_ids = [try_parse_int(package_id) for package_id in packages_ids if str(package_id).strip()]
 
-        bulk_assigned_packages = []
+        if str(route_id).strip().lower() == self.AUTO_PLAN:
+            return self._assign_automatically(packages_ids or None)
 
-        route_id, packages_ids = self._params
-        route_id = try_parse_int(route_id)
-        packages_ids = map(int, packages_ids)
+        if not packages_ids:
+            raise ApplicationError("No Package IDs given to assign.")
 
+        route_id = try_parse_int(route_id)
         route = self._app_data.find_route_by_id(route_id)
 
         if not route:
             raise ApplicationError(f"No Route with ID {route_id}")
 
-        for package_id in packages_ids:
-            self.app_data.assign_package_to_route(package_id, route_id)
-            bulk_assigned_packages.append(package_id)
-
+        self.app_data.assign_packages_to_routes({package_id: route_id for package_id in packages_ids})
+        bulk_assigned_packages = list(dict.fromkeys(packages_ids))
 
         self.logger.info(f"Bulk assigned Packages to Route ID {route_id}:"
                          f" {bulk_assigned_packages}"
@@ -54,8 +58,40 @@ class BulkAssignPackagesCommand(BaseCommand):
         return (f"Bulk assigned Packages to Route ID {route_id}: "
                 f"{bulk_assigned_packages}")
 
+    def _assign_automatically(self, packages_ids: list[int] | None) -> str:
+        """
+        Plans and assigns the packages to the open routes.
+
+        Args:
+            packages_ids (list[int] | None): The packages to assign, or None for all unassigned packages.
+
+        Returns:
+            str: A summary of how many packages were assigned to each route.
+        """
+        assignments = self.app_data.plan_package_assignments(packages_ids)
+        self.app_data.assign_packages_to_routes(assignments)
+
+        packages_per_route = {}
+        for package_id, route_id in assignments.items():
+            packages_per_route.setdefault(route_id, []).append(package_id)
+
+        self.logger.info(f"Bulk assigned Packages to Routes: {packages_per_route}"
+                         f" | Executed by: {self.app_data.logged_in_employee}")
+
+        result = f"Bulk assigned {len(assignments)} Packages to {len(packages_per_route)} Routes"
+        for route_id, route_packages_ids in packages_per_route.items():
+            result += f"\nRoute ID {route_id}: {len(route_packages_ids)} Packages"
+        if packages_ids is None:
+            unassigned_count = len(self.app_data.get_packages_by_assigned_status(False))
+        else:
+            unassigned_count = len(set(packages_ids)) - len(assignments)
+        if unassigned_count:
+            result += f"\n{unassigned_count} Packages did not fit in any Route"
+
+        return result
+
     def _requires_login(self) -> bool:
         return True
 
     def _expected_params_count(self) -> int:
-        return 0
\ No newline at end of file
+        return 2
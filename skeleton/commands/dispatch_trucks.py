@@ -0,0 +1,41 @@
+from commands.base_command import BaseCommand
+from core.application_data import ApplicationData
+
+
+class DispatchTrucksCommand(BaseCommand):
+    """
+    Command to assign free trucks to all routes that are waiting for one.
+
+    Every route that has not departed yet and has no truck gets the smallest free truck
+    that can carry its load over its distance. Routes for which no truck is available
+    are left unassigned.
+    """
+    def __init__(self, params, app_data: ApplicationData):
+        super().__init__(params, app_data)
+
+    def execute(self) -> str:
+        """
+        Executes the command to dispatch trucks to routes.
+
+        Returns:
+            str: A list of the truck assigned to each route.
+        """
+        super().execute()
+
+        dispatched_trucks = self.app_data.dispatch_trucks()
+
+        self.logger.info(f"Dispatched Trucks to Routes: {dispatched_trucks}"
+                         f" | Executed by: {self.app_data.logged_in_employee}")
+
+        if not dispatched_trucks:
+            return "No Routes could be dispatched" + BaseCommand.ROW_SEP
+
+        return (f"Dispatched {len(dispatched_trucks)} Trucks:\n"
+                + "\n".join(f"Truck with ID {truck_id} assigned to Route with ID {route_id}"
+                            for route_id, truck_id in dispatched_trucks.items()))
+
+    def _requires_login(self) -> bool:
+        return True
+
+    def _expected_params_count(self) -> int:
+        return 0
@@ -0,0 +1,59 @@
+from commands.base_command import BaseCommand
+from commands.validation_helpers import try_parse_int
+from core.application_data import ApplicationData
+from models.route import Route
+
+
+class PlanRouteCommand(BaseCommand):
+    """
+    Command to create a new route from a set of hubs, visited in the shortest order found.
+
+    Unlike CreateRouteCommand, the hubs can be given in any order. An optional start hub
+    fixes where the route begins and an optional truck range rejects routes that are too long.
+    """
+    def __init__(self, params, app_data: ApplicationData):
+        super().__init__(params, app_data)
+
+    def execute(self) -> str:
+        """
+        Executes the command to plan and create a new route.
+
+        Returns:
+            str: A formatted string containing the details of the planned route.
+
+        Notes:
+            - The `hubs` parameter should be a string of hubs separated by commas.
+            - The `start_location` and `max_range` parameters may be left empty.
+            - The `departure_time` parameter should be a string in ISO format.
+        """
+        super().execute()
+        hubs, start_location, departure_time, max_range = self._params
+
+        hubs = [hub.strip() for hub in hubs.split(Route.LOCATIONS_SEPARATOR) if hub.strip()]
+        start_location = start_location.strip() or None
+        max_range = try_parse_int(max_range) if max_range.strip() else None
+
+        route = self._app_data.plan_route(hubs, departure_time, max_range, start_location)
+        locations = Route.LOCATIONS_SEPARATOR.join(route.locations)
+
+        self.logger.info(f"Route with ID {route.id} was planned!"
+                         f"\nLocations: {route.locations}"
+                         f"\nDeparture Time: {route.departure_time.isoformat(sep=" ", timespec="minutes")} "
+                         f"| Executed by: {self.app_data.logged_in_employee}" + BaseCommand.ROW_SEP)
+
+        return (f"Route with ID {route.id} was planned!"
+                f"\n{BaseCommand.TABLE_SEP}"
+                f"\nLocations:      | {locations}"
+                f"\n{BaseCommand.TABLE_SEP}"
+                f"\nDistance:       | {route.distance} km"
+                f"\n{BaseCommand.TABLE_SEP}"
+                f"\nDeparture Time: | {route.departure_time.isoformat(sep=" ", timespec="minutes")}"
+                f"\n{BaseCommand.TABLE_SEP}"
+                f"\nArrival Time:   | {route.estimated_arrival_time.isoformat(sep=" ", timespec="minutes")}"
+                f"\n{BaseCommand.TABLE_SEP}")
+
+    def _requires_login(self) -> bool:
+        return True
+
+    def _expected_params_count(self) -> int:
+        return 4
@@ -10,7 +10,8 @@ class SearchRouteCommand(BaseCommand):
     Command to search for suitable routes for a specific package.
 
     This command validates the input parameters, searches for routes that can accommodate the package,
-    and returns a formatted list of suitable routes.
+    and returns a formatted list of suitable routes. Only routes that visit the package's start location
+    before its end location are considered; status and capacity filters are applied to those candidates.
     """
     def __init__(self, params, app_data: ApplicationData):
         super().__init__(params, app_data)
@@ -23,32 +24,27 @@ class SearchRouteCommand(BaseCommand):
         package = self._app_data.find_package_by_id(package_id)
         if not package:
             raise ApplicationError("No Package found!")
-        for route in self._app_data.routes:
-
-            sufficient_capacity = True
+        for route in self._app_data.get_routes_by_locations(package.start_location, package.end_location):
             if route.assigned_truck_id:
                 truck = self._app_data.find_truck_by_id(route.assigned_truck_id)
                 if not truck:
                     raise ApplicationError("No Truck found!" + BaseCommand.ROW_SEP)
                 free_capacity = truck.capacity - route.load
                 if free_capacity < package.weight:
-                    sufficient_capacity = False
-
-            if route.status == Route.STATUS_CREATED and sufficient_capacity:
-                locations = route.locations
-                if package.start_location in locations and package.end_location in locations:
-                    if locations.index(package.start_location) < locations.index(package.end_location):
-                        route_details = (f"ROUTE ID:       | {route.id}"
-                                         f"\n{BaseCommand.TABLE_SEP}"
-                                         f"\nHubs:           |"
-                                         f" {"\n                | ".join(f"{key}: "
-                                         f"{value.isoformat(sep=" ", timespec="minutes")}" 
-                                            for key, value in route.stops.items())}"
-                                         f"\n{BaseCommand.TABLE_SEP}"
-                                         f"\nDeparture time: | "
-                                         f"{route.departure_time.isoformat(sep=" ", timespec="minutes")}"
-                                         f"\n{BaseCommand.ROW_SEP}")
-                        suitable_routes.append(route_details)
+                    continue
+
+            if route.status == Route.STATUS_CREATED:
+                route_details = (f"ROUTE ID:       | {route.id}"
+                                 f"\n{BaseCommand.TABLE_SEP}"
+                                 f"\nHubs:           |"
+                                 f" {"\n                | ".join(f"{key}: "
+                                 f"{value.isoformat(sep=" ", timespec="minutes")}"
+                                    for key, value in route.stops.items())}"
+                                 f"\n{BaseCommand.TABLE_SEP}"
+                                 f"\nDeparture time: | "
+                                 f"{route.departure_time.isoformat(sep=" ", timespec="minutes")}"
+                                 f"\n{BaseCommand.ROW_SEP}")
+                suitable_routes.append(route_details)
 
         return (f"SUITABLE ROUTES:\n{BaseCommand.ROW_SEP}\n{BaseCommand.TABLE_SEP}\n"
                 +"\n".join(suitable_routes))
@@ -1,12 +1,26 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from operator import attrgetter
 from core.application_time import ApplicationTime
+from core.journal import Journal
+from core.read_only_view import ReadOnlyView
+from core.route_planner import RoutePlanner
+from core.segmented_store import SegmentedStore
+from core.sqlite_store import SqliteStore
 from errors.application_error import ApplicationError
 from models.employee import Employee
 from models.constants.employee_role import EmployeeRole
 from models.package import Package
 from models.route import Route
+from models.tracked_entity import TrackedEntity
 from models.truck import Truck
 
 
+_departure_time = attrgetter("departure_time")
+_estimated_arrival_time = attrgetter("estimated_arrival_time")
+_sections = {Truck: "trucks", Route: "routes", Package: "packages", Employee: "employees"}
+
+
 class ApplicationData:
     """
     Central class for managing application data, including trucks, routes, packages, and employees.
@@ -15,21 +29,56 @@ class ApplicationData:
     It also handles operations like assigning trucks to routes, assigning packages to routes, and managing employee login/logout.
 
     Attributes:
-        _trucks (list[Truck]): A list of all trucks in the application.
-        _routes (list[Route]): A list of all routes in the application.
-        _packages (list[Package]): A list of all packages in the application.
-        _employees (list[Employee]): A list of all employees in the application.
+        _trucks (dict[int, Truck]): All trucks in the application, keyed by truck ID.
+        _routes (dict[int, Route]): All routes in the application, keyed by route ID.
+        _packages (dict[int, Package]): All packages in the application, keyed by package ID.
+        _employees (dict[str, Employee]): All employees in the application, keyed by username.
+        _routes_by_locations (dict[tuple[str, str], list[Route]]): Routes indexed by every ordered
+                                                                    (start, end) pair of hubs they visit.
+        _free_trucks (dict[tuple[str, int, int], dict[int, Truck]]): Free trucks grouped by
+                                                                      (model, capacity, max range).
+        _truck_specs (list[tuple[int, int, str]]): Every known (capacity, max range, model) group,
+                                                   sorted by capacity and max range.
+        _assigned_packages (dict[int, Package]): Packages assigned to a route, keyed by package ID.
+        _unassigned_packages (dict[int, Package]): Packages not assigned to any route, keyed by package ID.
+        _routes_by_departure (list[Route]): Routes sorted by departure time.
+        _routes_by_arrival (list[Route]): Routes sorted by estimated arrival time at the final stop.
+        _are_time_indexes_sorted (bool): Whether the time indexes are sorted. Restored routes are
+                                         appended and the indexes are sorted once, when next used.
         _logged_in_employee (Employee): The currently logged-in employee.
+        _journal (Journal): The journal that records every change, if the state is persisted.
+        _changed_entities (dict[TrackedEntity, None]): Entities changed since the state was last saved,
+                                                       used as an insertion-ordered set.
+        _unjournaled_entities (dict[TrackedEntity, None]): Entities changed since the journal last
+                                                           recorded them, used as an insertion-ordered set.
+        _storage (SqliteStore | SegmentedStore): The store packages are read from on demand, if any.
+        _loaded_package_partitions (set[bool]): The assignment statuses whose packages are all in memory.
     """
     def __init__(self):
         """
-        Initializes the ApplicationData with empty lists for trucks, routes, packages, and employees.
-        """
-        self._trucks: list[Truck] = []
-        self._routes: list[Route] = []
-        self._packages: list[Package] = []
-        self._employees: list[Employee] = []
+        Initializes the ApplicationData with empty registries for trucks, routes, packages, and employees.
+
+        Trucks, routes and packages are stored in insertion-ordered dictionaries keyed by ID,
+        so lookups by ID do not need to scan the whole collection. Employees are keyed by username.
+        """
+        self._trucks: dict[int, Truck] = {}
+        self._routes: dict[int, Route] = {}
+        self._packages: dict[int, Package] = {}
+        self._employees: dict[str, Employee] = {}
+        self._routes_by_locations: dict[tuple[str, str], list[Route]] = {}
+        self._free_trucks: dict[tuple[str, int, int], dict[int, Truck]] = {}
+        self._truck_specs: list[tuple[int, int, str]] = []
+        self._assigned_packages: dict[int, Package] = {}
+        self._unassigned_packages: dict[int, Package] = {}
+        self._routes_by_departure: list[Route] = []
+        self._routes_by_arrival: list[Route] = []
+        self._are_time_indexes_sorted = True
         self._logged_in_employee = None
+        self._journal = None
+        self._changed_entities: dict[TrackedEntity, None] = {}
+        self._unjournaled_entities: dict[TrackedEntity, None] = {}
+        self._storage = None
+        self._loaded_package_partitions = {False, True}
 
     @classmethod
     def from_json(cls, data):
@@ -43,13 +92,65 @@ class ApplicationData:
             ApplicationData: An instance of ApplicationData populated with the provided data.
         """
         app_data = cls()
-        app_data._packages = [Package.from_json(package_data) for package_data in data["packages"]]
-        app_data._employees = [Employee.from_json(employees_data) for employees_data in data["employees"]]
-        app_data._trucks = [Truck.from_json(trucks_data) for trucks_data in data["trucks"]]
-        app_data._routes = [Route.from_json(routes_data) for routes_data in data["routes"]]
+        for section in ("packages", "employees", "trucks", "routes"):
+            for entity_data in data[section]:
+                app_data.add_from_json(section, entity_data)
+
+        return app_data
+
+    @classmethod
+    def from_storage(cls, storage: SqliteStore | SegmentedStore):
+        """
+        Creates an ApplicationData instance that reads through to a database or a segmented store.
+
+        Trucks, routes and employees are few and indexed as they are registered, so they are loaded
+        straight away. Packages are built only when they are needed: a single package when it is
+        looked up by ID, and a whole assignment partition when packages are listed by status.
+        ID counters are moved past the stored IDs, so new entities never reuse the ID of a package
+        that has not been loaded.
+
+        Args:
+            storage (SqliteStore | SegmentedStore): The store to read from.
+
+        Returns:
+            ApplicationData: An instance of ApplicationData backed by the store.
+        """
+        app_data = cls()
+        app_data._storage = storage
+        app_data._loaded_package_partitions = set()
+        for section in ("employees", "trucks", "routes"):
+            for entity_data in storage.iter_section(section):
+                app_data.add_from_json(section, entity_data)
+
+        Truck.ensure_id_above(storage.max_id("trucks"))
+        Route.ensure_id_above(storage.max_id("routes"))
+        Package.ensure_id_above(storage.max_id("packages"))
 
         return app_data
 
+    def add_from_json(self, section: str, data: dict) -> None:
+        """
+        Creates an entity from its saved JSON-compatible dictionary and registers it.
+
+        This lets a loader add entities one at a time while it reads them, instead of
+        building the whole state as a dictionary first. The saved state is trusted, so the
+        entity is restored without running its validation again.
+
+        Args:
+            section (str): The section the entity belongs to: "trucks", "routes", "packages" or "employees".
+            data (dict): The JSON representation of the entity.
+        """
+        if section == "packages":
+            self._add_package(Package.restore(data))
+        elif section == "routes":
+            self._add_route(Route.restore(data), is_restored=True)
+        elif section == "trucks":
+            self._add_truck(Truck.restore(data))
+        elif section == "employees":
+            self._add_employee(Employee.restore(data))
+        else:
+            raise ApplicationError(f"Unknown section {section}")
+
     def to_json(self):
         """
         Converts the ApplicationData instance into a JSON-compatible dictionary.
@@ -57,51 +158,143 @@ class ApplicationData:
         Returns:
             dict: A dictionary containing data for trucks, routes, packages, and employees.
         """
+        self._load_packages()
         return {
-            "trucks": [truck.to_json() for truck in self._trucks],
-            "routes": [route.to_json() for route in self._routes],
-            "packages": [package.to_json() for package in self._packages],
-            "employees": [employee.to_json() for employee in self._employees]}
+            "trucks": [truck.to_json() for truck in self._trucks.values()],
+            "routes": [route.to_json() for route in self._routes.values()],
+            "packages": [package.to_json() for package in self._packages.values()],
+            "employees": [employee.to_json() for employee in self._employees.values()]}
 
     @property
-    def trucks(self) -> tuple:
+    def storage(self) -> SqliteStore | SegmentedStore:
         """
-        Gets all trucks in the application as an immutable tuple.
+        Gets the store the application data reads packages through from.
 
         Returns:
-            tuple[Truck]: A tuple of all trucks.
+            SqliteStore | SegmentedStore: The store, or `None` if all data is held in memory.
         """
-        return tuple(self._trucks)
+        return self._storage
+
+    def _load_packages(self, is_assigned: bool = None) -> None:
+        """
+        Loads the packages of the given assignment status from the store, if they are not in memory yet.
+
+        Packages that are already in memory are kept, since they may have changes that are not
+        written to the store yet.
+
+        Args:
+            is_assigned (bool): The status of the packages to load. Defaults to all packages.
+        """
+        for partition in (False, True) if is_assigned is None else (is_assigned,):
+            if partition in self._loaded_package_partitions:
+                continue
+            for package_data in self._storage.find_packages(partition):
+                if package_data["id"] not in self._packages:
+                    self._add_package(Package.restore(package_data))
+            self._loaded_package_partitions.add(partition)
 
     @property
-    def routes(self) -> tuple:
+    def journal(self) -> Journal:
         """
-        Gets all routes in the application as an immutable tuple.
+        Gets the journal that records every change to the application's entities.
 
         Returns:
-            tuple[Route]: A tuple of all routes.
+            Journal: The attached journal, or `None` if changes are not recorded.
+        """
+        return self._journal
+
+    @journal.setter
+    def journal(self, value: Journal) -> None:
+        self._journal = value
+
+    def _record(self, *entities) -> None:
+        """
+        Marks the given entities as changed and, if a journal is attached, as not recorded in it yet.
+
+        Args:
+            *entities (Truck | Route | Package | Employee): The entities that were changed.
+        """
+        for entity in entities:
+            self._changed_entities[entity] = None
+        if self._journal is not None:
+            for entity in entities:
+                self._unjournaled_entities[entity] = None
+
+    def record_changes_to_journal(self) -> None:
+        """
+        Records the new state of the entities changed since the last call in the journal.
+
+        Each entity is serialized once, however many times it was changed, so a command that
+        assigns many packages to one route records the route only once.
+        """
+        if self._journal is not None:
+            for entity in self._unjournaled_entities:
+                self._journal.record(_sections[type(entity)], entity.to_json())
+        self._unjournaled_entities.clear()
+
+    def _mark_changed(self, entity: TrackedEntity) -> None:
+        self._changed_entities[entity] = None
+
+    def changes_to_json(self) -> dict:
+        """
+        Converts the entities changed since the state was last saved into a JSON-compatible dictionary.
+
+        Returns:
+            dict: A dictionary containing the changed trucks, routes, packages, and employees.
+        """
+        changes = {section: [] for section in _sections.values()}
+        for entity in self._changed_entities:
+            changes[_sections[type(entity)]].append(entity.to_json())
+
+        return changes
+
+    def clear_changes(self) -> None:
+        """
+        Forgets the changed entities, once the state containing them has been saved.
         """
-        return tuple(self._routes)
+        self._changed_entities.clear()
+        self._unjournaled_entities.clear()
 
     @property
-    def packages(self) -> tuple:
+    def trucks(self) -> ReadOnlyView:
         """
-        Gets all packages in the application as an immutable tuple.
+        Gets all trucks in the application as a live, read-only view.
 
         Returns:
-            tuple[Package]: A tuple of all packages.
+            ReadOnlyView[Truck]: A view of all trucks.
         """
-        return tuple(self._packages)
+        return ReadOnlyView(self._trucks.values())
 
     @property
-    def employees(self) -> tuple:
+    def routes(self) -> ReadOnlyView:
         """
-        Gets all employees in the application as an immutable tuple.
+        Gets all routes in the application as a live, read-only view.
 
         Returns:
-            tuple[Employee]: A tuple of all employees.
+            ReadOnlyView[Route]: A view of all routes.
         """
-        return tuple(self._employees)
+        return ReadOnlyView(self._routes.values())
+
+    @property
+    def packages(self) -> ReadOnlyView:
+        """
+        Gets all packages in the application as a live, read-only view.
+
+        Returns:
+            ReadOnlyView[Package]: A view of all packages.
+        """
+        self._load_packages()
+        return ReadOnlyView(self._packages.values())
+
+    @property
+    def employees(self) -> ReadOnlyView:
+        """
+        Gets all employees in the application as a live, read-only view.
+
+        Returns:
+            ReadOnlyView[Employee]: A view of all employees.
+        """
+        return ReadOnlyView(self._employees.values())
 
     @property
     def logged_in_employee(self) -> Employee:
@@ -149,7 +342,8 @@ class ApplicationData:
             Truck: The newly created truck.
         """
         truck = Truck(name, capacity, max_range)
-        self._trucks.append(truck)
+        self._add_truck(truck)
+        self._record(truck)
 
     def create_route(self, locations: str, departure_time: str) -> Route:
         """
@@ -163,10 +357,39 @@ class ApplicationData:
             Route: The newly created route.
         """
         route = Route(locations, departure_time)
-        self._routes.append(route)
+        self._add_route(route)
+        self._record(route)
 
         return route
 
+    def plan_route(self, hubs: list[str], departure_time: str, max_range: int = None,
+                   start_location: str = None) -> Route:
+        """
+        Creates a new route that visits the given hubs in the shortest order found by the RoutePlanner.
+
+        Args:
+            hubs (list[str]): The hubs the route has to visit, in any order.
+            departure_time (str): The departure time in ISO format.
+            max_range (int): The range of the truck in kilometers, if the route has to fit in it.
+            start_location (str): The hub the route has to start from, if any.
+
+        Returns:
+            Route: The newly created route.
+
+        Raises:
+            ApplicationError: If the hubs or the departure time are invalid, or the route is longer
+                              than `max_range`.
+        """
+        try:
+            departure = datetime.fromisoformat(departure_time)
+        except ValueError:
+            raise ApplicationError(f"Departure time {departure_time} "
+                                   f"does not match the format {Route.REQUIRED_DATE_FORMAT}")
+
+        plan = RoutePlanner.plan(hubs, departure, max_range, start_location)
+
+        return self.create_route(Route.LOCATIONS_SEPARATOR.join(plan.locations), departure_time)
+
     def create_package(self, start_location: str, end_location: str, weight: float, customer_email: str) -> Package:
         """
         Creates a new package and adds it to the application's package list.
@@ -181,7 +404,8 @@ class ApplicationData:
             Package: The newly created package.
         """
         package = Package(start_location, end_location, weight, customer_email)
-        self._packages.append(package)
+        self._add_package(package)
+        self._record(package)
 
         return package
 
@@ -203,13 +427,96 @@ class ApplicationData:
         Raises:
             ApplicationError: If an employee with the same username already exists.
         """
-        if len([employee for employee in self._employees if employee.username == username]) > 0:
+        if username in self._employees:
             raise ApplicationError(f"Employee {username} already exist. Choose a different username!")
         employee = Employee(username, first_name, last_name, password, employee_role)
-        self._employees.append(employee)
+        self._add_employee(employee)
+        self._record(employee)
 
         return employee
 
+    def _add_truck(self, truck: Truck) -> None:
+        """
+        Registers a truck in the application's truck registry and availability index.
+
+        Args:
+            truck (Truck): The truck to register.
+        """
+        self._trucks[truck.id] = truck
+        truck.track_changes(self._mark_changed)
+
+        group = (truck.name, truck.capacity, truck.max_range)
+        if group not in self._free_trucks:
+            self._free_trucks[group] = {}
+            insort(self._truck_specs, (truck.capacity, truck.max_range, truck.name))
+        if not truck.assigned_route_id:
+            self._free_trucks[group][truck.id] = truck
+
+    def _add_route(self, route: Route, is_restored: bool = False) -> None:
+        """
+        Registers a route in the application's route registry, location index and time indexes.
+
+        A route is indexed under every (start, end) pair of hubs where the first visit
+        to `start` comes before the first visit to `end`.
+
+        A new route is inserted into the sorted time indexes. Restored routes are appended instead
+        and the indexes are sorted once, when they are next used, so loading many routes does not
+        shift the indexes for every route.
+
+        Args:
+            route (Route): The route to register.
+            is_restored (bool): Whether the route is restored from the saved state.
+        """
+        self._routes[route.id] = route
+        route.track_changes(self._mark_changed)
+
+        hubs = list(dict.fromkeys(route.locations))
+        for i, start_location in enumerate(hubs):
+            for end_location in hubs[i + 1:]:
+                self._routes_by_locations.setdefault((start_location, end_location), []).append(route)
+
+        if is_restored:
+            self._routes_by_departure.append(route)
+            self._routes_by_arrival.append(route)
+            self._are_time_indexes_sorted = False
+        else:
+            self._sort_time_indexes()
+            insort(self._routes_by_departure, route, key=_departure_time)
+            insort(self._routes_by_arrival, route, key=_estimated_arrival_time)
+
+    def _sort_time_indexes(self) -> None:
+        """
+        Sorts the time indexes after routes were restored.
+        """
+        if not self._are_time_indexes_sorted:
+            self._routes_by_departure.sort(key=_departure_time)
+            self._routes_by_arrival.sort(key=_estimated_arrival_time)
+            self._are_time_indexes_sorted = True
+
+    def _add_package(self, package: Package) -> None:
+        """
+        Registers a package in the application's package registry and assignment partition.
+
+        Args:
+            package (Package): The package to register.
+        """
+        self._packages[package.id] = package
+        package.track_changes(self._mark_changed)
+        if package.is_assigned:
+            self._assigned_packages[package.id] = package
+        else:
+            self._unassigned_packages[package.id] = package
+
+    def _add_employee(self, employee: Employee) -> None:
+        """
+        Registers an employee in the application's employee registry.
+
+        Args:
+            employee (Employee): The employee to register.
+        """
+        self._employees[employee.username] = employee
+        employee.track_changes(self._mark_changed)
+
     def assign_truck_to_route(self, truck_id: int, route_id: int) -> None:
         """
         Assigns a truck to a route.
@@ -242,6 +549,8 @@ class ApplicationData:
         truck.assigned_route_id = route.id
         route.assigned_truck_id = truck.id
         route.assigned_truck_capacity = truck.capacity
+        del self._free_trucks[(truck.name, truck.capacity, truck.max_range)][truck.id]
+        self._record(truck, route)
 
     def unassign_truck_from_route(self, truck_id: int) -> None:
         """
@@ -258,6 +567,8 @@ class ApplicationData:
         truck.assigned_route_id = None
         route.assigned_truck_id = None
         route.assigned_truck_capacity = None
+        self._free_trucks[(truck.name, truck.capacity, truck.max_range)][truck.id] = truck
+        self._record(truck, route)
 
     def assign_package_to_route(self, package_id: int, route_id: int) -> None:
         """
@@ -270,47 +581,103 @@ class ApplicationData:
         Raises:
             ApplicationError: If the package or route does not exist, or if the package is already assigned.
         """
-        package = self.find_package_by_id(package_id)
-        if package is None:
-            raise ApplicationError(f"Package with ID {package_id} does not exist")
-        route = self.find_route_by_id(route_id)
-        if route is None:
-            raise ApplicationError(f"Route with ID {route_id} does not exist")
+        package, route = self._validate_package_assignment(package_id, route_id)
+        self._apply_package_assignment(package, route)
 
-        if package.route_id == route_id or package_id in route.assigned_packages_ids:
-            raise ApplicationError(f"Package with ID {package_id} is already assigned to Route with ID {route_id}")
-        if package.is_assigned:
-            raise ApplicationError(f"Package with ID {package_id} is already assigned")
+    def assign_packages_to_routes(self, assignments: dict[int, int]) -> None:
+        """
+        Assigns several packages to routes as a single operation.
 
-        if route.assigned_truck_id:
-            truck = self.find_truck_by_id(route.assigned_truck_id)
+        Every assignment is validated before any of them is applied, taking into account the load
+        added by the earlier assignments in the same batch. If one of them is invalid, no package
+        is assigned.
 
-            free_capacity = truck.capacity - route.load
-            if free_capacity < package.weight:
-                raise ApplicationError(f"Route with ID {route_id} has no more capacity")
-            if route.departure_time < ApplicationTime.current():
-                raise ApplicationError(f"Assigned Truck to Route with ID {route_id} has already departed")
-        if ((package.start_location not in route.locations) or (package.end_location not in route.locations)
-            or (route.locations.index(package.start_location) > route.locations.index(package.end_location))):
-            raise ApplicationError(f"Route with ID {route_id} is not suitable for Package with ID {package_id}")
+        Args:
+            assignments (dict[int, int]): The route ID to assign each package ID to.
 
-        package.departure_time = route.departure_time
-        package.estimated_arrival_time = route.stops[package.end_location]
-        package.route_id = route.id
-        package.is_assigned = True
-        route.assign_package(package.id)
-        route.load += package.weight
+        Raises:
+            ApplicationError: If any of the assignments is not valid.
+        """
+        planned_loads = {}
+        validated_assignments = []
+        for package_id, route_id in assignments.items():
+            package, route = self._validate_package_assignment(package_id, route_id, planned_loads.get(route_id, 0))
+            planned_loads[route_id] = planned_loads.get(route_id, 0) + package.weight
+            validated_assignments.append((package, route))
 
-    def assign_package_to_route(self, package_id: int, route_id: int) -> None:
+        for package, route in validated_assignments:
+            self._apply_package_assignment(package, route)
+
+    def plan_package_assignments(self, package_ids: list[int] = None) -> dict[int, int]:
         """
-        Assigns a package to a route.
+        Plans which route each package should be assigned to, without assigning anything.
+
+        Packages are placed with the first-fit-decreasing heuristic: the heaviest packages are
+        placed first, each into the earliest departing open route that visits the package's start
+        location before its end location and still has enough free capacity. Only routes that have
+        not departed yet and have a truck assigned are considered, since the truck determines the
+        route's capacity.
+
+        Args:
+            package_ids (list[int]): The IDs of the packages to place. Defaults to all unassigned packages.
+
+        Returns:
+            dict[int, int]: The route ID planned for each package that fits. Packages that do not fit
+                            into any route are left out.
+
+        Raises:
+            ApplicationError: If a package does not exist or is already assigned.
+        """
+        if package_ids is None:
+            self._load_packages(False)
+            packages = list(self._unassigned_packages.values())
+        else:
+            packages = []
+            for package_id in dict.fromkeys(package_ids):
+                package = self.find_package_by_id(package_id)
+                if package is None:
+                    raise ApplicationError(f"Package with ID {package_id} does not exist")
+                if package.is_assigned:
+                    raise ApplicationError(f"Package with ID {package_id} is already assigned")
+                packages.append(package)
+
+        free_capacities = {}
+        for route in self.get_routes_by_status(Route.STATUS_CREATED):
+            if route.assigned_truck_id:
+                free_capacities[route.id] = self.find_truck_by_id(route.assigned_truck_id).capacity - route.load
+
+        candidate_routes = {}
+        assignments = {}
+        for package in sorted(packages, key=attrgetter("weight"), reverse=True):
+            locations = (package.start_location, package.end_location)
+            if locations not in candidate_routes:
+                candidate_routes[locations] = sorted((route for route in self.get_routes_by_locations(*locations)
+                                                      if route.id in free_capacities), key=_departure_time)
+
+            for route in candidate_routes[locations]:
+                if free_capacities[route.id] >= package.weight:
+                    free_capacities[route.id] -= package.weight
+                    assignments[package.id] = route.id
+                    break
+
+        return assignments
+
+    def _validate_package_assignment(self, package_id: int, route_id: int,
+                                     planned_load: float = 0) -> tuple[Package, Route]:
+        """
+        Checks whether a package can be assigned to a route.
 
         Args:
             package_id (int): The ID of the package to assign.
             route_id (int): The ID of the route to assign the package to.
+            planned_load (float): Weight already planned for the route but not assigned yet.
+
+        Returns:
+            tuple[Package, Route]: The package and the route.
 
         Raises:
-            ApplicationError: If the package or route does not exist, or if the package is already assigned.
+            ApplicationError: If the package or route does not exist, if the package is already assigned,
+                              or if the route cannot take the package.
         """
         package = self.find_package_by_id(package_id)
         if package is None:
@@ -319,7 +686,7 @@ class ApplicationData:
         if route is None:
             raise ApplicationError(f"Route with ID {route_id} does not exist")
 
-        if package.route_id == route_id or package_id in route.assigned_packages_ids:
+        if package.route_id == route_id or route.has_package(package_id):
             raise ApplicationError(f"Package with ID {package_id} is already assigned to Route with ID {route_id}")
         if package.is_assigned:
             raise ApplicationError(f"Package with ID {package_id} is already assigned")
@@ -327,7 +694,7 @@ class ApplicationData:
         if route.assigned_truck_id:
             truck = self.find_truck_by_id(route.assigned_truck_id)
 
-            free_capacity = truck.capacity - route.load
+            free_capacity = truck.capacity - route.load - planned_load
             if free_capacity < package.weight:
                 raise ApplicationError(f"Route with ID {route_id} has no more capacity")
             if route.departure_time < ApplicationTime.current():
@@ -336,12 +703,25 @@ class ApplicationData:
             or (route.locations.index(package.start_location) > route.locations.index(package.end_location))):
             raise ApplicationError(f"Route with ID {route_id} is not suitable for Package with ID {package_id}")
 
+        return package, route
+
+    def _apply_package_assignment(self, package: Package, route: Route) -> None:
+        """
+        Assigns a validated package to a route and updates the package partitions.
+
+        Args:
+            package (Package): The package to assign.
+            route (Route): The route to assign the package to.
+        """
         package.departure_time = route.departure_time
         package.estimated_arrival_time = route.stops[package.end_location]
         package.route_id = route.id
         package.is_assigned = True
         route.assign_package(package.id)
         route.load += package.weight
+        del self._unassigned_packages[package.id]
+        self._assigned_packages[package.id] = package
+        self._record(package, route)
 
     def unassign_package_from_route(self, package_id: int) -> None:
         """
@@ -371,11 +751,17 @@ class ApplicationData:
         package.is_assigned = False
         route.remove_package(package.id)
         route.load -= package.weight
+        del self._assigned_packages[package.id]
+        self._unassigned_packages[package.id] = package
+        self._record(package, route)
 
     def get_packages_by_assigned_status(self, is_assigned: bool) -> list:
         """
         Returns a list of packages based on their assigned status.
 
+        Packages are kept in assigned and unassigned partitions that are updated on every
+        assignment, so the result is built only from the requested partition.
+
         Args:
             is_assigned (bool): The status to filter packages by.
                                 If True, returns packages that are assigned.
@@ -384,11 +770,21 @@ class ApplicationData:
         Returns:
             list: A list of packages that match the specified assigned status.
         """
-        return [package for package in self._packages if package.is_assigned == is_assigned]
+        self._load_packages(bool(is_assigned))
+        if is_assigned:
+            return list(self._assigned_packages.values())
+        return list(self._unassigned_packages.values())
 
     def get_routes_by_status(self, status: str) -> list:
         """
-        Returns a list of routes based on their status.
+        Returns a list of routes based on their status at the current application time.
+
+        The routes are kept sorted by departure time and by estimated arrival time, so the
+        status is resolved with binary searches instead of evaluating every route:
+          - Created routes depart after the current time (ordered by departure time).
+          - Finished routes arrived before the current time (ordered by arrival time).
+          - Routes in progress are the ones not finished yet that have already departed
+            (ordered by arrival time).
 
         Args:
             status (str): The status to filter routes by.
@@ -396,7 +792,156 @@ class ApplicationData:
         Returns:
             list: A list of routes that match the specified status.
         """
-        return [route for route in self._routes if route.status == status]
+        current_time = ApplicationTime.current()
+        self._sort_time_indexes()
+
+        if status == Route.STATUS_CREATED:
+            return self._routes_by_departure[bisect_right(self._routes_by_departure, current_time,
+                                                          key=_departure_time):]
+
+        finished_count = bisect_left(self._routes_by_arrival, current_time, key=_estimated_arrival_time)
+        if status == Route.STATUS_FINISHED:
+            return self._routes_by_arrival[:finished_count]
+        if status == Route.STATUS_IN_PROGRESS:
+            return [route for route in self._routes_by_arrival[finished_count:]
+                    if route.departure_time <= current_time]
+
+        return []
+
+    def get_routes_by_locations(self, start_location: str, end_location: str) -> ReadOnlyView:
+        """
+        Returns the routes that visit `start_location` before `end_location`.
+
+        Args:
+            start_location (str): The hub the route must visit first.
+            end_location (str): The hub the route must visit afterwards.
+
+        Returns:
+            ReadOnlyView[Route]: The matching routes in the order they were created.
+        """
+        return ReadOnlyView(self._routes_by_locations.get((start_location, end_location), ()))
+
+    def find_free_trucks(self, load: float, distance: int) -> dict:
+        """
+        Finds the free trucks that can carry the given load over the given distance.
+
+        Free trucks are grouped by model, capacity and max range, and the groups are kept sorted
+        by capacity, so only groups with enough capacity are visited.
+
+        Args:
+            load (float): The minimum capacity the truck must have, in kilograms.
+            distance (int): The minimum range the truck must have, in kilometers.
+
+        Returns:
+            dict[tuple[str, int, int], list[Truck]]: The suitable free trucks keyed by
+                                                     (model, capacity, max range), smallest capacity first.
+        """
+        suitable_trucks = {}
+        for capacity, max_range, name in self._truck_specs[bisect_left(self._truck_specs, (load,)):]:
+            trucks = self._free_trucks[(name, capacity, max_range)]
+            if max_range >= distance and trucks:
+                suitable_trucks[(name, capacity, max_range)] = list(trucks.values())
+
+        return suitable_trucks
+
+    def dispatch_trucks(self) -> dict[int, int]:
+        """
+        Assigns free trucks to every route that has not departed yet and has no truck.
+
+        Routes are matched to groups of identical free trucks, so that as many routes as possible
+        get a truck that can carry their load over their distance. Routes are served from the
+        heaviest and longest to the lightest and shortest, and each one takes the group with the
+        smallest capacity (then the smallest max range) that still has a free truck. When no
+        suitable group has one left, routes that were already matched are moved to other suitable
+        groups to make room, if that is possible. Routes that cannot be matched remain without a truck.
+
+        Returns:
+            dict[int, int]: The truck ID assigned to each route ID.
+        """
+        unassigned_routes = [route for route in self.get_routes_by_status(Route.STATUS_CREATED)
+                             if not route.assigned_truck_id]
+        unassigned_routes.sort(key=lambda route: (-route.load, -route.distance, route.departure_time))
+
+        groups = [(name, capacity, max_range) for capacity, max_range, name in self._truck_specs
+                  if self._free_trucks[(name, capacity, max_range)]]
+        matched_groups = self._match_routes_to_truck_groups(unassigned_routes, groups)
+
+        dispatched_trucks = {}
+        for route in unassigned_routes:
+            if route in matched_groups:
+                truck = next(iter(self._free_trucks[groups[matched_groups[route]]].values()))
+                self.assign_truck_to_route(truck.id, route.id)
+                dispatched_trucks[route.id] = truck.id
+
+        return dispatched_trucks
+
+    def _match_routes_to_truck_groups(self, routes: list[Route], groups: list[tuple[str, int, int]]) -> dict:
+        """
+        Finds a maximum matching of routes to free trucks, where every group of identical trucks
+        can take as many routes as it has free trucks.
+
+        Every route is added by searching for an augmenting path over the groups: a chain of matched
+        routes that can each move to the next suitable group, ending with a group that has a free
+        truck. Since the number of groups is small, the routes that can move from one group to another
+        are kept in a table indexed by both groups, so a search does not visit individual routes.
+
+        Args:
+            routes (list[Route]): The routes to match, in the order they are served.
+            groups (list[tuple[str, int, int]]): The (model, capacity, max range) groups that have free
+                                                 trucks, in the order they are preferred.
+
+        Returns:
+            dict[Route, int]: The index of the group matched to each route that could be matched.
+        """
+        free_counts = [len(self._free_trucks[group]) for group in groups]
+        suitable_groups: dict[Route, list[int]] = {}
+        matched_groups: dict[Route, int] = {}
+        # movable[i][j] holds the routes matched to group i that group j can also serve.
+        movable = [[{} for _ in groups] for _ in groups]
+
+        def match(route: Route, group: int) -> None:
+            matched_groups[route] = group
+            for other_group in suitable_groups[route]:
+                if other_group != group:
+                    movable[group][other_group][route] = None
+
+        def unmatch(route: Route) -> None:
+            group = matched_groups.pop(route)
+            for other_group in suitable_groups[route]:
+                if other_group != group:
+                    del movable[group][other_group][route]
+
+        for route in routes:
+            load, distance = route.load, route.distance
+            suitable_groups[route] = [i for i, (_, capacity, max_range) in enumerate(groups)
+                                      if capacity >= load and max_range >= distance]
+
+            # Breadth-first search, so a suitable group with a free truck is always taken directly.
+            previous_groups = dict.fromkeys(suitable_groups[route])
+            queue = list(previous_groups)
+            end_group = None
+            for group in queue:
+                if free_counts[group]:
+                    end_group = group
+                    break
+                for other_group, movable_routes in enumerate(movable[group]):
+                    if movable_routes and other_group not in previous_groups:
+                        previous_groups[other_group] = group
+                        queue.append(other_group)
+            if end_group is None:
+                continue
+
+            free_counts[end_group] -= 1
+            group = end_group
+            while previous_groups[group] is not None:
+                previous_group = previous_groups[group]
+                moved_route = next(iter(movable[previous_group][group]))
+                unmatch(moved_route)
+                match(moved_route, group)
+                group = previous_group
+            match(route, group)
+
+        return matched_groups
 
     def find_truck_by_id(self, truck_id: int) -> Truck:
         """
@@ -408,7 +953,7 @@ class ApplicationData:
         Returns:
             Truck: The truck with the specified ID, or `None` if no truck is found.
         """
-        return next((truck for truck in self.trucks if truck.id == truck_id), None)
+        return self._trucks.get(truck_id)
 
     def find_route_by_id(self, route_id: int) -> Route:
         """
@@ -420,11 +965,11 @@ class ApplicationData:
         Returns:
             Route: The route with the specified ID, or `None` if no route is found.
         """
-        return next((route for route in self.routes if route.id == route_id), None)
+        return self._routes.get(route_id)
 
     def find_package_by_id(self, package_id: int) -> Package:
         """
-        Finds a package by its ID.
+        Finds a package by its ID, reading it from the store if it is not in memory yet.
 
         Args:
             package_id (int): The ID of the package to find.
@@ -432,7 +977,13 @@ class ApplicationData:
         Returns:
             Package: The package with the specified ID, or `None` if no package is found.
         """
-        return next((package for package in self.packages if package.id == package_id), None)
+        package = self._packages.get(package_id)
+        if package is None and self._storage is not None and len(self._loaded_package_partitions) < 2:
+            package_data = self._storage.find("packages", package_id)
+            if package_data is not None:
+                package = Package.restore(package_data)
+                self._add_package(package)
+        return package
 
     def find_employee_by_username(self, username: str) -> Employee:
         """
@@ -444,7 +995,7 @@ class ApplicationData:
         Returns:
             Employee: The employee with the specified username, or `None` if no employee is found.
         """
-        return next((employee for employee in self.employees if employee.username == username), None)
+        return self._employees.get(username)
 
     def login(self, employee: Employee) -> None:
         """
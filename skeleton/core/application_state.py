@@ -1,39 +1,353 @@
 import json
+import os
+import time
 from core.application_data import ApplicationData
+from core.binary_state import BinaryState
+from core.checkpointer import Checkpointer
+from core.journal import Journal, JOURNAL_FILE_NAME
+from core.json_stream import JsonArrayStream
+from core.mapped_snapshot import MappedSnapshot
+from core.segmented_store import SegmentedStore, SECTION_KEYS
+from core.sqlite_store import SqliteStore
 
 
 FILE_NAME = "app_state.json"
+MIGRATED_FILE_NAME = "app_state.json.migrated"
+BINARY_FILE_NAME = "app_state.bin"
+SNAPSHOT_FILE_NAME = "app_state.snap"
+STORE_DIRECTORY = "app_state"
+DATABASE_FILE_NAME = "app_state.db"
+CHECKPOINT_JOURNAL_FILE_NAME = "app_state.journal.checkpoint"
+COMPACTION_THRESHOLD = 10000
+CHECKPOINT_INTERVAL = 60
 
 
 class ApplicationState:
+    """
+    Persists the application data in a segmented store plus a journal of the changes made since.
+
+    Every command appends the entities it changed to the journal, so a crash loses at most the
+    command that was running. Once the journal holds `COMPACTION_THRESHOLD` records, or
+    `CHECKPOINT_INTERVAL` seconds after the last checkpoint, a checkpoint is taken: the changed
+    entities are saved to the store on a background thread and the journal starts over.
+
+    Alternatively, the state can be kept in a SQLite database opened with `open_database`, which
+    the application data reads through to and which receives the changes of every command.
+
+    Attributes:
+        _checkpointer (Checkpointer): Writes the changed entities to the segmented store.
+        _last_checkpoint_time (float): The monotonic time the last checkpoint was taken.
+    """
+    _checkpointer = Checkpointer(SegmentedStore(STORE_DIRECTORY), CHECKPOINT_JOURNAL_FILE_NAME)
+    _last_checkpoint_time = time.monotonic()
 
     @classmethod
     def save_data(cls, app_data: ApplicationData):
         """
-        Saves the application data to a file in JSON format.
+        Saves the entities changed since the last save to the segmented store and empties the journal.
+
+        Only the segments that contain changed entities are rewritten. The first save, when there is
+        no store yet, writes all entities. A checkpoint that is being written is finished first.
+
+        The store replaces the single `app_state.json` file of earlier versions. Once the first save
+        has moved its entities into the store, the file is renamed to `app_state.json.migrated`, so it
+        is kept as a backup but never loaded again in place of the newer store.
 
         Args:
             app_data (ApplicationData): An instance of ApplicationData containing the data to be saved.
         """
-        data = app_data.to_json()
-        with open(FILE_NAME, "w") as f:
-            json.dump(data, f, indent=4)
+        cls._checkpointer.wait()
+        store = cls._checkpointer.store
+        is_first_save = not store.exists()
+        cls._checkpointer.write(app_data.to_json() if is_first_save else app_data.changes_to_json())
+        app_data.clear_changes()
+        if is_first_save and os.path.exists(FILE_NAME):
+            os.replace(FILE_NAME, MIGRATED_FILE_NAME)
+
+        if app_data.journal is not None:
+            app_data.journal.truncate()
 
     @classmethod
-    def load_data(cls):
+    def load_data(cls, progress=None, lazy: bool = False):
         """
-        Loads application data from a JSON file and returns an ApplicationData instance.
+        Loads the segmented store, replays the journal over it and returns an ApplicationData instance.
+
+        If there is no store yet, the state is loaded from a single snapshot file in the binary or the
+        JSON format, as written by `export_data` or by earlier versions. Entities are read one at a time
+        and added to the application data straight away, so the saved state is never held in memory as
+        a whole. Replayed journal records are saved to the store right away and the journal is emptied.
+        The journal of a checkpoint that was not finished is replayed first.
+
+        In lazy mode, packages are not loaded from the store at all. They stay in their segments and
+        are built the first time they are used, so startup does not depend on the number of packages.
+
+        Args:
+            progress (Callable[[int, int], None]): Called while loading with the number of bytes read
+                                                   so far and the total size of the saved state.
+            lazy (bool): Whether to read packages from the store on demand, if there is a store.
 
         Returns:
-            ApplicationData: An instance of ApplicationData populated with the loaded data.
+            ApplicationData: An instance of ApplicationData populated with the loaded data,
+                             or `None` if there is neither a saved state nor a journal.
+        """
+        cls._checkpointer.wait()
+        store = SegmentedStore(STORE_DIRECTORY)
+        if store.exists():
+            entities = store.iter_entities(progress)
+        elif os.path.exists(BINARY_FILE_NAME):
+            entities = cls._iter_snapshot(BINARY_FILE_NAME, progress)
+        elif os.path.exists(FILE_NAME):
+            entities = cls._iter_snapshot(FILE_NAME, progress)
+        else:
+            entities = ()
+
+        records = {section: {} for section in SECTION_KEYS}
+        for journal_file_name in (CHECKPOINT_JOURNAL_FILE_NAME, JOURNAL_FILE_NAME):
+            for section, entity in Journal.read(journal_file_name):
+                records[section][entity[SECTION_KEYS[section]]] = entity
+        journal_data = {section: list(section_records.values()) for section, section_records in records.items()}
+        if not entities and not any(journal_data.values()):
+            return
+
+        if lazy and store.exists():
+            if any(journal_data.values()):
+                store.write(journal_data)
+                cls._discard_journals()
+            return ApplicationData.from_storage(store)
+
+        app_data = ApplicationData()
+        for section, entity in entities:
+            app_data.add_from_json(section, records[section].pop(entity[SECTION_KEYS[section]], entity))
+        for section, section_records in records.items():
+            for entity in section_records.values():
+                app_data.add_from_json(section, entity)
+
+        if any(journal_data.values()):
+            store.write(journal_data if store.exists() else app_data.to_json())
+            cls._discard_journals()
+
+        return app_data
+
+    @staticmethod
+    def _discard_journals():
+        open(JOURNAL_FILE_NAME, "w").close()
+        if os.path.exists(CHECKPOINT_JOURNAL_FILE_NAME):
+            os.remove(CHECKPOINT_JOURNAL_FILE_NAME)
+
+    @classmethod
+    def export_data(cls, app_data: ApplicationData, file_name: str = BINARY_FILE_NAME):
+        """
+        Writes a full snapshot of the application data to a single file.
+
+        The snapshot is written to a temporary file that then replaces the target, so a crash
+        leaves either the previous snapshot or the new one.
+
+        Args:
+            app_data (ApplicationData): The application data to export.
+            file_name (str): The file to write. Files ending with `.bin` are written in the compact
+                             binary format, files ending with `.snap` as a read-only snapshot for
+                             `MappedSnapshot`, and all others in JSON.
         """
-        try:
-            with open(FILE_NAME, "r") as f:
-                data = json.load(f)
-                return ApplicationData.from_json(data)
-        except FileNotFoundError:
+        data = app_data.to_json()
+        if file_name.endswith(".snap"):
+            MappedSnapshot.write(data, file_name)
             return
 
+        temp_file_name = file_name + ".tmp"
+        if file_name.endswith(".bin"):
+            with open(temp_file_name, "wb") as f:
+                BinaryState.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(temp_file_name, "w") as f:
+                f.write(json.dumps(data, indent=4))
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_file_name, file_name)
+
+    @classmethod
+    def import_data(cls, file_name: str = BINARY_FILE_NAME, progress=None) -> ApplicationData:
+        """
+        Reads a full snapshot of the application data from a single file.
+
+        Args:
+            file_name (str): The file to read, in the binary format if it ends with `.bin`
+                             and in JSON otherwise.
+            progress (Callable[[int, int], None]): Called while loading with the number of bytes read
+                                                   so far and the size of the file.
+
+        Returns:
+            ApplicationData: An instance of ApplicationData populated with the snapshot,
+                             or `None` if the file does not exist.
+        """
+        if not os.path.exists(file_name):
+            return None
+
+        app_data = ApplicationData()
+        for section, entity in cls._iter_snapshot(file_name, progress):
+            app_data.add_from_json(section, entity)
+
+        return app_data
+
+    @staticmethod
+    def _iter_snapshot(file_name: str, progress=None):
+        """
+        Reads the entities of a single-file snapshot.
+
+        JSON snapshots are parsed one entity at a time. Binary snapshots are column-oriented,
+        so they are read as a whole.
+
+        Args:
+            file_name (str): The snapshot file, in the binary format if it ends with `.bin`
+                             and in JSON otherwise.
+            progress (Callable[[int, int], None]): Called with the number of bytes read so far
+                                                   and the size of the file.
+
+        Yields:
+            tuple[str, dict]: The section and the JSON representation of each entity.
+        """
+        total_size = os.path.getsize(file_name)
+        if file_name.endswith(".bin"):
+            with open(file_name, "rb") as f:
+                data = BinaryState.load(f)
+            if progress is not None:
+                progress(total_size, total_size)
+            for section, entities in data.items():
+                for entity in entities:
+                    yield section, entity
+        else:
+            report = (lambda loaded_size: progress(loaded_size, total_size)) if progress is not None else None
+            with open(file_name, "rb") as f:
+                for section, entity in JsonArrayStream(f, progress=report):
+                    if section in SECTION_KEYS:
+                        yield section, entity
+
+    @classmethod
+    def open_database(cls, file_name: str = DATABASE_FILE_NAME, progress=None) -> ApplicationData:
+        """
+        Opens the application data kept in a SQLite database.
+
+        A new database is filled with the state saved by the file-based storage, if there is one,
+        so switching to the database keeps all data.
+
+        Args:
+            file_name (str): The path of the database file.
+            progress (Callable[[int, int], None]): Called while the file-based state is loaded into a
+                                                   new database, with the number of bytes read so far
+                                                   and the total size of the saved state.
+
+        Returns:
+            ApplicationData: An instance of ApplicationData that reads through to the database.
+        """
+        storage = SqliteStore(file_name)
+        if storage.is_empty():
+            app_data = cls.load_data(progress)
+            if app_data is not None:
+                storage.write(app_data.to_json())
+
+        return ApplicationData.from_storage(storage)
+
+    @classmethod
+    def open_journal(cls, app_data: ApplicationData, group_size: int = 1, snapshot_file_name: str = None):
+        """
+        Attaches a journal to the application data, so that every change is recorded.
+
+        Checkpoints save only the changed entities, so a state loaded from a single snapshot file
+        is saved to the store first.
+
+        If a snapshot file is given, a `MappedSnapshot` of the store is written straight away and
+        refreshed by every checkpoint and save, so reporting processes can map it while the
+        application runs. Writing it reads the whole store, on the checkpoint thread.
+
+        Args:
+            app_data (ApplicationData): The application data to record changes of.
+            group_size (int): The number of commands whose records are written to the file at once.
+            snapshot_file_name (str): The mapped snapshot to keep up to date, e.g. `SNAPSHOT_FILE_NAME`.
+        """
+        cls._checkpointer.wait()
+        cls._checkpointer.snapshot_file_name = snapshot_file_name
+        if not cls._checkpointer.store.exists():
+            cls.save_data(app_data)
+        elif snapshot_file_name is not None:
+            MappedSnapshot.write(cls._checkpointer.store.read(), snapshot_file_name)
+        app_data.journal = Journal(JOURNAL_FILE_NAME, group_size)
+        cls._last_checkpoint_time = time.monotonic()
+
+    @classmethod
+    def commit(cls, app_data: ApplicationData):
+        """
+        Records the entities changed by a command in the journal as one group and takes a checkpoint
+        once one is due. Every changed entity is recorded once, in its state at the end of the command.
+
+        A checkpoint is due once the journal holds `COMPACTION_THRESHOLD` records, or once it holds
+        any records and `CHECKPOINT_INTERVAL` seconds have passed since the last checkpoint.
+
+        If the application data is kept in a database and has no journal, the changes are written to
+        the database in one transaction instead.
+
+        Args:
+            app_data (ApplicationData): The application data whose changes are committed.
+        """
+        if app_data.journal is not None:
+            app_data.record_changes_to_journal()
+            app_data.journal.commit()
+            records_count = app_data.journal.records_count
+            if records_count >= COMPACTION_THRESHOLD or (
+                    records_count and time.monotonic() - cls._last_checkpoint_time >= CHECKPOINT_INTERVAL):
+                cls.checkpoint(app_data)
+        elif app_data.storage is not None:
+            app_data.storage.write(app_data.changes_to_json())
+            app_data.clear_changes()
+
+    @classmethod
+    def checkpoint(cls, app_data: ApplicationData):
+        """
+        Saves the entities changed since the last checkpoint on a background thread.
+
+        The changed entities are copied between two commands, so the snapshot is consistent while
+        later commands keep changing them. The journal records up to this point are moved to the
+        checkpoint journal, which is deleted once the snapshot is on disk, and the journal starts over.
+        Only one checkpoint is written at a time, so this waits for the previous one to finish.
+
+        Args:
+            app_data (ApplicationData): The application data to save, with a journal attached.
+        """
+        cls._checkpointer.wait()
+        data = app_data.changes_to_json()
+        app_data.clear_changes()
+        app_data.journal.rotate(CHECKPOINT_JOURNAL_FILE_NAME)
+        cls._checkpointer.start(data)
+        cls._last_checkpoint_time = time.monotonic()
+
+    @classmethod
+    def wait_for_checkpoint(cls):
+        """
+        Blocks until the checkpoint being written, if any, is on disk.
+        """
+        cls._checkpointer.wait()
+
+    @classmethod
+    def close(cls, app_data: ApplicationData):
+        """
+        Saves a final snapshot and closes the journal, or commits the last changes to the database,
+        and closes the store the application data reads through to. The mapped snapshot, if one is
+        kept up to date, is refreshed a last time.
+
+        Args:
+            app_data (ApplicationData): The application data to save.
+        """
+        if app_data.storage is not None and app_data.journal is None:
+            cls.commit(app_data)
+        else:
+            cls.save_data(app_data)
+            cls._checkpointer.snapshot_file_name = None
+            if app_data.journal is not None:
+                app_data.journal.close()
+                app_data.journal = None
+        if app_data.storage is not None:
+            app_data.storage.close()
+
     @classmethod
     def seed_data(cls, app_data: ApplicationData):
         """
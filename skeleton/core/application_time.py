@@ -1,4 +1,22 @@
 from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def parse_saved_time(value: str) -> datetime:
+    """
+    Parses an ISO timestamp of a saved state.
+
+    Many packages share the departure and arrival times of their route, and datetimes are
+    immutable, so recently parsed timestamps are reused instead of being parsed again.
+
+    Args:
+        value (str): The timestamp in ISO format, or `None`.
+
+    Returns:
+        datetime: The parsed timestamp, or `None` if no timestamp is given.
+    """
+    return datetime.fromisoformat(value) if value else None
 
 
 class ApplicationTime:
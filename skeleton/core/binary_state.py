@@ -0,0 +1,260 @@
+import json
+import sys
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate
+from core.application_data import ApplicationData
+from errors.application_error import ApplicationError
+
+
+MAGIC = b"LGAS"
+VERSION = 2
+
+_NONE = -2 ** 63
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_LOCATIONS_SEPARATOR = ","
+
+
+class BinaryState:
+    """
+    Reads and writes the application state in a compact, column-oriented binary format.
+
+    The format holds the same data as the JSON state, in the dictionary format of
+    `ApplicationData.to_json`, except for the route stops, which are derived from the locations
+    and the departure time. Every field of a section is stored as one packed column: IDs as
+    64-bit integers, timestamps as 64-bit microseconds since the epoch, weights and loads as doubles
+    followed by a column flagging the values that were integers, so that a load of `0` is not read
+    back as `0.0`, and strings (hub codes, emails, names) as indexes into a table where each distinct string
+    is stored once. Lists, such as the locations of a route, are stored as a column of lengths
+    followed by a column of all items.
+
+    Layout:
+        magic (4 bytes) | version (u32) | byte order (1 byte) | string table | trucks | routes |
+        packages | employees
+
+    Every column is its array typecode (1 byte), its item count (u64) and the packed items.
+    """
+
+    @classmethod
+    def dump(cls, data: dict, f) -> None:
+        """
+        Writes the application state to a binary file.
+
+        Args:
+            data (dict): The state, in the format of `ApplicationData.to_json`.
+            f (BinaryIO): The file to write to.
+        """
+        strings: dict[str, int] = {}
+        columns = []
+
+        trucks = data["trucks"]
+        columns += [array("q", [truck["id"] for truck in trucks]),
+                    cls._string_column(strings, [truck["name"] for truck in trucks]),
+                    array("q", [truck["capacity"] for truck in trucks]),
+                    array("q", [truck["max_range"] for truck in trucks]),
+                    cls._optional_int_column([truck["assigned_route_id"] for truck in trucks])]
+
+        routes = data["routes"]
+        locations = [route["locations"].split(_LOCATIONS_SEPARATOR) for route in routes]
+        packages_ids = [route["assigned_package_ids"] for route in routes]
+        columns += [array("q", [route["id"] for route in routes]),
+                    array("i", map(len, locations)),
+                    cls._string_column(strings, [hub for hubs in locations for hub in hubs]),
+                    cls._datetime_column([route["departure_time"] for route in routes]),
+                    cls._optional_int_column([route["assigned_truck_id"] for route in routes]),
+                    array("i", map(len, packages_ids)),
+                    array("q", [package_id for ids in packages_ids for package_id in ids]),
+                    *cls._number_columns([route["load"] for route in routes])]
+
+        packages = data["packages"]
+        columns += [array("q", [package["id"] for package in packages]),
+                    cls._string_column(strings, [package["start_location"] for package in packages]),
+                    cls._string_column(strings, [package["end_location"] for package in packages]),
+                    *cls._number_columns([package["weight"] for package in packages]),
+                    cls._string_column(strings, [package["customer_email"] for package in packages]),
+                    cls._datetime_column([package["departure_time"] for package in packages]),
+                    cls._datetime_column([package["estimated_arrival_time"] for package in packages]),
+                    array("b", [package["is_assigned"] for package in packages]),
+                    cls._optional_int_column([package["route_id"] for package in packages])]
+
+        employees = data["employees"]
+        columns += [cls._string_column(strings, [employee[field] for employee in employees])
+                    for field in ("username", "first_name", "last_name", "password", "employee_role")]
+
+        text = "".join(strings)
+        f.write(MAGIC)
+        f.write(VERSION.to_bytes(4, "little"))
+        f.write(b"<" if sys.byteorder == "little" else b">")
+        cls._write_column(f, array("q", map(len, strings)))
+        cls._write_column(f, array("B", text.encode()))
+        for column in columns:
+            cls._write_column(f, column)
+
+    @classmethod
+    def load(cls, f) -> dict:
+        """
+        Reads the application state from a binary file.
+
+        Args:
+            f (BinaryIO): The file to read from.
+
+        Returns:
+            dict: The state, in the format of `ApplicationData.to_json`, without the route stops.
+
+        Raises:
+            ApplicationError: If the file is not in the binary state format.
+        """
+        reader = _ColumnReader(f.read())
+        if reader.read_bytes(4) != MAGIC:
+            raise ApplicationError("Not a binary application state file")
+        version = int.from_bytes(reader.read_bytes(4), "little")
+        if version != VERSION:
+            raise ApplicationError(f"Unsupported binary application state version {version}")
+        reader.byteswap = reader.read_bytes(1) != (b"<" if sys.byteorder == "little" else b">")
+
+        lengths = reader.column()
+        text = reader.column().tobytes().decode()
+        offsets = [0, *accumulate(lengths)]
+        strings = [text[offsets[i]:offsets[i + 1]] for i in range(len(lengths))]
+
+        def string_column():
+            return [strings[i] if i >= 0 else None for i in reader.column()]
+
+        trucks = [{"id": truck_id, "name": name, "capacity": capacity, "max_range": max_range,
+                   "assigned_route_id": route_id}
+                  for truck_id, name, capacity, max_range, route_id
+                  in zip(reader.column(), string_column(), reader.column(), reader.column(),
+                         cls._optional_ints(reader.column()))]
+
+        routes_ids = reader.column()
+        locations_counts = reader.column()
+        hubs = string_column()
+        departure_times = cls._datetimes(reader.column())
+        trucks_ids = cls._optional_ints(reader.column())
+        packages_counts = reader.column()
+        packages_ids = reader.column()
+        loads = cls._numbers(reader.column(), reader.column())
+        locations = cls._split(hubs, locations_counts)
+        packages_ids = cls._split(packages_ids.tolist(), packages_counts)
+        routes = [{"locations": _LOCATIONS_SEPARATOR.join(route_locations), "departure_time": departure_time,
+                   "id": route_id, "assigned_truck_id": truck_id, "assigned_package_ids": route_packages_ids,
+                   "load": load}
+                  for route_id, route_locations, departure_time, truck_id, route_packages_ids, load
+                  in zip(routes_ids, locations, departure_times, trucks_ids, packages_ids, loads)]
+
+        packages = [{"id": package_id, "start_location": start_location, "end_location": end_location,
+                     "weight": weight, "customer_email": customer_email, "departure_time": departure_time,
+                     "estimated_arrival_time": estimated_arrival_time, "is_assigned": bool(is_assigned),
+                     "route_id": route_id}
+                    for package_id, start_location, end_location, weight, customer_email, departure_time,
+                    estimated_arrival_time, is_assigned, route_id
+                    in zip(reader.column(), string_column(), string_column(),
+                           cls._numbers(reader.column(), reader.column()), string_column(),
+                           cls._datetimes(reader.column()), cls._datetimes(reader.column()), reader.column(),
+                           cls._optional_ints(reader.column()))]
+
+        employees = [{"username": username, "first_name": first_name, "last_name": last_name,
+                      "password": password, "employee_role": employee_role}
+                     for username, first_name, last_name, password, employee_role
+                     in zip(string_column(), string_column(), string_column(), string_column(), string_column())]
+
+        return {"trucks": trucks, "routes": routes, "packages": packages, "employees": employees}
+
+    @classmethod
+    def convert(cls, source_file_name: str, target_file_name: str) -> None:
+        """
+        Converts a state file between the JSON and the binary format.
+
+        The direction is chosen by the extension of the target file: `.bin` for the binary format
+        and anything else for JSON. Converting to JSON adds the route stops back.
+
+        Args:
+            source_file_name (str): The state file to read.
+            target_file_name (str): The state file to write.
+        """
+        if target_file_name.endswith(".bin"):
+            with open(source_file_name, "r") as f:
+                data = json.load(f)
+            with open(target_file_name, "wb") as f:
+                cls.dump(data, f)
+        else:
+            with open(source_file_name, "rb") as f:
+                data = ApplicationData.from_json(cls.load(f)).to_json()
+            with open(target_file_name, "w") as f:
+                f.write(json.dumps(data, indent=4))
+
+    @staticmethod
+    def _string_column(strings: dict[str, int], values: list[str]) -> array:
+        return array("i", [strings.setdefault(value, len(strings)) if value is not None else -1
+                           for value in values])
+
+    @staticmethod
+    def _optional_int_column(values: list[int]) -> array:
+        return array("q", [value if value is not None else _NONE for value in values])
+
+    @staticmethod
+    def _number_columns(values: list[float]) -> list[array]:
+        return [array("d", values), array("b", [type(value) is int for value in values])]
+
+    @staticmethod
+    def _datetime_column(values: list[str]) -> array:
+        # Many packages share the departure and arrival times of their route, so every distinct
+        # timestamp is converted once.
+        timestamps = {None: _NONE}
+        for value in set(values):
+            if value is not None:
+                timestamps[value] = (datetime.fromisoformat(value) - _EPOCH) // _MICROSECOND
+        return array("q", [timestamps[value] for value in values])
+
+    @staticmethod
+    def _optional_ints(column: array) -> list[int]:
+        return [value if value != _NONE else None for value in column]
+
+    @staticmethod
+    def _numbers(column: array, are_ints: array) -> list[float]:
+        return [int(value) if is_int else value for value, is_int in zip(column, are_ints)]
+
+    @staticmethod
+    def _datetimes(column: array) -> list[str]:
+        isoformats = {_NONE: None}
+        for value in set(column):
+            if value != _NONE:
+                isoformats[value] = (_EPOCH + timedelta(microseconds=value)).isoformat()
+        return [isoformats[value] for value in column]
+
+    @staticmethod
+    def _split(items: list, counts: array) -> list[list]:
+        offsets = [0, *accumulate(counts)]
+        return [items[offsets[i]:offsets[i + 1]] for i in range(len(counts))]
+
+    @staticmethod
+    def _write_column(f, column: array) -> None:
+        f.write(column.typecode.encode())
+        f.write(len(column).to_bytes(8, "little"))
+        f.write(column.tobytes())
+
+
+class _ColumnReader:
+    """
+    Reads the columns of a binary state file one after another.
+    """
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+        self.byteswap = False
+
+    def read_bytes(self, size: int) -> bytes:
+        chunk = self._data[self._offset:self._offset + size].tobytes()
+        self._offset += size
+        return chunk
+
+    def column(self) -> array:
+        column = array(self.read_bytes(1).decode())
+        count = int.from_bytes(self.read_bytes(8), "little")
+        size = count * column.itemsize
+        column.frombytes(self._data[self._offset:self._offset + size])
+        self._offset += size
+        if self.byteswap:
+            column.byteswap()
+        return column
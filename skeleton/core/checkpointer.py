@@ -0,0 +1,140 @@
+import os
+import threading
+from core.mapped_snapshot import MappedSnapshot
+from core.segmented_store import SegmentedStore, SECTION_KEYS
+
+
+class Checkpointer:
+    """
+    Writes checkpoints of the application state to the segmented store on a background thread.
+
+    A checkpoint is a snapshot of the entities changed since the previous one, taken between two
+    commands as plain dictionaries, so the command loop can keep changing the live entities while
+    the snapshot is written. The journal records covered by the snapshot are moved to a separate
+    checkpoint journal before the checkpoint starts, and that file is deleted only once the snapshot
+    is on disk. Until then, loading the state replays it, so a crash during a checkpoint loses nothing.
+
+    Only one checkpoint is written at a time. If writing a checkpoint fails, its snapshot is kept
+    and written again together with the next one.
+
+    If a snapshot file is set, every checkpoint also rewrites the read-only `MappedSnapshot` of the
+    whole store after writing the changes, so reporting processes that map it see the latest
+    checkpoint. The snapshot is written to a temporary file that replaces the previous one.
+
+    Attributes:
+        _store (SegmentedStore): The store checkpoints are written to.
+        _journal_file_name (str): The checkpoint journal deleted once a checkpoint is written.
+        _snapshot_file_name (str): The mapped snapshot refreshed by every checkpoint, if any.
+        _thread (threading.Thread): The thread writing the current checkpoint, if any.
+        _unwritten (dict): The snapshot of a checkpoint that failed, in the format of `ApplicationData.to_json`.
+        _error (OSError): The error of the last checkpoint, if it failed.
+    """
+    def __init__(self, store: SegmentedStore, journal_file_name: str):
+        """
+        Initializes the checkpointer.
+
+        Args:
+            store (SegmentedStore): The store checkpoints are written to.
+            journal_file_name (str): The checkpoint journal deleted once a checkpoint is written.
+        """
+        self._store = store
+        self._journal_file_name = journal_file_name
+        self._snapshot_file_name = None
+        self._thread = None
+        self._unwritten = {}
+        self._error = None
+
+    @property
+    def store(self) -> SegmentedStore:
+        """
+        Gets the store checkpoints are written to.
+
+        Returns:
+            SegmentedStore: The store.
+        """
+        return self._store
+
+    @property
+    def snapshot_file_name(self) -> str:
+        """
+        Gets the mapped snapshot refreshed by every checkpoint.
+
+        Returns:
+            str: The path of the snapshot file, or `None` if no snapshot is written.
+        """
+        return self._snapshot_file_name
+
+    @snapshot_file_name.setter
+    def snapshot_file_name(self, value: str) -> None:
+        self._snapshot_file_name = value
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Checks whether a checkpoint is being written.
+
+        Returns:
+            bool: True if a background thread is writing a checkpoint, otherwise False.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, data: dict) -> None:
+        """
+        Starts writing a checkpoint on a background thread, once the previous one is written.
+
+        Args:
+            data (dict): The snapshot of the changed entities, in the format of `ApplicationData.to_json`.
+                         It must not be changed afterwards.
+        """
+        self.wait()
+        self._thread = threading.Thread(target=self._write, args=(self._merge_unwritten(data),),
+                                        name="checkpoint")
+        self._thread.start()
+
+    def write(self, data: dict) -> None:
+        """
+        Writes a checkpoint on the calling thread, once the checkpoint being written, if any, is done.
+
+        Args:
+            data (dict): The snapshot of the changed entities, in the format of `ApplicationData.to_json`.
+
+        Raises:
+            OSError: If the checkpoint could not be written. Its snapshot is kept for the next checkpoint.
+        """
+        self.wait()
+        self._write(self._merge_unwritten(data))
+        if self._error is not None:
+            raise self._error
+
+    def wait(self) -> None:
+        """
+        Blocks until the checkpoint being written, if any, is done.
+        """
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _write(self, data: dict) -> None:
+        try:
+            self._store.write(data)
+            if self._snapshot_file_name is not None:
+                MappedSnapshot.write(self._store.read(), self._snapshot_file_name)
+            if os.path.exists(self._journal_file_name):
+                os.remove(self._journal_file_name)
+            self._unwritten = {}
+            self._error = None
+        except OSError as err:
+            self._unwritten = data
+            self._error = err
+
+    def _merge_unwritten(self, data: dict) -> dict:
+        if not self._unwritten:
+            return data
+
+        merged = {}
+        for section in self._unwritten.keys() | data.keys():
+            key = SECTION_KEYS[section]
+            entities = {entity[key]: entity for entity in self._unwritten.get(section, [])}
+            entities.update((entity[key], entity) for entity in data.get(section, []))
+            merged[section] = list(entities.values())
+        return merged
@@ -1,3 +1,5 @@
+import json
+import shlex
 from commands.show_employees import ShowEmployeesCommand
 from errors.application_error import ApplicationError
 from core.application_data import ApplicationData
@@ -6,8 +8,10 @@ from commands.assign_truck_to_route import AssignTruckToRouteCommand
 from commands.bulk_assign_packages import BulkAssignPackagesCommand
 from commands.create_package import CreatePackageCommand
 from commands.create_route import CreateRouteCommand
+from commands.dispatch_trucks import DispatchTrucksCommand
 from commands.login import LoginCommand
 from commands.logout import LogoutCommand
+from commands.plan_route import PlanRouteCommand
 from commands.reassign_package import ReassignPackageCommand
 from commands.register_employee import RegisterEmployeeCommand
 from commands.remove_truck_from_route import RemoveTruckFromRouteCommand
@@ -23,6 +27,43 @@ from commands.unassign_package_from_route import UnassignPackageFromRouteCommand
 import interface_menu
 
 
+# The commands that can be run in batch mode, by name, in the order of the menu. Every command
+# but `settime` can also be named by its menu number.
+BATCH_COMMANDS = {
+    "registeremployee": RegisterEmployeeCommand,
+    "login": LoginCommand,
+    "logout": LogoutCommand,
+    "createroute": CreateRouteCommand,
+    "createpackage": CreatePackageCommand,
+    "searchroute": SearchRouteCommand,
+    "searchtruck": SearchTruckCommand,
+    "assigntrucktoroute": AssignTruckToRouteCommand,
+    "removetruckfromroute": RemoveTruckFromRouteCommand,
+    "assignpackagetoroute": AssignPackageToRouteCommand,
+    "bulkassignpackages": BulkAssignPackagesCommand,
+    "reassignpackage": ReassignPackageCommand,
+    "unassignpackagefromroute": UnassignPackageFromRouteCommand,
+    "showemployees": ShowEmployeesCommand,
+    "showpackage": ShowPackageCommand,
+    "showpackages": ShowPackagesCommand,
+    "showroute": ShowRouteCommand,
+    "showroutes": ShowRoutesCommand,
+    "showtrucks": ShowTrucksCommand,
+    "dispatchtrucks": DispatchTrucksCommand,
+    "planroute": PlanRouteCommand,
+    "settime": SetTimeCommand,
+}
+BATCH_COMMANDS.update({str(number): command_class
+                       for number, command_class in enumerate(list(BATCH_COMMANDS.values())[:21], start=1)})
+
+# The commands whose last parameter is a date and time, by their number of parameters. An unquoted
+# `2025-10-10 06:00` splits into one extra parameter, which is joined back to the last one.
+DATE_TIME_COMMANDS = {
+    CreateRouteCommand: 2,
+    SetTimeCommand: 1,
+}
+
+
 class CommandFactory:
     """
     Factory class responsible for creating command instances based on user input.
@@ -38,6 +79,16 @@ class CommandFactory:
     def __init__(self, data: ApplicationData):
         self._app_data = data
 
+    @property
+    def app_data(self) -> ApplicationData:
+        """
+        Gets the application data shared across commands.
+
+        Returns:
+            ApplicationData: The shared application data.
+        """
+        return self._app_data
+
     def create(self, input_command: str):
         """
         Creates and returns the appropriate command object based on user input.
@@ -114,8 +165,8 @@ class CommandFactory:
 
         if cmd == "11":
             print(interface_menu.BULK_ASSIGN_PACKAGES_MENU)
-            params = [input("Route ID: "),
-                      input("Package IDs /separated by comma/: ").split(",")]
+            params = [input("Route ID /or \"auto\" to plan the Routes automatically/: "),
+                      input("Package IDs /separated by comma, empty for all unassigned in auto mode/: ").split(",")]
             return BulkAssignPackagesCommand(params, self._app_data)
 
         if cmd == "12":
@@ -155,9 +206,66 @@ class CommandFactory:
         if cmd == "19":
             return ShowTrucksCommand(params, self._app_data)
 
+        if cmd == "20":
+            return DispatchTrucksCommand(params, self._app_data)
+
+        if cmd == "21":
+            print(interface_menu.PLAN_ROUTE_MENU)
+            params = [input("Hubs to visit /separated by comma, in any order/: "),
+                      input("Start Location /empty for any/: "),
+                      input("Departure Time /format YYYY-MM-DD HH:MM/: "),
+                      input("Truck Max Range /empty for no limit/: ")]
+            return PlanRouteCommand(params, self._app_data)
+
         if cmd.split()[0].lower() == "settime":
             parts = cmd.split()
             params = [" ".join(parts[1:])]
             return SetTimeCommand(params, self._app_data)
 
         raise ApplicationError(f"Command {cmd} is not supported.")
+
+    def create_from_line(self, line: str):
+        """
+        Creates a command from a single, fully specified line, without prompting for its parameters.
+
+        A line is either the command name or menu number followed by its parameters, separated by
+        spaces and quoted like shell arguments when they contain spaces, e.g.
+        `createroute SYD,MEL "2025-10-10 06:00"`, or a JSON object such as
+        `{"command": "createroute", "params": ["SYD,MEL", "2025-10-10 06:00"]}`.
+        A trailing date and time, as taken by `createroute` and `settime`, may also be left unquoted.
+        The package IDs of `bulkassignpackages` are given separated by commas, or as a JSON list.
+
+        Args:
+            line (str): The command line.
+
+        Returns:
+            Command: An instance of the corresponding command class.
+
+        Raises:
+            ApplicationError: If the line is malformed or the command is not recognized.
+        """
+        try:
+            if line.startswith("{"):
+                request = json.loads(line)
+                name, params = str(request["command"]), [str(param) if not isinstance(param, list) else param
+                                                         for param in request.get("params", [])]
+            elif any(char in line for char in "\"'\\"):
+                name, *params = shlex.split(line)
+            else:
+                name, *params = line.split()
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise ApplicationError(f"Malformed command line: {line}")
+
+        command_class = BATCH_COMMANDS.get(name.lower())
+        if command_class is None:
+            raise ApplicationError(f"Command {name} is not supported.")
+        if (not line.startswith("{") and command_class in DATE_TIME_COMMANDS
+                and len(params) == DATE_TIME_COMMANDS[command_class] + 1):
+            params[-2:] = [" ".join(params[-2:])]
+        if command_class is BulkAssignPackagesCommand:
+            if len(params) == 1:
+                params.append("")
+            if len(params) == 2 and isinstance(params[1], str):
+                params[1] = params[1].split(",")
+
+        return command_class(params, self._app_data)
@@ -1,3 +1,5 @@
+import json
+import sys
 from errors.application_error import ApplicationError
 from core.command_factory import CommandFactory
 from interface_menu import INITIAL_MENU
@@ -8,13 +10,17 @@ class Engine:
     Main execution engine responsible for handling user input and executing commands.
 
     The Engine class processes user input, creates commands using a CommandFactory,
-    and executes those commands. It runs in an interactive loop until the user enters 'exit'.
+    and executes those commands. It runs in an interactive loop until the user enters 'exit',
+    or runs the commands of a script without showing menus or prompting for input.
 
     Attributes:
         _command_factory (CommandFactory): Factory instance used to create commands.
+        _on_command_done (Callable[[ApplicationData], None]): Called with the application data after
+                                                              every command, e.g. to persist its changes.
     """
-    def __init__(self, factory: CommandFactory):
+    def __init__(self, factory: CommandFactory, on_command_done=None):
         self._command_factory = factory
+        self._on_command_done = on_command_done
 
     def start(self):
         """
@@ -22,6 +28,7 @@ class Engine:
 
         The loop continuously reads user input, creates commands using the CommandFactory,
         and executes them. The output of each command is displayed, and errors are handled gracefully.
+        The engine's `on_command_done` callback, if any, is called after each command.
 
         The loop terminates when the user enters 'exit'.
 
@@ -53,3 +60,56 @@ class Engine:
 
             except KeyboardInterrupt as ki:
                 print("Application terminated")
+
+            finally:
+                self._command_done()
+
+    def run_batch(self, lines, output=None) -> int:
+        """
+        Runs fully specified commands, one per line, without showing menus or prompting for input.
+
+        Every line is either the command name followed by its parameters, or a JSON object with the
+        command and its parameters (see `CommandFactory.create_from_line`). Empty lines and lines
+        starting with '#' are skipped, and 'exit' stops the batch. The result of every command is
+        written to the output as soon as it is executed: its output as text for a text line, or a
+        JSON object with the line number, whether it succeeded and its output for a JSON line.
+        A failed command does not stop the batch. The engine's `on_command_done` callback, if any,
+        is called after each command.
+
+        Args:
+            lines (Iterable[str]): The command lines, e.g. an open script file or `sys.stdin`.
+            output (TextIO): Where the results are written. Defaults to `sys.stdout`.
+
+        Returns:
+            int: The number of commands that failed.
+        """
+        output = output if output is not None else sys.stdout
+        failed_count = 0
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.lower() == "exit":
+                break
+
+            try:
+                command_output = self._command_factory.create_from_line(line).execute()
+                is_successful = True
+            except (ApplicationError, ValueError) as err:
+                command_output = err.args[0]
+                is_successful = False
+                failed_count += 1
+            finally:
+                self._command_done()
+
+            if line.startswith("{"):
+                output.write(json.dumps({"line": line_number, "ok": is_successful, "output": command_output}) + "\n")
+            else:
+                output.write(command_output + "\n")
+
+        output.flush()
+        return failed_count
+
+    def _command_done(self):
+        if self._on_command_done is not None:
+            self._on_command_done(self._command_factory.app_data)
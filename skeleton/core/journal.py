@@ -0,0 +1,146 @@
+import json
+import os
+import shutil
+
+
+JOURNAL_FILE_NAME = "app_state.journal"
+
+
+class Journal:
+    """
+    Append-only log of the entities changed since the last snapshot of the application state.
+
+    Every change is recorded as one compact JSON line holding the new state of a truck, route,
+    package or employee, so replaying the journal over the last snapshot restores the latest
+    state. Records are buffered and written in groups: `commit` closes the group of records
+    produced by one command, and every `group_size` groups are written and flushed together.
+
+    Attributes:
+        _file_name (str): The path of the journal file.
+        _group_size (int): The number of committed groups written to the file at once.
+        _buffer (list[str]): Records that have not been written to the file yet.
+        _pending_groups (int): The number of committed groups in the buffer.
+        _records_count (int): The number of records written to the file since it was last truncated.
+        _file (TextIO): The journal file, opened for appending.
+    """
+    def __init__(self, file_name: str = JOURNAL_FILE_NAME, group_size: int = 1):
+        """
+        Opens the journal file for appending, creating it if it does not exist.
+
+        Args:
+            file_name (str): The path of the journal file.
+            group_size (int): The number of committed groups written to the file at once.
+        """
+        self._file_name = file_name
+        self._group_size = group_size
+        self._buffer: list[str] = []
+        self._pending_groups = 0
+        self._records_count = sum(1 for _ in Journal.read(file_name))
+        self._file = open(file_name, "a", encoding="utf-8")
+
+    @property
+    def records_count(self) -> int:
+        """
+        Gets the number of records in the journal file, including the ones not written yet.
+
+        Returns:
+            int: The number of records since the journal was last truncated.
+        """
+        return self._records_count + len(self._buffer)
+
+    def record(self, section: str, data: dict) -> None:
+        """
+        Adds the new state of an entity to the current group.
+
+        Args:
+            section (str): The section of the application state the entity belongs to.
+            data (dict): The JSON representation of the entity.
+        """
+        self._buffer.append(json.dumps({"section": section, "data": data}, separators=(",", ":")))
+
+    def commit(self) -> None:
+        """
+        Closes the current group and writes the buffered groups once there are `group_size` of them.
+        """
+        if not self._buffer:
+            return
+        self._pending_groups += 1
+        if self._pending_groups >= self._group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes all buffered records to the journal file with a single write.
+        """
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._file.flush()
+            self._records_count += len(self._buffer)
+            self._buffer.clear()
+        self._pending_groups = 0
+
+    def truncate(self) -> None:
+        """
+        Discards all records, written or buffered, once a snapshot containing them has been saved.
+        """
+        self._buffer.clear()
+        self._pending_groups = 0
+        self._file.truncate(0)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._records_count = 0
+
+    def rotate(self, file_name: str) -> None:
+        """
+        Moves all records to another file and continues with an empty journal.
+
+        The records are appended if the file already exists, so the records of a checkpoint
+        that was not written are kept until one is.
+
+        Args:
+            file_name (str): The path of the file the records are moved to.
+        """
+        self.flush()
+        self._file.close()
+        if os.path.exists(file_name):
+            with open(self._file_name, "r", encoding="utf-8") as source, \
+                    open(file_name, "a", encoding="utf-8") as target:
+                shutil.copyfileobj(source, target)
+                target.flush()
+                os.fsync(target.fileno())
+            open(self._file_name, "w").close()
+        else:
+            os.replace(self._file_name, file_name)
+        self._file = open(self._file_name, "a", encoding="utf-8")
+        self._records_count = 0
+
+    def close(self) -> None:
+        """
+        Writes the buffered records and closes the journal file.
+        """
+        self.flush()
+        self._file.close()
+
+    @staticmethod
+    def read(file_name: str = JOURNAL_FILE_NAME):
+        """
+        Reads the records of a journal file in the order they were written.
+
+        A record cut short by a crash in the middle of a write ends the journal.
+
+        Args:
+            file_name (str): The path of the journal file.
+
+        Yields:
+            tuple[str, dict]: The section and the JSON representation of each recorded entity.
+        """
+        try:
+            with open(file_name, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        return
+                    yield record["section"], record["data"]
+        except FileNotFoundError:
+            return
@@ -0,0 +1,125 @@
+import codecs
+import json
+import re
+
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+class JsonArrayStream:
+    """
+    Reads a JSON object whose values are arrays, one array item at a time.
+
+    The file is read in chunks of `CHUNK_SIZE` bytes and only the part that has not been parsed
+    yet is kept in memory, so a large state file can be loaded without holding the whole parsed
+    document next to the objects built from it. Values that are not arrays are skipped.
+
+    Attributes:
+        _file (BinaryIO): The file to read.
+        _chunk_size (int): The number of bytes read at a time.
+        _progress (Callable[[int], None]): Called with the number of bytes read after every chunk.
+        _text_decoder (codecs.IncrementalDecoder): Decodes UTF-8 across chunk boundaries.
+        _buffer (str): The text read but not parsed yet, starting at `_position`.
+        _position (int): The index of the next character to parse in `_buffer`.
+        _bytes_read (int): The number of bytes read from the file so far.
+        _is_eof (bool): Whether the whole file has been read.
+    """
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE, progress=None):
+        """
+        Initializes the stream over a file opened in binary mode.
+
+        Args:
+            f (BinaryIO): The file to read.
+            chunk_size (int): The number of bytes read at a time.
+            progress (Callable[[int], None]): Called with the number of bytes read after every chunk.
+        """
+        self._file = f
+        self._chunk_size = chunk_size
+        self._progress = progress
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._bytes_read = 0
+        self._is_eof = False
+
+    def __iter__(self):
+        """
+        Parses the file and yields every item of every top-level array.
+
+        Yields:
+            tuple[str, object]: The key of the array and the parsed item.
+
+        Raises:
+            json.JSONDecodeError: If the file is not a JSON object or is malformed.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            return
+
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+            if self._peek() == "[":
+                self._position += 1
+                if self._peek() == "]":
+                    self._position += 1
+                else:
+                    while True:
+                        yield key, self._decode_value()
+                        if self._next_separator("]"):
+                            break
+            else:
+                self._decode_value()
+
+            if self._next_separator("}"):
+                return
+
+    def _read_chunk(self) -> bool:
+        chunk = self._file.read(self._chunk_size)
+        self._bytes_read += len(chunk)
+        self._is_eof = not chunk
+        text = self._text_decoder.decode(chunk, final=self._is_eof)
+        self._buffer = self._buffer[self._position:] + text
+        self._position = 0
+        if self._progress is not None and chunk:
+            self._progress(self._bytes_read)
+        return not self._is_eof
+
+    def _peek(self) -> str:
+        while True:
+            self._position = _whitespace.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_chunk():
+                raise json.JSONDecodeError("Unexpected end of file", self._buffer, self._position)
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._position)
+        self._position += 1
+
+    def _next_separator(self, closing_char: str) -> bool:
+        char = self._peek()
+        self._position += 1
+        if char == closing_char:
+            return True
+        if char != ",":
+            raise json.JSONDecodeError(f"Expecting ',' or '{closing_char}'", self._buffer, self._position - 1)
+        return False
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+                # A value that ends with the buffer may continue in the next chunk (e.g. a number).
+                if end < len(self._buffer) or self._is_eof:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._is_eof:
+                    raise
+            self._read_chunk()
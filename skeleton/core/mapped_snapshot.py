@@ -0,0 +1,326 @@
+import json
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from errors.application_error import ApplicationError
+
+
+MAGIC = b"LGMS"
+VERSION = 1
+NONE = -2 ** 63
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_ALIGNMENT = 8
+_PREAMBLE_SIZE = 16
+_LOCATIONS_SEPARATOR = ","
+
+# The fields of every section and their kind: "int" and "float" are stored as they are, "string"
+# as an index into the string table, "time" as microseconds since the epoch, "bool" as a byte and
+# "list" as a column of offsets into a column of items.
+_FIELDS = {
+    "trucks": {"id": "int", "name": "string", "capacity": "int", "max_range": "int",
+               "assigned_route_id": "int"},
+    "routes": {"id": "int", "locations": "list", "departure_time": "time", "assigned_truck_id": "int",
+               "assigned_package_ids": "list", "load": "float"},
+    "packages": {"id": "int", "start_location": "string", "end_location": "string", "weight": "float",
+                 "customer_email": "string", "departure_time": "time", "estimated_arrival_time": "time",
+                 "is_assigned": "bool", "route_id": "int"},
+}
+_TYPECODES = {"int": "q", "float": "d", "string": "i", "time": "q", "bool": "b"}
+
+
+class MappedSnapshot:
+    """
+    Reads a read-only snapshot of the trucks, routes and packages by mapping its file into memory.
+
+    Every field of a section is stored as one column of fixed-width values, with records sorted by ID,
+    so a record is found by a binary search over the ID column and a column is scanned without
+    parsing or copying anything. Since the file is mapped and never copied into the process, any
+    number of reporting processes, and the application itself, share one copy of it in the page
+    cache. Employees are not included, so the snapshot can be shared without exposing passwords.
+
+    Missing integers and timestamps are stored as `NONE`. Strings are stored once, in a table, and
+    the string columns hold their indexes. The routes' locations and package IDs are stored as
+    a column of offsets into a column of all items, so the items of record `i` are
+    `items[offsets[i]:offsets[i + 1]]`.
+
+    Layout:
+        magic (4 bytes) | version (u32) | header size (u64) | header (JSON) | columns
+
+    The header lists the byte order, the number of records of every section and the typecode,
+    offset and length of every column. Columns start at multiples of 8 bytes.
+
+    Attributes:
+        _file (BinaryIO): The snapshot file.
+        _map (mmap.mmap): The memory-mapped file.
+        _view (memoryview): A view of the whole mapped file.
+        _sections (dict): The number of records and the columns of every section, from the header.
+        _string_offsets (memoryview): The offset of every string in `_string_data`, plus its end.
+        _string_data (memoryview): The UTF-8 bytes of all strings.
+        _strings (dict[int, str]): The strings decoded so far, by index.
+        _columns (dict[tuple[str, str], memoryview]): The columns cast so far, by section and field.
+    """
+    def __init__(self, file_name: str):
+        """
+        Opens and maps a snapshot file.
+
+        Args:
+            file_name (str): The path of the snapshot file.
+
+        Raises:
+            ApplicationError: If the file is empty, is not a snapshot or was written on a machine with
+                              a different byte order.
+        """
+        self._file = open(file_name, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ApplicationError("Not a mapped application state snapshot")
+        self._view = memoryview(self._map)
+        if len(self._view) < _PREAMBLE_SIZE or self._view[:4] != MAGIC:
+            self.close()
+            raise ApplicationError("Not a mapped application state snapshot")
+        version = int.from_bytes(self._view[4:8], "little")
+        header_size = int.from_bytes(self._view[8:_PREAMBLE_SIZE], "little")
+        try:
+            header = json.loads(bytes(self._view[_PREAMBLE_SIZE:_PREAMBLE_SIZE + header_size]))
+        except ValueError:
+            self.close()
+            raise ApplicationError("Truncated mapped application state snapshot")
+        if version != VERSION or header.get("byteorder") != sys.byteorder:
+            self.close()
+            raise ApplicationError(f"Unsupported snapshot version {version} or byte order {header.get('byteorder')}")
+
+        self._sections = header["sections"]
+        self._string_offsets = self._column(header["strings"]["offsets"])
+        self._string_data = self._column(header["strings"]["data"])
+        self._strings: dict[int, str] = {}
+        self._columns: dict[tuple[str, str], memoryview] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the snapshot file.
+
+        Raises:
+            BufferError: If a column returned by `column` is still referenced.
+        """
+        for column in getattr(self, "_columns", {}).values():
+            column.release()
+        for name in ("_string_offsets", "_string_data", "_view"):
+            if hasattr(self, name):
+                getattr(self, name).release()
+        self._map.close()
+        self._file.close()
+
+    def count(self, section: str) -> int:
+        """
+        Gets the number of records in a section.
+
+        Args:
+            section (str): The section: "trucks", "routes" or "packages".
+
+        Returns:
+            int: The number of records.
+        """
+        return self._sections[section]["count"]
+
+    def column(self, section: str, field: str) -> memoryview:
+        """
+        Gets the values of a field for all records of a section, in the order of their IDs, without copying them.
+
+        String fields hold indexes into the string table, which `string` resolves, and timestamps
+        hold microseconds since the epoch. For list fields, the offsets of every record's items are
+        returned, and `column(section, field + "_items")` returns the items.
+
+        Args:
+            section (str): The section: "trucks", "routes" or "packages".
+            field (str): The field.
+
+        Returns:
+            memoryview: A read-only view of the column, cast to its item type.
+
+        Raises:
+            ApplicationError: If the section or the field does not exist.
+        """
+        if (section, field) not in self._columns:
+            try:
+                self._columns[section, field] = self._column(self._sections[section]["columns"][field])
+            except KeyError:
+                raise ApplicationError(f"Snapshot has no column {field} in {section}")
+        return self._columns[section, field]
+
+    def string(self, index: int) -> str:
+        """
+        Gets a string from the string table.
+
+        Args:
+            index (int): The index of the string, as stored in a string column.
+
+        Returns:
+            str: The string.
+        """
+        if index not in self._strings:
+            start, end = self._string_offsets[index], self._string_offsets[index + 1]
+            self._strings[index] = str(self._string_data[start:end], "utf-8")
+        return self._strings[index]
+
+    def find(self, section: str, record_id: int) -> dict:
+        """
+        Finds a record by its ID with a binary search over the ID column.
+
+        Args:
+            section (str): The section: "trucks", "routes" or "packages".
+            record_id (int): The ID of the record.
+
+        Returns:
+            dict: The record in the format of `ApplicationData.to_json`, without the route stops,
+                  or `None` if there is no record with the ID.
+        """
+        ids = self.column(section, "id")
+        position = bisect_left(ids, record_id)
+        if position == len(ids) or ids[position] != record_id:
+            return None
+        return self.record(section, position)
+
+    def record(self, section: str, position: int) -> dict:
+        """
+        Reads the record at a position of a section.
+
+        Args:
+            section (str): The section: "trucks", "routes" or "packages".
+            position (int): The position of the record, in the order of the IDs.
+
+        Returns:
+            dict: The record in the format of `ApplicationData.to_json`, without the route stops.
+        """
+        record = {}
+        for field, kind in _FIELDS[section].items():
+            value = self.column(section, field)[position]
+            if kind == "list":
+                items = self.column(section, field + "_items")[value:self.column(section, field)[position + 1]]
+                if field == "locations":
+                    record[field] = _LOCATIONS_SEPARATOR.join(self.string(index) for index in items)
+                else:
+                    record[field] = items.tolist()
+            elif kind == "string":
+                record[field] = self.string(value)
+            elif kind == "time":
+                record[field] = (_EPOCH + timedelta(microseconds=value)).isoformat() if value != NONE else None
+            elif kind == "bool":
+                record[field] = bool(value)
+            else:
+                record[field] = value if value != NONE else None
+        return record
+
+    @classmethod
+    def write(cls, data: dict, file_name: str) -> None:
+        """
+        Writes the trucks, routes and packages of the application state to a snapshot file.
+
+        The snapshot is written to a temporary file that then replaces the target. Processes that
+        have the previous snapshot open keep reading it until they open the file again.
+
+        Args:
+            data (dict): The state, in the format of `ApplicationData.to_json`.
+            file_name (str): The path of the snapshot file.
+        """
+        strings: dict[str, int] = {}
+        columns: list[array] = []
+        sections = {}
+        for section, fields in _FIELDS.items():
+            records = sorted(data[section], key=lambda record: record["id"])
+            section_columns = {}
+            for field, kind in fields.items():
+                values = [record[field] for record in records]
+                if kind == "list":
+                    if field == "locations":
+                        items = array("i", [strings.setdefault(hub, len(strings))
+                                            for value in values for hub in value.split(_LOCATIONS_SEPARATOR)])
+                        counts = [value.count(_LOCATIONS_SEPARATOR) + 1 for value in values]
+                    else:
+                        items = array("q", [item for value in values for item in value])
+                        counts = [len(value) for value in values]
+                    offsets = array("q", [0])
+                    for count in counts:
+                        offsets.append(offsets[-1] + count)
+                    section_columns[field] = cls._add_column(columns, offsets)
+                    section_columns[field + "_items"] = cls._add_column(columns, items)
+                elif kind == "string":
+                    section_columns[field] = cls._add_column(
+                        columns, array("i", [strings.setdefault(value, len(strings)) for value in values]))
+                elif kind == "time":
+                    timestamps = {None: NONE}
+                    for value in set(values) - {None}:
+                        timestamps[value] = (datetime.fromisoformat(value) - _EPOCH) // _MICROSECOND
+                    section_columns[field] = cls._add_column(columns, array("q", [timestamps[value] for value in values]))
+                elif kind == "int":
+                    section_columns[field] = cls._add_column(
+                        columns, array("q", [value if value is not None else NONE for value in values]))
+                else:
+                    section_columns[field] = cls._add_column(columns, array(_TYPECODES[kind], values))
+            sections[section] = {"count": len(records), "columns": section_columns}
+
+        encoded = [string.encode() for string in strings]
+        string_offsets = array("q", [0])
+        for string in encoded:
+            string_offsets.append(string_offsets[-1] + len(string))
+        header = {"byteorder": sys.byteorder, "sections": sections,
+                  "strings": {"offsets": cls._add_column(columns, string_offsets),
+                              "data": cls._add_column(columns, array("B", b"".join(encoded)))}}
+
+        # Column offsets are relative to the end of the header, whose size depends on the offsets.
+        entries = list(cls._iter_column_entries(header))
+        relative_offsets = [entry[1] for entry in entries]
+        data_start = cls._align(_PREAMBLE_SIZE + len(json.dumps(header)))
+        while True:
+            for entry, relative_offset in zip(entries, relative_offsets):
+                entry[1] = data_start + relative_offset
+            header_bytes = json.dumps(header).encode()
+            if _PREAMBLE_SIZE + len(header_bytes) <= data_start:
+                break
+            data_start = cls._align(_PREAMBLE_SIZE + len(header_bytes))
+        header_bytes = header_bytes.ljust(data_start - _PREAMBLE_SIZE)
+
+        temp_file_name = file_name + ".tmp"
+        with open(temp_file_name, "wb") as f:
+            f.write(MAGIC)
+            f.write(VERSION.to_bytes(4, "little"))
+            f.write(len(header_bytes).to_bytes(8, "little"))
+            f.write(header_bytes)
+            for column in columns:
+                f.write(column.tobytes())
+                f.write(bytes(cls._align(len(column) * column.itemsize) - len(column) * column.itemsize))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file_name, file_name)
+
+    def _column(self, entry: list) -> memoryview:
+        typecode, offset, length = entry
+        return self._view[offset:offset + length * array(typecode).itemsize].cast(typecode)
+
+    @classmethod
+    def _add_column(cls, columns: list[array], column: array) -> list:
+        offset = sum(cls._align(len(existing) * existing.itemsize) for existing in columns)
+        columns.append(column)
+        return [column.typecode, offset, len(column)]
+
+    @staticmethod
+    def _iter_column_entries(header: dict):
+        for section in header["sections"].values():
+            yield from section["columns"].values()
+        yield from header["strings"].values()
+
+    @staticmethod
+    def _align(size: int) -> int:
+        return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
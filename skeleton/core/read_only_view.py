@@ -0,0 +1,36 @@
+from collections.abc import Collection, Iterator
+
+
+class ReadOnlyView(Collection):
+    """
+    A live, read-only view over one of the application's internal collections.
+
+    The view does not copy the wrapped collection, so handing it out is constant-time
+    regardless of how many items are stored. Changes to the wrapped collection are
+    visible through the view, but the view itself offers no way to mutate it.
+
+    Attributes:
+        _items (Collection): The wrapped collection (a list or a dictionary values view).
+    """
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Collection):
+        """
+        Initializes the view over the given collection.
+
+        Args:
+            items (Collection): The collection to expose.
+        """
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._items)!r})"
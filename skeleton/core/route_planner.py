@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+from errors.application_error import ApplicationError
+from models.constants.distances import Distance
+from models.route import Route
+
+
+class RoutePlan:
+    """
+    A stop order proposed by the RoutePlanner.
+
+    Attributes:
+        locations (tuple[str]): The hubs in the order they should be visited.
+        distance (int): The total distance of the route in kilometers.
+        stops (dict[str, datetime]): The estimated arrival time at each hub.
+    """
+    def __init__(self, locations: tuple, distance: int, stops: dict):
+        self.locations = locations
+        self.distance = distance
+        self.stops = stops
+
+
+class RoutePlanner:
+    """
+    Proposes the shortest order in which a route can visit a set of hubs.
+
+    Small sets of hubs are solved exactly with the Held-Karp dynamic programming algorithm.
+    Larger sets start from a nearest-neighbour order that is then improved with 2-opt
+    (reversing a part of the route) and or-opt (moving a run of up to three stops elsewhere)
+    until neither finds a shorter route.
+
+    Attributes:
+        EXACT_SEARCH_LIMIT (int): The largest number of hubs that is solved exactly.
+        OR_OPT_SEGMENT_LENGTH (int): The longest run of stops moved by or-opt.
+    """
+    EXACT_SEARCH_LIMIT = 10
+    OR_OPT_SEGMENT_LENGTH = 3
+
+    @classmethod
+    def plan(cls, hubs: list[str], departure_time: datetime, max_range: int = None,
+             start_location: str = None) -> RoutePlan:
+        """
+        Finds the shortest stop order that visits every hub once.
+
+        Args:
+            hubs (list[str]): The hubs the route has to visit.
+            departure_time (datetime): The departure time from the first hub.
+            max_range (int): The range of the truck in kilometers, if the route has to fit in it.
+            start_location (str): The hub the route has to start from, if any.
+
+        Returns:
+            RoutePlan: The proposed stop order, its distance and the estimated arrival times.
+
+        Raises:
+            ApplicationError: If a hub is invalid, fewer than two hubs are given, a hub cannot be
+                              reached, or the shortest route found is longer than `max_range`.
+        """
+        hubs = list(dict.fromkeys(hubs))
+        if start_location is not None and start_location not in hubs:
+            hubs.insert(0, start_location)
+        for hub in hubs:
+            if not Distance.is_hub(hub):
+                raise ApplicationError(f"Invalid location: {hub}")
+        if len(hubs) < 2:
+            raise ApplicationError("Too few locations!")
+
+        distances = [[Distance.get_distance(hub_1, hub_2) if hub_1 != hub_2 else 0 for hub_2 in hubs]
+                     for hub_1 in hubs]
+        if any(Distance.UNREACHABLE in row for row in distances):
+            raise ApplicationError("Some of the locations cannot be reached from each other")
+
+        start = hubs.index(start_location) if start_location is not None else None
+        if len(hubs) <= cls.EXACT_SEARCH_LIMIT:
+            order = cls._exact_order(distances, start)
+        else:
+            order = cls._heuristic_order(distances, start)
+
+        distance = cls._path_length(distances, order)
+        if max_range is not None and distance > max_range:
+            raise ApplicationError(f"The shortest route found is {distance} km, "
+                                   f"which exceeds the truck range of {max_range} km")
+
+        locations = tuple(hubs[i] for i in order)
+        stops = {locations[0]: departure_time}
+        estimated_arrival_time = departure_time
+        for i in range(len(order) - 1):
+            estimated_arrival_time += timedelta(hours=distances[order[i]][order[i + 1]] / Route.AVERAGE_SPEED)
+            stops[locations[i + 1]] = estimated_arrival_time
+
+        return RoutePlan(locations, distance, stops)
+
+    @staticmethod
+    def _path_length(distances: list[list[int]], order: list[int]) -> int:
+        return sum(distances[order[i]][order[i + 1]] for i in range(len(order) - 1))
+
+    @staticmethod
+    def _exact_order(distances: list[list[int]], start: int = None) -> list[int]:
+        """
+        Finds the shortest order with the Held-Karp algorithm in O(n^2 * 2^n) time.
+        """
+        hubs_count = len(distances)
+        full_mask = (1 << hubs_count) - 1
+        starts = [start] if start is not None else range(hubs_count)
+
+        best = {}
+        for hub in starts:
+            best[(1 << hub, hub)] = (0, None)
+
+        for mask in range(1, full_mask + 1):
+            for last in range(hubs_count):
+                entry = best.get((mask, last))
+                if entry is None:
+                    continue
+                for hub in range(hubs_count):
+                    if mask & (1 << hub):
+                        continue
+                    key = (mask | (1 << hub), hub)
+                    length = entry[0] + distances[last][hub]
+                    if key not in best or length < best[key][0]:
+                        best[key] = (length, last)
+
+        last = min((hub for hub in range(hubs_count) if (full_mask, hub) in best),
+                   key=lambda hub: best[(full_mask, hub)][0])
+        order = []
+        mask = full_mask
+        while last is not None:
+            order.append(last)
+            previous = best[(mask, last)][1]
+            mask &= ~(1 << last)
+            last = previous
+
+        return order[::-1]
+
+    @classmethod
+    def _heuristic_order(cls, distances: list[list[int]], start: int = None) -> list[int]:
+        """
+        Builds a nearest-neighbour order and improves it with 2-opt and or-opt moves.
+        """
+        current = start if start is not None else 0
+        order = [current]
+        remaining = set(range(len(distances))) - {current}
+        while remaining:
+            current = min(remaining, key=distances[current].__getitem__)
+            order.append(current)
+            remaining.remove(current)
+
+        first_movable = 1 if start is not None else 0
+        improved = True
+        while improved:
+            improved = cls._two_opt(distances, order, first_movable)
+            improved = cls._or_opt(distances, order, first_movable) or improved
+
+        return order
+
+    @staticmethod
+    def _two_opt(distances: list[list[int]], order: list[int], first_movable: int) -> bool:
+        """
+        Reverses parts of the route while doing so makes it shorter.
+
+        Returns:
+            bool: True if the route was changed.
+        """
+        changed = False
+        last_index = len(order) - 1
+        for i in range(first_movable, last_index):
+            for j in range(i + 1, last_index + 1):
+                before = distances[order[i - 1]][order[i]] if i > 0 else 0
+                after = distances[order[j]][order[j + 1]] if j < last_index else 0
+                reversed_before = distances[order[i - 1]][order[j]] if i > 0 else 0
+                reversed_after = distances[order[i]][order[j + 1]] if j < last_index else 0
+                if reversed_before + reversed_after < before + after:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    changed = True
+
+        return changed
+
+    @classmethod
+    def _or_opt(cls, distances: list[list[int]], order: list[int], first_movable: int) -> bool:
+        """
+        Moves runs of up to `OR_OPT_SEGMENT_LENGTH` stops to the position where the route gets shortest.
+
+        Returns:
+            bool: True if the route was changed.
+        """
+        def leg(hub_1, hub_2):
+            return distances[hub_1][hub_2] if hub_1 is not None and hub_2 is not None else 0
+
+        changed = False
+        for length in range(1, cls.OR_OPT_SEGMENT_LENGTH + 1):
+            i = first_movable
+            while i + length <= len(order):
+                segment = order[i:i + length]
+                previous_hub = order[i - 1] if i > 0 else None
+                next_hub = order[i + length] if i + length < len(order) else None
+                removal_gain = (leg(previous_hub, segment[0]) + leg(segment[-1], next_hub)
+                                - leg(previous_hub, next_hub))
+
+                rest = order[:i] + order[i + length:]
+                best_position, best_cost = None, removal_gain
+                for position in range(first_movable, len(rest) + 1):
+                    if position == i:
+                        continue
+                    hub_before = rest[position - 1] if position > 0 else None
+                    hub_after = rest[position] if position < len(rest) else None
+                    cost = leg(hub_before, segment[0]) + leg(segment[-1], hub_after) - leg(hub_before, hub_after)
+                    if cost < best_cost:
+                        best_position, best_cost = position, cost
+
+                if best_position is not None:
+                    order[:] = rest[:best_position] + segment + rest[best_position:]
+                    changed = True
+                i += 1
+
+        return changed
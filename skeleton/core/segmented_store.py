@@ -0,0 +1,219 @@
+import json
+import os
+import zlib
+
+
+SECTION_KEYS = {"trucks": "id", "routes": "id", "packages": "id", "employees": "username"}
+
+
+class SegmentedStore:
+    """
+    Stores the application state as many small JSON files, so that a change rewrites only its own file.
+
+    Every section of the state (trucks, routes, packages, employees) is a directory of segments.
+    Entities with numeric IDs are grouped into segments of `SEGMENT_SIZE` consecutive IDs, while
+    employees are spread over `HASHED_SEGMENTS` segments by a hash of their username. Saving a set
+    of changed entities rewrites only the segments that contain them, so its cost depends on the
+    number of changes and not on the size of the state.
+
+    Single entities and whole sections can also be read on demand, so the application data can
+    read through to the store instead of loading every entity at startup. The last segment read
+    is cached, since entities that are used together usually have neighbouring IDs.
+
+    Attributes:
+        SEGMENT_SIZE (int): The number of consecutive IDs stored in one segment.
+        HASHED_SEGMENTS (int): The number of segments that entities keyed by name are spread over.
+        _directory (str): The directory the segments are stored in.
+        _cached_segment (tuple[str, dict]): The file name and the entities, by key, of the last segment
+                                            read by `find`.
+    """
+    SEGMENT_SIZE = 1000
+    HASHED_SEGMENTS = 16
+
+    def __init__(self, directory: str):
+        """
+        Initializes the store in the given directory. The directory is created on the first write.
+
+        Args:
+            directory (str): The directory the segments are stored in.
+        """
+        self._directory = directory
+        self._cached_segment = (None, {})
+
+    def exists(self) -> bool:
+        """
+        Checks whether the store has been written.
+
+        Returns:
+            bool: True if the store directory exists, otherwise False.
+        """
+        return os.path.isdir(self._directory)
+
+    def write(self, data: dict) -> int:
+        """
+        Writes entities to the store, replacing the stored entities with the same keys.
+
+        Each affected segment is read, updated and written to a temporary file that then replaces it,
+        so a crash leaves every segment either in its old or in its new state.
+
+        Args:
+            data (dict): The entities to write, in the format of `ApplicationData.to_json`.
+
+        Returns:
+            int: The number of segments written.
+        """
+        segments_count = 0
+        self._cached_segment = (None, {})
+        for section, entities in data.items():
+            key = SECTION_KEYS[section]
+            segments = {}
+            for entity in entities:
+                segments.setdefault(self._segment_of(entity[key]), []).append(entity)
+
+            if segments:
+                os.makedirs(os.path.join(self._directory, section), exist_ok=True)
+            for segment, changed_entities in segments.items():
+                file_name = self._segment_file_name(section, segment)
+                stored_entities = {entity[key]: entity for entity in self._read_segment(file_name)}
+                for entity in changed_entities:
+                    stored_entities[entity[key]] = entity
+                self._write_segment(file_name, list(stored_entities.values()))
+                segments_count += 1
+
+        return segments_count
+
+    def read(self) -> dict:
+        """
+        Reads all entities from the store.
+
+        Returns:
+            dict: All stored entities, in the format of `ApplicationData.to_json`. Entities with
+                  numeric IDs are returned in the order of their IDs.
+        """
+        data = {section: [] for section in SECTION_KEYS}
+        for section, entity in self.iter_entities():
+            data[section].append(entity)
+        for section, key in SECTION_KEYS.items():
+            if key == "id":
+                data[section].sort(key=lambda entity: entity["id"])
+
+        return data
+
+    def iter_entities(self, progress=None):
+        """
+        Reads the entities from the store one segment at a time.
+
+        Args:
+            progress (Callable[[int, int], None]): Called after every segment with the number of bytes
+                                                   read so far and the total size of the store.
+
+        Yields:
+            tuple[str, dict]: The section and the JSON representation of each stored entity.
+        """
+        segment_files = [(section, file_name) for section in SECTION_KEYS for file_name in self._segment_files(section)]
+
+        total_size = sum(os.path.getsize(file_name) for _, file_name in segment_files)
+        loaded_size = 0
+        for section, file_name in segment_files:
+            for entity in self._read_segment(file_name):
+                yield section, entity
+            loaded_size += os.path.getsize(file_name)
+            if progress is not None:
+                progress(loaded_size, total_size)
+
+    def iter_section(self, section: str):
+        """
+        Reads all entities of a section.
+
+        Args:
+            section (str): The section to read: "trucks", "routes", "packages" or "employees".
+
+        Yields:
+            dict: The JSON representation of each entity.
+        """
+        for file_name in self._segment_files(section):
+            yield from self._read_segment(file_name)
+
+    def find(self, section: str, key) -> dict:
+        """
+        Reads one entity by its ID, or by its username for employees, from the segment that holds it.
+
+        Args:
+            section (str): The section of the entity.
+            key (int | str): The ID or username of the entity.
+
+        Returns:
+            dict: The JSON representation of the entity, or `None` if it does not exist.
+        """
+        file_name = self._segment_file_name(section, self._segment_of(key))
+        if self._cached_segment[0] != file_name:
+            self._cached_segment = (file_name, {entity[SECTION_KEYS[section]]: entity
+                                                for entity in self._read_segment(file_name)})
+        return self._cached_segment[1].get(key)
+
+    def find_packages(self, is_assigned: bool):
+        """
+        Reads the packages with the given assignment status.
+
+        Args:
+            is_assigned (bool): True for assigned packages, False for unassigned ones.
+
+        Yields:
+            dict: The JSON representation of each package.
+        """
+        for package in self.iter_section("packages"):
+            if package["is_assigned"] == is_assigned:
+                yield package
+
+    def max_id(self, section: str) -> int:
+        """
+        Gets the largest ID used in a section, reading only its last segment.
+
+        Args:
+            section (str): The section: "trucks", "routes" or "packages".
+
+        Returns:
+            int: The largest ID, or 0 if the section is empty.
+        """
+        segment_files = self._segment_files(section)
+        if not segment_files:
+            return 0
+        return max((entity["id"] for entity in self._read_segment(segment_files[-1])), default=0)
+
+    def close(self) -> None:
+        """
+        Releases the cached segment. Every write is already on disk, so there is nothing else to close.
+        """
+        self._cached_segment = (None, {})
+
+    def _segment_files(self, section: str) -> list[str]:
+        section_directory = os.path.join(self._directory, section)
+        if not os.path.isdir(section_directory):
+            return []
+        return [os.path.join(section_directory, name)
+                for name in sorted(os.listdir(section_directory)) if name.endswith(".json")]
+
+    def _segment_of(self, key) -> int:
+        if isinstance(key, int):
+            return key // self.SEGMENT_SIZE
+        return zlib.crc32(key.encode()) % self.HASHED_SEGMENTS
+
+    def _segment_file_name(self, section: str, segment: int) -> str:
+        return os.path.join(self._directory, section, f"{segment:08d}.json")
+
+    @staticmethod
+    def _read_segment(file_name: str) -> list[dict]:
+        try:
+            with open(file_name, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _write_segment(file_name: str, entities: list[dict]) -> None:
+        temp_file_name = file_name + ".tmp"
+        with open(temp_file_name, "w") as f:
+            f.write(json.dumps(entities, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file_name, file_name)
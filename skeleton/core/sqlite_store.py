@@ -0,0 +1,172 @@
+import json
+import sqlite3
+from core.segmented_store import SECTION_KEYS
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trucks (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    capacity INTEGER NOT NULL,
+    max_range INTEGER NOT NULL,
+    assigned_route_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS routes (
+    id INTEGER PRIMARY KEY,
+    locations TEXT NOT NULL,
+    departure_time TEXT,
+    assigned_truck_id INTEGER,
+    assigned_package_ids TEXT NOT NULL,
+    load REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS packages (
+    id INTEGER PRIMARY KEY,
+    start_location TEXT NOT NULL,
+    end_location TEXT NOT NULL,
+    weight REAL NOT NULL,
+    customer_email TEXT NOT NULL,
+    departure_time TEXT,
+    estimated_arrival_time TEXT,
+    is_assigned INTEGER NOT NULL,
+    route_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS packages_is_assigned ON packages (is_assigned);
+CREATE TABLE IF NOT EXISTS employees (
+    username TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    password TEXT NOT NULL,
+    employee_role TEXT NOT NULL
+);
+"""
+
+_COLUMNS = {
+    "trucks": ("id", "name", "capacity", "max_range", "assigned_route_id"),
+    "routes": ("id", "locations", "departure_time", "assigned_truck_id", "assigned_package_ids", "load"),
+    "packages": ("id", "start_location", "end_location", "weight", "customer_email", "departure_time",
+                 "estimated_arrival_time", "is_assigned", "route_id"),
+    "employees": ("username", "first_name", "last_name", "password", "employee_role"),
+}
+
+
+class SqliteStore:
+    """
+    Keeps the application state in a local SQLite database, one table per section.
+
+    Rows are read and written in the dictionary format of `ApplicationData.to_json`, so the
+    store can be used wherever a saved state is expected. Packages are indexed by route,
+    by assignment status and by hub, so they can be loaded on demand instead of all at startup.
+
+    Attributes:
+        _connection (sqlite3.Connection): The open database connection.
+    """
+    def __init__(self, file_name: str):
+        """
+        Opens the database, creating the tables and indexes if they do not exist.
+
+        Args:
+            file_name (str): The path of the database file.
+        """
+        self._connection = sqlite3.connect(file_name)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the database holds no entities.
+
+        Returns:
+            bool: True if every table is empty, otherwise False.
+        """
+        return not any(self._connection.execute(f"SELECT 1 FROM {section} LIMIT 1").fetchone()
+                       for section in _COLUMNS)
+
+    def write(self, data: dict) -> None:
+        """
+        Inserts or replaces entities in a single transaction.
+
+        Args:
+            data (dict): The entities to write, in the format of `ApplicationData.to_json`.
+        """
+        with self._connection:
+            for section, entities in data.items():
+                columns = _COLUMNS[section]
+                self._connection.executemany(
+                    f"INSERT OR REPLACE INTO {section} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    [self._to_row(section, entity) for entity in entities])
+
+    def iter_section(self, section: str):
+        """
+        Reads all entities of a section.
+
+        Args:
+            section (str): The section to read: "trucks", "routes", "packages" or "employees".
+
+        Yields:
+            dict: The JSON representation of each entity, in the order of their keys.
+        """
+        for row in self._connection.execute(f"SELECT * FROM {section} ORDER BY {SECTION_KEYS[section]}"):
+            yield self._from_row(section, row)
+
+    def find(self, section: str, key) -> dict:
+        """
+        Reads one entity by its ID, or by its username for employees.
+
+        Args:
+            section (str): The section of the entity.
+            key (int | str): The ID or username of the entity.
+
+        Returns:
+            dict: The JSON representation of the entity, or `None` if it does not exist.
+        """
+        row = self._connection.execute(f"SELECT * FROM {section} WHERE {SECTION_KEYS[section]} = ?", (key,)).fetchone()
+        return self._from_row(section, row) if row is not None else None
+
+    def find_packages(self, is_assigned: bool):
+        """
+        Reads the packages with the given assignment status, using the `is_assigned` index.
+
+        Args:
+            is_assigned (bool): True for assigned packages, False for unassigned ones.
+
+        Yields:
+            dict: The JSON representation of each package, in the order of their IDs.
+        """
+        for row in self._connection.execute("SELECT * FROM packages WHERE is_assigned = ? ORDER BY id",
+                                            (int(is_assigned),)):
+            yield self._from_row("packages", row)
+
+    def max_id(self, section: str) -> int:
+        """
+        Gets the largest ID used in a section.
+
+        Args:
+            section (str): The section: "trucks", "routes" or "packages".
+
+        Returns:
+            int: The largest ID, or 0 if the section is empty.
+        """
+        return self._connection.execute(f"SELECT COALESCE(MAX(id), 0) FROM {section}").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+    @staticmethod
+    def _to_row(section: str, entity: dict) -> tuple:
+        row = [entity[column] for column in _COLUMNS[section]]
+        if section == "routes":
+            row[4] = json.dumps(row[4])
+        return tuple(row)
+
+    @staticmethod
+    def _from_row(section: str, row: sqlite3.Row) -> dict:
+        entity = dict(row)
+        if section == "routes":
+            entity["assigned_package_ids"] = json.loads(entity["assigned_package_ids"])
+        elif section == "packages":
+            entity["is_assigned"] = bool(entity["is_assigned"])
+        return entity
@@ -28,6 +28,9 @@ INITIAL_MENU = '''
 17. Show Route Info
 18. Show Routes
 19. Show All Trucks
+
+20. Dispatch Trucks to Routes
+21. Plan Route
 ------------------------------
 FOR EXIT TYPE "exit"
 ------------------------------
@@ -51,6 +54,11 @@ CREATE_ROUTE_MENU = '''
 CREATE ROUTE:
 ------------------------------
 '''
+PLAN_ROUTE_MENU = '''
+------------------------------
+PLAN ROUTE:
+------------------------------
+'''
 CREATE_PACKAGE_MENU = '''
 ------------------------------
 CREATE PACKAGE:
@@ -1,4 +1,43 @@
+import csv
+import sys
+from array import array
+from heapq import heappop, heappush
+from errors.application_error import ApplicationError
+
+
+NETWORK_FILE_NAME = "hubs.csv"
+
+
 class Distance:
+    """
+    Holds the road network between hubs and answers distance queries on it.
+
+    `DISTANCES` lists the direct road between every pair of connected hubs. It defaults to the
+    seven Australian hubs below and can be replaced with a larger network loaded from a CSV file
+    by `load_network()`. On top of it the
+    class keeps an all-pairs shortest-path table, stored as flat arrays indexed by integer hub
+    IDs, so the shortest distance and the next hop between any two hubs are O(1) reads. Each
+    row of the table is filled by a single Dijkstra run the first time a hub is used as a
+    source, and `build_shortest_paths()` fills every row at once.
+
+    Hub names are interned to IDs when a hub is first validated, while the table itself is
+    allocated only by the first distance or next-hop query, so validating hubs of a large
+    network does not pay for the table.
+
+    Attributes:
+        DISTANCES (dict): The direct distance in kilometers between connected hubs.
+        UNREACHABLE (int): The distance and next hop stored for hubs that cannot be reached, a 32-bit -1.
+        _interned_distances (dict): The `DISTANCES` dict the hub IDs were built for.
+        _table_distances (dict): The `DISTANCES` dict the shortest-path table was allocated for.
+        _hubs (tuple[str]): The hub names, indexed by hub ID.
+        _hub_ids (dict[str, int]): The hub ID of every hub name.
+        _adjacency (list[list[tuple[int, int]]]): The (neighbour ID, distance) pairs of every hub.
+        _shortest_distances (array): The shortest distance for every (source, target) pair, row by row.
+        _next_hops (array): The first hub after the source on every shortest path, row by row.
+        _built_rows (bytearray): Marks the sources whose row is already calculated.
+    """
+
+    UNREACHABLE = -1
 
     DISTANCES = {
         "SYD": {
@@ -62,14 +101,247 @@ class Distance:
     @classmethod
     def get_distance(cls, city_1: str, city_2: str) -> int:
         """
-        Retrieves the distance between two cities from a pre-defined JSON file.
+        Retrieves the distance between two cities.
+
+        Uses the direct road between the cities when there is one, otherwise the shortest path
+        through the network.
 
         Parameters:
         - `city_1` (str): The name of the starting city.
         - `city_2` (str): The name of the destination city.
 
         Returns:
-        - `float | int`: The distance between `city_1` and `city_2` as stored in the JSON file.
+        - `int`: The distance between `city_1` and `city_2`, or `UNREACHABLE` if there is no path.
+        """
+        distance = cls.DISTANCES.get(city_1, {}).get(city_2)
+        if distance is None:
+            return cls.get_shortest_distance(city_1, city_2)
+        return distance
+
+    @classmethod
+    def is_hub(cls, city: str) -> bool:
+        """
+        Checks whether a city is a hub of the network.
+
+        Args:
+            city (str): The name of the city.
+
+        Returns:
+            bool: True if the city is a hub, otherwise False.
+        """
+        if cls._interned_distances is not cls.DISTANCES:
+            cls._intern_hubs()
+        return city in cls._hub_ids
+
+    @classmethod
+    def load_network(cls, file_name: str = NETWORK_FILE_NAME) -> bool:
+        """
+        Replaces the hub network with the one stored in a CSV file.
+
+        Each row of the file holds two hub names and the distance between them in kilometers,
+        e.g. `SYD,MEL,877`. Roads are two-way, so every row is added in both directions.
+        Blank rows are skipped, and so is a header row, e.g. `from,to,distance`.
+        Hub names are interned, and the shortest-path table is rebuilt lazily on first use.
+
+        Args:
+            file_name (str): The path of the CSV file.
+
+        Returns:
+            bool: True if the network was loaded, False if the file does not exist.
+
+        Raises:
+            ApplicationError: If a row does not hold two hub names and a non-negative whole distance.
+        """
+        try:
+            with open(file_name, "r", newline="") as f:
+                distances = {}
+                reader = csv.reader(f)
+                is_first_row = True
+                for row in reader:
+                    cells = [cell.strip() for cell in row]
+                    if not any(cells):
+                        continue
+                    if len(cells) != 3 or not cells[0] or not cells[1] or not cells[2].isdigit():
+                        if is_first_row and len(cells) == 3:
+                            is_first_row = False
+                            continue
+                        raise ApplicationError(f"Invalid road on line {reader.line_num} of {file_name}: "
+                                               f"'{','.join(row)}'. Expected hub,hub,distance in kilometers.")
+                    is_first_row = False
+                    city_1, city_2, distance = sys.intern(cells[0]), sys.intern(cells[1]), int(cells[2])
+                    distances.setdefault(city_1, {})[city_2] = distance
+                    distances.setdefault(city_2, {})[city_1] = distance
+        except FileNotFoundError:
+            return False
+
+        cls.DISTANCES = distances
+        return True
+
+    _interned_distances = None
+    _table_distances = None
+    _hubs = None
+    _hub_ids = None
+    _adjacency = None
+    _shortest_distances = None
+    _next_hops = None
+    _built_rows = None
+
+    @classmethod
+    def hub_id(cls, city: str) -> int:
+        """
+        Gets the integer ID of a hub.
+
+        Args:
+            city (str): The name of the hub.
+
+        Returns:
+            int: The ID of the hub.
+        """
+        if cls._interned_distances is not cls.DISTANCES:
+            cls._intern_hubs()
+        return cls._hub_ids[city]
+
+    @classmethod
+    def get_shortest_distance(cls, city_1: str, city_2: str) -> int:
+        """
+        Gets the length of the shortest path between two hubs.
+
+        Args:
+            city_1 (str): The name of the starting hub.
+            city_2 (str): The name of the destination hub.
+
+        Returns:
+            int: The shortest distance in kilometers, or `UNREACHABLE` if there is no path.
         """
-        return cls.DISTANCES[city_1][city_2]
+        index = cls._table_index(city_1, city_2)
+        return cls._shortest_distances[index]
+
+    @classmethod
+    def get_next_hop(cls, city_1: str, city_2: str) -> str:
+        """
+        Gets the first hub to travel to on the shortest path between two hubs.
+
+        Args:
+            city_1 (str): The name of the starting hub.
+            city_2 (str): The name of the destination hub.
+
+        Returns:
+            str: The next hub, or `None` if `city_2` cannot be reached or equals `city_1`.
+        """
+        index = cls._table_index(city_1, city_2)
+        next_hop = cls._next_hops[index]
+        if next_hop == cls.UNREACHABLE or city_1 == city_2:
+            return None
+        return cls._hubs[next_hop]
+
+    @classmethod
+    def get_shortest_path(cls, city_1: str, city_2: str) -> list[str]:
+        """
+        Gets the hubs visited on the shortest path between two hubs, including both ends.
+
+        Args:
+            city_1 (str): The name of the starting hub.
+            city_2 (str): The name of the destination hub.
+
+        Returns:
+            list[str]: The hubs on the path, or an empty list if there is no path.
+        """
+        if cls.get_shortest_distance(city_1, city_2) == cls.UNREACHABLE:
+            return []
+
+        path = [city_1]
+        while path[-1] != city_2:
+            path.append(cls.get_next_hop(path[-1], city_2))
+        return path
+
+    @classmethod
+    def build_shortest_paths(cls) -> None:
+        """
+        Calculates every row of the shortest-path table up front.
+        """
+        cls._allocate_table()
+        for source in range(len(cls._hubs)):
+            if not cls._built_rows[source]:
+                cls._build_row(source)
+
+    @classmethod
+    def _table_index(cls, city_1: str, city_2: str) -> int:
+        """
+        Gets the position of a (source, target) pair in the shortest-path table,
+        calculating the source row first if needed.
+        """
+        cls._allocate_table()
+        source = cls._hub_ids[city_1]
+        if not cls._built_rows[source]:
+            cls._build_row(source)
+        return source * len(cls._hubs) + cls._hub_ids[city_2]
+
+    @classmethod
+    def _intern_hubs(cls) -> None:
+        """
+        Assigns integer IDs to the hubs in `DISTANCES`.
+
+        Runs again automatically whenever `DISTANCES` is replaced.
+        """
+        cls._interned_distances = cls.DISTANCES
+        hubs = list(cls.DISTANCES)
+        for neighbours in cls.DISTANCES.values():
+            hubs.extend(hub for hub in neighbours if hub not in cls.DISTANCES)
+        cls._hubs = tuple(dict.fromkeys(hubs))
+        cls._hub_ids = {hub: hub_id for hub_id, hub in enumerate(cls._hubs)}
+
+    @classmethod
+    def _allocate_table(cls) -> None:
+        """
+        Lists the neighbours of every hub in `DISTANCES` and allocates an empty shortest-path table,
+        unless they are ready already.
+
+        Runs again automatically whenever `DISTANCES` is replaced.
+        """
+        if cls._table_distances is cls.DISTANCES:
+            return
+        if cls._interned_distances is not cls.DISTANCES:
+            cls._intern_hubs()
+        cls._table_distances = cls.DISTANCES
+
+        cls._adjacency = [[] for _ in cls._hubs]
+        for hub, neighbours in cls.DISTANCES.items():
+            cls._adjacency[cls._hub_ids[hub]] = [(cls._hub_ids[neighbour], distance)
+                                                 for neighbour, distance in neighbours.items()]
+
+        hubs_count = len(cls._hubs)
+        # Distances and hub IDs fit in 32 bits, so the tables use 4-byte items, with -1 for UNREACHABLE.
+        cls._shortest_distances = array("i", [cls.UNREACHABLE]) * (hubs_count * hubs_count)
+        cls._next_hops = array("i", [cls.UNREACHABLE]) * (hubs_count * hubs_count)
+        cls._built_rows = bytearray(hubs_count)
+
+    @classmethod
+    def _build_row(cls, source: int) -> None:
+        """
+        Fills the shortest-path table row of one hub with a Dijkstra run.
+
+        Args:
+            source (int): The ID of the hub the paths start from.
+        """
+        offset = source * len(cls._hubs)
+        distances = cls._shortest_distances
+        next_hops = cls._next_hops
+
+        distances[offset + source] = 0
+        next_hops[offset + source] = source
+        queue = [(0, source, source)]
+        visited = set()
+        while queue:
+            distance, hub, next_hop = heappop(queue)
+            if hub in visited:
+                continue
+            visited.add(hub)
+            for neighbour, edge in cls._adjacency[hub]:
+                candidate = distance + edge
+                current = distances[offset + neighbour]
+                if current == cls.UNREACHABLE or candidate < current:
+                    distances[offset + neighbour] = candidate
+                    next_hops[offset + neighbour] = neighbour if hub == source else next_hop
+                    heappush(queue, (candidate, neighbour, next_hops[offset + neighbour]))
 
+        cls._built_rows[source] = 1
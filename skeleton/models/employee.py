@@ -1,8 +1,9 @@
 from models.constants.employee_role import EmployeeRole
+from models.tracked_entity import TrackedEntity
 from interface_menu import TABLE_SEP, ROW_SEP
 
 
-class Employee:
+class Employee(TrackedEntity):
     """
     Represents an employee with a username, first name, last name, password, and role.
 
@@ -99,6 +100,28 @@ class Employee:
 
         return employee
 
+    @classmethod
+    def restore(cls, data: dict):
+        """
+        Creates an Employee instance from a saved JSON-compatible dictionary without validating it again.
+
+        Saved employees were validated when they were created, so the fields are set directly.
+
+        Args:
+            data (dict): A dictionary containing employee details, as written by `to_json`.
+
+        Returns:
+            Employee: An instance of the Employee class.
+        """
+        employee = cls.__new__(cls)
+        employee._username = data["username"]
+        employee._first_name = data["first_name"]
+        employee._last_name = data["last_name"]
+        employee._password = data["password"]
+        employee._employee_role = data["employee_role"]
+
+        return employee
+
     def to_json(self) -> dict:
         """
         Converts the Employee instance into a JSON-compatible dictionary.
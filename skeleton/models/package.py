@@ -1,13 +1,14 @@
 import re
 from datetime import datetime
 from errors.application_error import ApplicationError
-from core.application_time import ApplicationTime
+from core.application_time import ApplicationTime, parse_saved_time
 from commands.validation_helpers import try_parse_float
-from models.route import Route
+from models.constants.distances import Distance
+from models.tracked_entity import TrackedEntity
 from interface_menu import TABLE_SEP, ROW_SEP
 
 
-class Package:
+class Package(TrackedEntity):
     """
     Represents a package with details such as start and end locations, weight, customer email,
     and tracking information like departure time, estimated arrival time, and assignment status.
@@ -33,6 +34,16 @@ class Package:
         cls._current_id += 1
         return cls._current_id
 
+    @classmethod
+    def ensure_id_above(cls, used_id: int) -> None:
+        """
+        Makes sure that IDs generated from now on are greater than an ID that is already in use.
+
+        Args:
+            used_id (int): The largest package ID that is already in use.
+        """
+        cls._current_id = max(cls._current_id, used_id)
+
 
     def __init__(self, start_location: str, end_location: str, weight: float, customer_email: str):
         """
@@ -50,11 +61,11 @@ class Package:
         """
         self._id = Package.next_id()
 
-        if start_location not in Route.CITIES:
+        if not Distance.is_hub(start_location):
             raise ValueError("Start location does not exist")
         self._start_location = start_location
 
-        if end_location not in Route.CITIES:
+        if not Distance.is_hub(end_location):
             raise ValueError("End location does not exist")
         if start_location == end_location:
             raise ApplicationError("Start location can not be the same as End location")
@@ -97,8 +108,39 @@ class Package:
         package._estimated_arrival_time = (
             datetime.fromisoformat(data["estimated_arrival_time"]) if data["estimated_arrival_time"] else None
         )
+        package._id = data.get("id", package._id)
+        package._is_assigned = data["is_assigned"]
+        package._route_id = data["route_id"]
+
+        return package
+
+    @classmethod
+    def restore(cls, data: dict):
+        """
+        Creates a Package instance from a saved JSON-compatible dictionary without validating it again.
+
+        Saved packages were validated when they were created, so the fields are set directly.
+        The ID counter is moved past the restored ID, so new packages never reuse it.
+
+        Args:
+            data (dict): A dictionary containing package details, as written by `to_json`.
+
+        Returns:
+            Package: An instance of the Package class.
+        """
+        package = cls.__new__(cls)
+        package._id = data["id"]
+        package._start_location = data["start_location"]
+        package._end_location = data["end_location"]
+        package._weight = data["weight"]
+        package._customer_email = data["customer_email"]
+        package._departure_time = parse_saved_time(data["departure_time"])
+        package._estimated_arrival_time = parse_saved_time(data["estimated_arrival_time"])
         package._is_assigned = data["is_assigned"]
         package._route_id = data["route_id"]
+        # Inlined `ensure_id_above`, since this runs once for every saved package.
+        if package._id > cls._current_id:
+            cls._current_id = package._id
 
         return package
 
@@ -190,6 +232,7 @@ class Package:
             value (datetime): The departure time to set.
         """
         self._departure_time = value
+        self._mark_changed()
 
     @property
     def estimated_arrival_time(self) -> datetime:
@@ -210,6 +253,7 @@ class Package:
             value (datetime): The estimated arrival time to set.
         """
         self._estimated_arrival_time = value
+        self._mark_changed()
 
     @property
     def is_assigned(self) -> bool:
@@ -230,6 +274,7 @@ class Package:
             value (bool): True if the package is assigned, False otherwise.
         """
         self._is_assigned = value
+        self._mark_changed()
 
     @property
     def route_id(self) -> int:
@@ -250,6 +295,7 @@ class Package:
             value (int): The route ID to set.
         """
         self._route_id = value
+        self._mark_changed()
 
     def __str__(self) -> str:
         """
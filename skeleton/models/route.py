@@ -1,18 +1,22 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from core.application_time import ApplicationTime
+from core.application_time import ApplicationTime, parse_saved_time
 from errors.application_error import ApplicationError
 from models.constants.distances import Distance
+from models.tracked_entity import TrackedEntity
 from models.truck import Truck
 from interface_menu import TABLE_SEP, ROW_SEP
 
 
-class Route:
+class Route(TrackedEntity):
     """
     Represents a delivery route with multiple stops, including details such as locations,
     departure time, assigned truck, packages, and estimated arrival times.
 
+    Assigned package IDs are kept in an insertion-ordered dictionary used as a set,
+    so adding, removing and checking a package are constant-time.
+
     Attributes:
-        CITIES (list): A list of valid cities for the route, derived from `Distance.DISTANCES`.
         AVERAGE_SPEED (int): The average speed of the truck in kilometers per hour.
         LOCATIONS_SEPARATOR (str): The separator used to split locations in the input string.
         REQUIRED_DATE_FORMAT (str): The required format for the departure time string.
@@ -20,9 +24,14 @@ class Route:
         STATUS_IN_PROGRESS (str): Status indicating the route is currently in progress.
         STATUS_FINISHED (str): Status indicating the route has been completed.
         _current_id (int): A class-level counter for generating unique route IDs.
+        _restored_distances (OrderedDict[str, tuple[tuple, tuple]]): The stops and cumulative distances
+                                                                     of restored routes, by their locations
+                                                                     string, least recently used first.
+        _restored_distances_network (dict): The `Distance.DISTANCES` network `_restored_distances` was
+                                            calculated on.
+        _RESTORED_DISTANCES_LIMIT (int): The number of locations strings kept in `_restored_distances`.
     """
 
-    CITIES = list(Distance.DISTANCES)
     AVERAGE_SPEED = 87
     LOCATIONS_SEPARATOR = ","
     REQUIRED_DATE_FORMAT = "%Y-%m-%d %H:%M"
@@ -32,6 +41,9 @@ class Route:
     STATUS_FINISHED = "Finished"
 
     _current_id = 0
+    _restored_distances: OrderedDict[str, tuple[tuple, tuple]] = OrderedDict()
+    _restored_distances_network = None
+    _RESTORED_DISTANCES_LIMIT = 4096
 
     @classmethod
     def next_id(cls) -> int:
@@ -44,6 +56,16 @@ class Route:
         cls._current_id += 1
         return cls._current_id
 
+    @classmethod
+    def ensure_id_above(cls, used_id: int) -> None:
+        """
+        Makes sure that IDs generated from now on are greater than an ID that is already in use.
+
+        Args:
+            used_id (int): The largest route ID that is already in use.
+        """
+        cls._current_id = max(cls._current_id, used_id)
+
     def __init__(self, locations: str, departure_time: str):
         """
         Initializes a Route instance with the provided locations and departure time.
@@ -61,11 +83,8 @@ class Route:
         self._id = Route.next_id()
         self._assigned_truck_id = None
         self.assigned_truck_capacity = None
-        self._assigned_packages_ids = []
+        self._assigned_packages_ids: dict[int, None] = {}
         self.load = 0
-        self._stops = {}
-        if isinstance(self._locations, list):
-            self.calculating_estimated_arrival_times()
 
     @classmethod
     def from_json(cls, data: dict):
@@ -86,9 +105,54 @@ class Route:
         route._departure_time = (
             datetime.fromisoformat(data["departure_time"]) if data["departure_time"] else None
         )
+        route._stops = None
+        route._assigned_truck_id = data.get("assigned_truck_id", None)
+        route._assigned_packages_ids = dict.fromkeys(data.get("assigned_package_ids", []))
+        route._load = data.get("load", 0)
+
+        return route
+
+    @classmethod
+    def restore(cls, data: dict):
+        """
+        Creates a Route instance from a saved dictionary without validating it again.
+
+        The locations are split without checking the hubs, and the departure time is not compared
+        with the current time, since a saved route may already have departed. Routes that visit the
+        same hubs share their cumulative distances, which are calculated once per distinct list of
+        locations. The shared distances are dropped when the hub network is replaced, and once
+        `_RESTORED_DISTANCES_LIMIT` lists of locations are kept, the least recently used one is
+        dropped for each new one. The ID counter is moved past the restored ID, so new routes never
+        reuse it.
+
+        Args:
+            data (dict): Route details, as written by `to_json`.
+
+        Returns:
+            Route: A new Route instance.
+        """
+        route = cls.__new__(cls)
+        route._id = data["id"]
+        locations = data["locations"]
+        if cls._restored_distances_network is not Distance.DISTANCES:
+            cls._restored_distances = OrderedDict()
+            cls._restored_distances_network = Distance.DISTANCES
+        if locations in cls._restored_distances:
+            cls._restored_distances.move_to_end(locations)
+        else:
+            if len(cls._restored_distances) >= cls._RESTORED_DISTANCES_LIMIT:
+                cls._restored_distances.popitem(last=False)
+            hubs = tuple(locations.split(cls.LOCATIONS_SEPARATOR))
+            cls._restored_distances[locations] = (hubs, cls._calculate_cumulative_distances(hubs))
+        route._locations, route._cumulative_distances = cls._restored_distances[locations]
+        route._departure_time = parse_saved_time(data["departure_time"])
+        route._stops = None
         route._assigned_truck_id = data.get("assigned_truck_id", None)
-        route._assigned_packages_ids = data.get("assigned_package_ids", [])
+        route.assigned_truck_capacity = None
+        route._assigned_packages_ids = dict.fromkeys(data.get("assigned_package_ids", []))
         route._load = data.get("load", 0)
+        if route._id > cls._current_id:
+            cls._current_id = route._id
 
         return route
 
@@ -103,9 +167,9 @@ class Route:
             "departure_time": self._departure_time.isoformat() if self._departure_time else None,
             "id": self._id,
             "assigned_truck_id": self._assigned_truck_id,
-            "assigned_package_ids": self._assigned_packages_ids,
+            "assigned_package_ids": list(self._assigned_packages_ids),
             "load": self._load,
-            "stops": {loc: time.isoformat() for loc, time in self._stops.items()}
+            "stops": {loc: time.isoformat() for loc, time in self.stops.items()}
         }
 
     @property
@@ -116,7 +180,7 @@ class Route:
         Returns:
             tuple: A tuple of location names.
         """
-        return tuple(self._locations)
+        return self._locations
 
     @locations.setter
     def locations(self, value: str) -> None:
@@ -137,7 +201,7 @@ class Route:
         value = value.split(Route.LOCATIONS_SEPARATOR)
 
         for location in value:
-            if location not in Route.CITIES:
+            if not Distance.is_hub(location):
                 raise ApplicationError(f"Invalid location: {location}")
 
         for i in range(len(value)-1):
@@ -147,7 +211,10 @@ class Route:
         if len(value) < 2:
             raise ApplicationError("Too few locations!")
 
-        self._locations = value
+        self._locations = tuple(value)
+        self._cumulative_distances = Route._calculate_cumulative_distances(self._locations)
+        self._stops = None
+        self._mark_changed()
 
     @property
     def departure_time(self) -> datetime:
@@ -175,6 +242,8 @@ class Route:
             if departure_time < ApplicationTime.current():
                 raise ApplicationError("Departure time must be in the future!")
             self._departure_time = departure_time
+            self._stops = None
+            self._mark_changed()
         except ValueError:
             raise ApplicationError(f"Departure time {value} "
                                    f"does not match the format {Route.REQUIRED_DATE_FORMAT}")
@@ -207,6 +276,7 @@ class Route:
             value (Truck): The truck to assign to the route.
         """
         self._assigned_truck_id = value
+        self._mark_changed()
 
     @property
     def assigned_packages_ids(self) -> tuple:
@@ -218,6 +288,18 @@ class Route:
         """
         return tuple(self._assigned_packages_ids)
 
+    def has_package(self, package_id: int) -> bool:
+        """
+        Checks whether a package is assigned to the route.
+
+        Args:
+            package_id (int): The ID of the package to check.
+
+        Returns:
+            bool: True if the package is assigned to the route, otherwise False.
+        """
+        return package_id in self._assigned_packages_ids
+
     @property
     def load(self) -> int:
         """
@@ -237,30 +319,67 @@ class Route:
             value (int): The total load weight in kilograms.
         """
         self._load = value
+        self._mark_changed()
 
     @property
     def stops(self) -> dict:
         """
         Gets the estimated arrival times for each stop along the route.
 
+        The schedule is calculated on first access and cached until `locations`
+        or `departure_time` change.
+
         Returns:
             dict: A dictionary mapping location names to estimated arrival times.
         """
-        self.calculating_estimated_arrival_times()
+        if self._stops is None:
+            self.calculating_estimated_arrival_times()
         return self._stops
 
     @property
     def distance(self) -> int:
         """
-         Calculates the total distance of the route.
+         Gets the total distance of the route.
 
          Returns:
              float: The total distance in kilometers.
          """
-        distance = 0
-        for i in range(len(self.locations)-1):
-            distance += Distance.get_distance(self.locations[i], self.locations[i + 1])
-        return distance
+        return self._cumulative_distances[-1]
+
+    def distance_between(self, start_index: int, end_index: int) -> int:
+        """
+        Gets the distance travelled between two stops of the route.
+
+        Args:
+            start_index (int): The position of the first stop in `locations`.
+            end_index (int): The position of the second stop in `locations`.
+
+        Returns:
+            int: The distance in kilometers between the two stops.
+        """
+        return self._cumulative_distances[end_index] - self._cumulative_distances[start_index]
+
+    @staticmethod
+    def _calculate_cumulative_distances(locations: tuple) -> tuple:
+        """
+        Calculates the distance from the first stop to every stop of the route.
+
+        Args:
+            locations (tuple): The stops of the route.
+
+        Returns:
+            tuple: The cumulative distance in kilometers at each stop, starting with 0.
+
+        Raises:
+            ApplicationError: If two consecutive stops are not connected.
+        """
+        cumulative_distances = [0]
+        for i in range(len(locations)-1):
+            distance = Distance.get_distance(locations[i], locations[i + 1])
+            if distance == Distance.UNREACHABLE:
+                raise ApplicationError(f"No road between {locations[i]} and {locations[i + 1]}")
+            cumulative_distances.append(cumulative_distances[-1] + distance)
+        return tuple(cumulative_distances)
 
     @property
     def estimated_arrival_time(self) -> datetime:
@@ -280,9 +399,10 @@ class Route:
         Returns:
             str: The current status of the route (`STATUS_CREATED`, `STATUS_IN_PROGRESS`, or `STATUS_FINISHED`).
         """
-        if ApplicationTime.current() < self.departure_time:
+        current_time = ApplicationTime.current()
+        if current_time < self.departure_time:
             return Route.STATUS_CREATED
-        if ApplicationTime.current() > self.estimated_arrival_time:
+        if current_time > self.estimated_arrival_time:
             return Route.STATUS_FINISHED
         else:
             return Route.STATUS_IN_PROGRESS
@@ -295,9 +415,10 @@ class Route:
         Returns:
             str: The last known location, or the start location if no stops have been reached.
         """
+        current_time = ApplicationTime.current()
         last_stop = self.locations[0]
         for stop in self.stops:
-            if ApplicationTime.current() > self.stops[stop]:
+            if current_time > self.stops[stop]:
                 last_stop = stop
             else:
                 break
@@ -309,24 +430,25 @@ class Route:
 
         Assigns the departure time to the first location in `self.locations`.
         Iterates through each subsequent location, estimating the arrival time based on:
-          - The distance between consecutive locations (retrieved via `Location.get_distance`).
+          - The distance between consecutive locations (precomputed when the locations are set).
           - The average speed defined by `Route.AVERAGE_SPEED`.
-        Updates `self._stops` with the computed arrival times, rounded to the nearest minute.
+        Replaces `self._stops` with the computed arrival times, which `stops` then serves
+        until the locations or departure time change.
 
-        Uses `replace(second=0, microsecond=0)` to ensure arrival times do not include seconds or microseconds.
-        The method does not return anything; it updates `self._stops` in place.
+        The method does not return anything.
         """
-        self._stops[self.locations[0]] = self.departure_time
-        estimated_arrival_time = self.departure_time
-        for i in range(len(self.locations)-1):
-            previous_location = self.locations[i]
-            location = self.locations[i+1]
+        locations = self._locations
+        estimated_arrival_time = self._departure_time
+        stops = {locations[0]: estimated_arrival_time}
+        for i in range(len(locations)-1):
+            location = locations[i+1]
 
-            distance = Distance.get_distance(previous_location, location)
+            distance = self.distance_between(i, i + 1)
             time_needed = timedelta(hours=distance/Route.AVERAGE_SPEED)
             estimated_arrival_time += time_needed
 
-            self._stops[location] = estimated_arrival_time
+            stops[location] = estimated_arrival_time
+        self._stops = stops
 
     def assign_package(self, package_id: int) -> None:
         """
@@ -335,7 +457,8 @@ class Route:
         Args:
             package_id (int): The ID of the package to assign.
         """
-        self._assigned_packages_ids.append(package_id)
+        self._assigned_packages_ids[package_id] = None
+        self._mark_changed()
 
     def remove_package(self, package_id: int) -> None:
         """
@@ -344,7 +467,8 @@ class Route:
         Args:
             package_id (int): The ID of the package to remove.
         """
-        self._assigned_packages_ids.remove(package_id)
+        del self._assigned_packages_ids[package_id]
+        self._mark_changed()
 
     def assign_truck(self, truck_id: int) -> None:
         """
@@ -354,6 +478,7 @@ class Route:
             truck_id (int): The ID of the truck to assign.
         """
         self._assigned_truck_id = truck_id
+        self._mark_changed()
 
     def __str__(self):
         """
@@ -0,0 +1,25 @@
+class TrackedEntity:
+    """
+    Base class for entities that report their changes, so that only changed entities are saved.
+
+    Setters of persisted attributes call `_mark_changed`, which notifies the callback registered
+    with `track_changes`. Entities that are not registered with the application data have no
+    callback and changing them has no side effects.
+
+    Attributes:
+        _on_change (Callable[[TrackedEntity], None]): The callback notified of changes, if any.
+    """
+    _on_change = None
+
+    def track_changes(self, on_change) -> None:
+        """
+        Registers the callback notified whenever the entity changes.
+
+        Args:
+            on_change (Callable[[TrackedEntity], None]): A function that receives the changed entity.
+        """
+        self._on_change = on_change
+
+    def _mark_changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change(self)
@@ -1,4 +1,7 @@
-class Truck:
+from models.tracked_entity import TrackedEntity
+
+
+class Truck(TrackedEntity):
     """Represents a delivery truck.
 
     A Truck has a unique ID, a name, capacity, and a maximum range.
@@ -26,6 +29,16 @@ class Truck:
         cls._current_id += 1
         return cls._current_id
 
+    @classmethod
+    def ensure_id_above(cls, used_id: int) -> None:
+        """
+        Makes sure that IDs generated from now on are greater than an ID that is already in use.
+
+        Args:
+            used_id (int): The largest truck ID that is already in use.
+        """
+        cls._current_id = max(cls._current_id, used_id)
+
     def __init__(self, name: str, capacity: int, max_range: int):
         """Initialize a Truck instance.
 
@@ -60,6 +73,29 @@ class Truck:
 
         return truck
 
+    @classmethod
+    def restore(cls, data):
+        """Create a Truck instance from a saved dictionary without drawing a new ID.
+
+        The ID counter is moved past the restored ID, so new trucks never reuse it.
+
+        Args:
+            data (dict): Truck details, as written by `to_json`.
+
+        Returns:
+            Truck: A new Truck instance.
+        """
+        truck = cls.__new__(cls)
+        truck._id = data["id"]
+        truck._name = data["name"]
+        truck._capacity = data["capacity"]
+        truck._max_range = data["max_range"]
+        truck._assigned_route_id = data["assigned_route_id"]
+        if truck._id > cls._current_id:
+            cls._current_id = truck._id
+
+        return truck
+
     def to_json(self) -> dict:
         """Convert the Truck instance into a dictionary.
 
@@ -127,6 +163,7 @@ class Truck:
             value (int): The route ID to assign to the truck.
         """
         self._assigned_route_id = value
+        self._mark_changed()
 
     def is_suitable(self, route) -> bool:
         """
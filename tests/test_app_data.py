@@ -1,7 +1,10 @@
 import unittest
+from datetime import datetime
 import test_data as td
+from core.application_time import ApplicationTime
 from errors.application_error import ApplicationError
 from core.application_data import ApplicationData
+from core.read_only_view import ReadOnlyView
 from models.employee import Employee
 from models.package import Package
 from models.route import Route
@@ -13,12 +16,22 @@ class ApplicationData_Should(unittest.TestCase):
     def test_init(self):
         app_data = ApplicationData()
 
-        self.assertIsInstance(app_data.trucks, tuple)
-        self.assertIsInstance(app_data.routes, tuple)
-        self.assertIsInstance(app_data.packages, tuple)
-        self.assertIsInstance(app_data.employees, tuple)
+        self.assertIsInstance(app_data.trucks, ReadOnlyView)
+        self.assertIsInstance(app_data.routes, ReadOnlyView)
+        self.assertIsInstance(app_data.packages, ReadOnlyView)
+        self.assertIsInstance(app_data.employees, ReadOnlyView)
         self.assertIsNone(app_data.logged_in_employee)
 
+    def test_collection_views_areLiveAndReadOnly(self):
+        app_data = ApplicationData()
+        packages = app_data.packages
+        package = app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, td.VALID_WEIGHT,
+                                          td.VALID_CUSTOMER_EMAIL)
+
+        self.assertIn(package, packages)
+        self.assertEqual([package], list(packages))
+        self.assertFalse(hasattr(packages, "append"))
+
     def test_logged_in_employee_returnsCorrectly(self):
         app_data = ApplicationData()
         employee = Employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME, td.VALID_PASSWORD,
@@ -48,6 +61,31 @@ class ApplicationData_Should(unittest.TestCase):
         self.assertIsInstance(app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT), Route)
         self.assertEqual(1, len(app_data.routes))
 
+    def test_plan_route_createsRouteInShortestOrder(self):
+        app_data = ApplicationData()
+        route = app_data.plan_route(["MEL", "BRI", "SYD"], td.VALID_DEPARTURE_TIME_INPUT, start_location="MEL")
+
+        self.assertEqual(("MEL", "SYD", "BRI"), route.locations)
+        self.assertIs(route, app_data.find_route_by_id(route.id))
+
+    def test_plan_route_invalidDepartureTime(self):
+        app_data = ApplicationData()
+        with self.assertRaises(ApplicationError):
+            app_data.plan_route(["MEL", "SYD"], td.INVALID_DEPARTURE_TIME_INPUT)
+
+    def test_changes_to_json_includesEntitiesChangedBySetters(self):
+        app_data = ApplicationData()
+        package = app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, td.VALID_WEIGHT,
+                                          td.VALID_CUSTOMER_EMAIL)
+        app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        app_data.clear_changes()
+
+        package.route_id = 5
+
+        changes = app_data.changes_to_json()
+        self.assertEqual([package.to_json()], changes["packages"])
+        self.assertEqual([], changes["routes"])
+
     def test_find_package_by_id_whenNoPackages(self):
         app_data = ApplicationData()
         self.assertIsNone(app_data.find_package_by_id(td.INVALID_PACKAGE_ID))
@@ -87,9 +125,19 @@ class ApplicationData_Should(unittest.TestCase):
     def test_find_truck_by_id_returnsCorrectly(self):
         app_data = ApplicationData()
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
-        app_data._trucks.append(truck)
+        app_data._add_truck(truck)
         self.assertEqual(truck, app_data.find_truck_by_id(truck.id))
 
+    def test_from_json_registersEntitiesById(self):
+        truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+        route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        data = {"trucks": [truck.to_json()], "routes": [route.to_json()], "packages": [], "employees": []}
+
+        app_data = ApplicationData.from_json(data)
+
+        self.assertEqual(truck.id, app_data.find_truck_by_id(truck.id).id)
+        self.assertEqual(route.id, app_data.find_route_by_id(route.id).id)
+
     def test_create_employee_whenUsernameExists(self):
         app_data = ApplicationData()
         with self.assertRaises(ApplicationError):
@@ -109,9 +157,21 @@ class ApplicationData_Should(unittest.TestCase):
         app_data = ApplicationData()
         employee = Employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME, td.VALID_PASSWORD,
                             td.VALID_EMPLOYEE_ROLE)
-        app_data._employees.append(employee)
+        app_data._add_employee(employee)
         self.assertEqual(employee, app_data.find_employee_by_username(td.VALID_USERNAME))
 
+    def test_find_employee_by_username_afterFromJson(self):
+        employee = Employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME, td.VALID_PASSWORD,
+                            td.VALID_EMPLOYEE_ROLE)
+        data = {"trucks": [], "routes": [], "packages": [], "employees": [employee.to_json()]}
+
+        app_data = ApplicationData.from_json(data)
+
+        self.assertEqual(td.VALID_USERNAME, app_data.find_employee_by_username(td.VALID_USERNAME).username)
+        with self.assertRaises(ApplicationError):
+            app_data.create_employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME, td.VALID_PASSWORD,
+                                     td.VALID_EMPLOYEE_ROLE)
+
     def test_login_assignsCorrectly(self):
         app_data = ApplicationData()
         employee = Employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME, td.VALID_PASSWORD,
@@ -145,8 +205,8 @@ class ApplicationData_Should(unittest.TestCase):
                                        td.VALID_CUSTOMER_EMAIL)
         assigned_package = Package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, td.VALID_WEIGHT,
                                    td.VALID_CUSTOMER_EMAIL)
-        app_data._packages.append(assigned_package)
-        app_data._routes.append(route)
+        app_data._add_package(assigned_package)
+        app_data._add_route(route)
         app_data.assign_package_to_route(assigned_package.id, route.id)
         self.assertEqual([assigned_package], app_data.get_packages_by_assigned_status(True))
 
@@ -156,13 +216,24 @@ class ApplicationData_Should(unittest.TestCase):
                                        td.VALID_CUSTOMER_EMAIL)
         assigned_package = Package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, td.VALID_WEIGHT,
                                    td.VALID_CUSTOMER_EMAIL)
-        app_data._packages.append(assigned_package)
-        app_data._packages.append(not_assigned_package)
+        app_data._add_package(assigned_package)
+        app_data._add_package(not_assigned_package)
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
-        app_data._routes.append(route)
+        app_data._add_route(route)
         app_data.assign_package_to_route(assigned_package.id, route.id)
         self.assertEqual([not_assigned_package], app_data.get_packages_by_assigned_status(False))
 
+    def test_get_packages_by_assigned_status_afterUnassign(self):
+        app_data = ApplicationData()
+        package = app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, td.VALID_WEIGHT,
+                                          td.VALID_CUSTOMER_EMAIL)
+        route = app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        app_data.assign_package_to_route(package.id, route.id)
+        app_data.unassign_package_from_route(package.id)
+
+        self.assertEqual([], app_data.get_packages_by_assigned_status(True))
+        self.assertEqual([package], app_data.get_packages_by_assigned_status(False))
+
     def test_assign_package_to_route_invalidPackage(self):
         app_data = ApplicationData()
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
@@ -181,15 +252,100 @@ class ApplicationData_Should(unittest.TestCase):
     def test_assign_package(self):
         app_data = ApplicationData()
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
-        app_data._routes.append(route)
+        app_data._add_route(route)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
-        app_data._trucks.append(truck)
+        app_data._add_truck(truck)
         route.assigned_truck_id = truck.id
         package = Package(td.VALID_START_LOCATION,td.VALID_END_LOCATION, td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL)
-        app_data._packages.append(package)
+        app_data._add_package(package)
         app_data.assign_package_to_route(package.id, route.id)
 
         self.assertIn(package.id, route.assigned_packages_ids)
         self.assertEqual(route.id, package.route_id)
         self.assertEqual(1, len(route.assigned_packages_ids))
 
+    def test_get_routes_by_locations_returnsRoutesInVisitOrder(self):
+        app_data = ApplicationData()
+        route = app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+
+        self.assertEqual([route], list(app_data.get_routes_by_locations("SYD", "BRI")))
+        self.assertEqual([], list(app_data.get_routes_by_locations("BRI", "SYD")))
+        self.assertEqual([], list(app_data.get_routes_by_locations("SYD", "PER")))
+
+    def test_get_routes_by_status_followsApplicationTime(self):
+        app_data = ApplicationData()
+        first_route = app_data.create_route(td.VALID_LOCATIONS_INPUT, "2055-02-16 11:30")
+        second_route = app_data.create_route(td.VALID_LOCATIONS_INPUT, "2055-02-20 11:30")
+        initial_time = ApplicationTime.current()
+        try:
+            ApplicationTime.set_current(datetime(2055, 2, 17, 0, 0))
+            self.assertEqual([second_route], app_data.get_routes_by_status(Route.STATUS_CREATED))
+            self.assertEqual([first_route], app_data.get_routes_by_status(Route.STATUS_IN_PROGRESS))
+            self.assertEqual([], app_data.get_routes_by_status(Route.STATUS_FINISHED))
+
+            ApplicationTime.set_current(datetime(2055, 3, 1, 0, 0))
+            self.assertEqual([first_route, second_route], app_data.get_routes_by_status(Route.STATUS_FINISHED))
+
+            ApplicationTime.set_current(datetime(2055, 2, 1, 0, 0))
+            self.assertEqual([first_route, second_route], app_data.get_routes_by_status(Route.STATUS_CREATED))
+            self.assertEqual([], app_data.get_routes_by_status(Route.STATUS_IN_PROGRESS))
+        finally:
+            ApplicationTime.set_current(initial_time)
+
+    def test_get_routes_by_status_sortsRestoredRoutes(self):
+        source = ApplicationData()
+        late_route = source.create_route(td.VALID_LOCATIONS_INPUT, "2055-02-20 11:30")
+        early_route = source.create_route(td.VALID_LOCATIONS_INPUT, "2055-02-16 11:30")
+        app_data = ApplicationData.from_json(source.to_json())
+        middle_route = app_data.create_route(td.VALID_LOCATIONS_INPUT, "2055-02-18 11:30")
+        initial_time = ApplicationTime.current()
+        try:
+            ApplicationTime.set_current(datetime(2055, 2, 1, 0, 0))
+            self.assertEqual([early_route.id, middle_route.id, late_route.id],
+                             [route.id for route in app_data.get_routes_by_status(Route.STATUS_CREATED)])
+        finally:
+            ApplicationTime.set_current(initial_time)
+
+    def test_find_free_trucks_filtersByCapacityRangeAndStatus(self):
+        app_data = ApplicationData()
+        app_data.create_truck("Scania", 42000, 8000)
+        app_data.create_truck("Actros", 26000, 13000)
+        man = Truck("Man", 37000, 10000)
+        app_data._add_truck(man)
+        route = app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+
+        self.assertEqual([("Man", 37000, 10000)], list(app_data.find_free_trucks(30000, 9000)))
+
+        app_data.assign_truck_to_route(man.id, route.id)
+        self.assertEqual({}, app_data.find_free_trucks(30000, 9000))
+
+        app_data.unassign_truck_from_route(man.id)
+        self.assertEqual({("Man", 37000, 10000): [man]}, app_data.find_free_trucks(30000, 9000))
+
+    def test_dispatch_trucks_assignsSmallestSuitableTruck(self):
+        app_data = ApplicationData()
+        app_data.create_truck("Scania", 42000, 8000)
+        app_data.create_truck("Actros", 26000, 13000)
+        small_truck, large_truck = sorted(app_data.trucks, key=lambda truck: truck.capacity)
+        light_route = app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        heavy_route = app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        heavy_route.load = 30000
+
+        dispatched_trucks = app_data.dispatch_trucks()
+
+        self.assertEqual({heavy_route.id: large_truck.id, light_route.id: small_truck.id}, dispatched_trucks)
+        self.assertEqual(heavy_route.id, large_truck.assigned_route_id)
+
+    def test_dispatch_trucks_movesMatchedRoutes_toServeMoreRoutes(self):
+        app_data = ApplicationData()
+        app_data.create_truck("Small", 30000, 10000)
+        app_data.create_truck("Big", 40000, 2000)
+        small_truck, big_truck = sorted(app_data.trucks, key=lambda truck: truck.capacity)
+        short_route = app_data.create_route("SYD,MEL", td.VALID_DEPARTURE_TIME_INPUT)
+        short_route.load = 29000
+        long_route = app_data.create_route("SYD,PER", td.VALID_DEPARTURE_TIME_INPUT)
+        long_route.load = 20000
+
+        dispatched_trucks = app_data.dispatch_trucks()
+
+        self.assertEqual({short_route.id: big_truck.id, long_route.id: small_truck.id}, dispatched_trucks)
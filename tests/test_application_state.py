@@ -0,0 +1,286 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import test_data as td
+from core import application_state
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+from core.journal import Journal, JOURNAL_FILE_NAME
+from core.mapped_snapshot import MappedSnapshot
+from core.segmented_store import SegmentedStore
+from models.package import Package
+
+
+class ApplicationState_Should(unittest.TestCase):
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        self.app_data = ApplicationData()
+
+    def tearDown(self):
+        ApplicationState.wait_for_checkpoint()
+        if self.app_data.journal is not None:
+            self.app_data.journal.close()
+        if self.app_data.storage is not None:
+            self.app_data.storage.close()
+        os.chdir(self.original_dir)
+        self.temp_dir.cleanup()
+
+    def create_assigned_route(self):
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+        truck = list(self.app_data.trucks)[-1]
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        self.app_data.assign_truck_to_route(truck.id, route.id)
+        return truck, route
+
+    def test_load_data_returnsNone_whenNothingSaved(self):
+        self.assertIsNone(ApplicationState.load_data())
+
+    def test_load_data_replaysJournalOverSnapshot(self):
+        ApplicationState.save_data(self.app_data)
+        ApplicationState.open_journal(self.app_data)
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+
+        loaded = ApplicationState.load_data()
+
+        self.assertEqual(route.id, loaded.find_truck_by_id(truck.id).assigned_route_id)
+        self.assertEqual(truck.id, loaded.find_route_by_id(route.id).assigned_truck_id)
+        self.assertEqual(0, len(loaded.find_free_trucks(0, 0)))
+
+    def test_load_data_ignoresRecordCutShort(self):
+        ApplicationState.open_journal(self.app_data)
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+        with open(JOURNAL_FILE_NAME, "a") as f:
+            f.write('{"section":"routes","data":{"id"')
+
+        loaded = ApplicationState.load_data()
+
+        self.assertEqual(truck.id, loaded.find_route_by_id(route.id).assigned_truck_id)
+
+    def test_commit_writesRecordsInGroups(self):
+        ApplicationState.open_journal(self.app_data, group_size=2)
+
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+        ApplicationState.commit(self.app_data)
+        self.assertEqual([], list(Journal.read()))
+
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+        ApplicationState.commit(self.app_data)
+        self.assertEqual(2, len(list(Journal.read())))
+
+    def test_commit_recordsEveryChangedEntityOnce(self):
+        ApplicationState.open_journal(self.app_data)
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        packages = [self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION,
+                                                 td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL) for _ in range(3)]
+        self.app_data.assign_packages_to_routes({package.id: route.id for package in packages})
+
+        ApplicationState.commit(self.app_data)
+
+        records = list(Journal.read())
+        self.assertEqual(4, len(records))
+        route_data = next(data for section, data in records if section == "routes")
+        self.assertEqual([package.id for package in packages], route_data["assigned_package_ids"])
+
+    @patch.object(application_state, "COMPACTION_THRESHOLD", 2)
+    def test_commit_compactsJournal_whenThresholdReached(self):
+        ApplicationState.open_journal(self.app_data)
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+
+        self.assertEqual(0, self.app_data.journal.records_count)
+        self.assertEqual([], list(Journal.read()))
+        ApplicationState.wait_for_checkpoint()
+        self.assertFalse(os.path.exists(application_state.CHECKPOINT_JOURNAL_FILE_NAME))
+        loaded = ApplicationState.load_data()
+        self.assertEqual(truck.id, loaded.find_route_by_id(route.id).assigned_truck_id)
+
+    def test_save_data_writesOnlyChangedEntities(self):
+        ApplicationState.save_data(self.app_data)
+        truck, route = self.create_assigned_route()
+        self.assertEqual([truck.id], [data["id"] for data in self.app_data.changes_to_json()["trucks"]])
+
+        with patch.object(SegmentedStore, "write") as write:
+            ApplicationState.save_data(self.app_data)
+
+        written = write.call_args.args[0]
+        self.assertEqual([truck.id], [data["id"] for data in written["trucks"]])
+        self.assertEqual([route.id], [data["id"] for data in written["routes"]])
+        self.assertEqual([], written["packages"])
+        self.assertEqual([], self.app_data.changes_to_json()["trucks"])
+
+    def test_load_data_savesReplayedRecordsAndEmptiesJournal(self):
+        ApplicationState.save_data(self.app_data)
+        ApplicationState.open_journal(self.app_data)
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+
+        ApplicationState.load_data()
+
+        self.assertEqual([], list(Journal.read()))
+        loaded = ApplicationState.load_data()
+        self.assertEqual(truck.id, loaded.find_route_by_id(route.id).assigned_truck_id)
+
+    def test_import_data_readsExportedBinarySnapshot(self):
+        truck, route = self.create_assigned_route()
+
+        ApplicationState.export_data(self.app_data, "state.bin")
+
+        self.assertEqual(self.app_data.to_json(), ApplicationState.import_data("state.bin").to_json())
+
+    def test_load_data_streamsLegacyJsonFileAndReportsProgress(self):
+        truck, route = self.create_assigned_route()
+        ApplicationState.export_data(self.app_data, application_state.FILE_NAME)
+        progress = []
+
+        loaded = ApplicationState.load_data(lambda loaded_size, total_size: progress.append((loaded_size, total_size)))
+
+        self.assertEqual(self.app_data.to_json(), loaded.to_json())
+        file_size = os.path.getsize(application_state.FILE_NAME)
+        self.assertEqual((file_size, file_size), progress[-1])
+
+    def test_save_data_movesLegacyJsonFileIntoStore(self):
+        truck, route = self.create_assigned_route()
+        ApplicationState.export_data(self.app_data, application_state.FILE_NAME)
+        loaded = ApplicationState.load_data()
+
+        ApplicationState.save_data(loaded)
+
+        self.assertFalse(os.path.exists(application_state.FILE_NAME))
+        self.assertTrue(os.path.exists(application_state.MIGRATED_FILE_NAME))
+        self.assertEqual(truck.id, ApplicationState.load_data().find_route_by_id(route.id).assigned_truck_id)
+
+    def test_close_savesSnapshotAndEmptiesJournal(self):
+        ApplicationState.open_journal(self.app_data)
+        self.app_data.create_employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME,
+                                      td.VALID_PASSWORD, td.VALID_EMPLOYEE_ROLE)
+        ApplicationState.commit(self.app_data)
+
+        ApplicationState.close(self.app_data)
+
+        self.assertIsNone(self.app_data.journal)
+        self.assertEqual(0, os.path.getsize(JOURNAL_FILE_NAME))
+        self.assertIsNotNone(ApplicationState.load_data().find_employee_by_username(td.VALID_USERNAME))
+
+    def test_open_database_movesFileBasedStateIntoDatabase(self):
+        truck, route = self.create_assigned_route()
+        ApplicationState.save_data(self.app_data)
+
+        self.app_data = ApplicationState.open_database()
+
+        self.assertEqual(truck.id, self.app_data.find_route_by_id(route.id).assigned_truck_id)
+        self.assertTrue(os.path.exists(application_state.DATABASE_FILE_NAME))
+
+    def test_open_database_readsPackagesOnDemand(self):
+        self.app_data = ApplicationState.open_database()
+        package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION,
+                                               td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL)
+        ApplicationState.close(self.app_data)
+
+        self.app_data = ApplicationState.open_database()
+
+        self.assertEqual(0, len(self.app_data._packages))
+        self.assertEqual(package.to_json(), self.app_data.find_package_by_id(package.id).to_json())
+        self.assertEqual([package.id], [p.id for p in self.app_data.get_packages_by_assigned_status(False)])
+        self.assertEqual(1, len(self.app_data.packages))
+
+    def test_open_database_keepsNewIdsAboveStoredIds(self):
+        self.app_data = ApplicationState.open_database()
+        package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION,
+                                               td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL)
+        ApplicationState.close(self.app_data)
+
+        with patch.object(Package, "_current_id", 0):
+            self.app_data = ApplicationState.open_database()
+            new_package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION,
+                                                       td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL)
+
+        self.assertGreater(new_package.id, package.id)
+
+    def test_commit_writesChangesToDatabase(self):
+        self.app_data = ApplicationState.open_database()
+        truck, route = self.create_assigned_route()
+
+        ApplicationState.commit(self.app_data)
+
+        self.assertEqual(truck.id, self.app_data.storage.find("routes", route.id)["assigned_truck_id"])
+        self.assertEqual({"trucks": [], "routes": [], "packages": [], "employees": []},
+                         self.app_data.changes_to_json())
+
+    def test_load_data_readsPackagesOnDemand_whenLazy(self):
+        truck, route = self.create_assigned_route()
+        package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION,
+                                               td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL)
+        ApplicationState.save_data(self.app_data)
+        ApplicationState.open_journal(self.app_data)
+        self.app_data.assign_package_to_route(package.id, route.id)
+        ApplicationState.commit(self.app_data)
+        self.app_data.journal.close()
+
+        self.app_data = ApplicationState.load_data(lazy=True)
+
+        self.assertEqual(0, len(self.app_data._packages))
+        self.assertEqual(route.id, self.app_data.find_package_by_id(package.id).route_id)
+        self.assertEqual(truck.id, self.app_data.find_route_by_id(route.id).assigned_truck_id)
+        self.assertEqual([], list(Journal.read()))
+
+    @patch.object(application_state, "CHECKPOINT_INTERVAL", 0)
+    def test_commit_takesCheckpoint_whenIntervalPassed(self):
+        ApplicationState.open_journal(self.app_data)
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+
+        ApplicationState.commit(self.app_data)
+        ApplicationState.wait_for_checkpoint()
+
+        self.assertEqual(0, self.app_data.journal.records_count)
+        self.assertEqual(1, len(SegmentedStore(application_state.STORE_DIRECTORY).read()["trucks"]))
+
+    def test_load_data_replaysCheckpointJournal_whenCheckpointNotWritten(self):
+        ApplicationState.open_journal(self.app_data)
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+        self.app_data.journal.rotate(application_state.CHECKPOINT_JOURNAL_FILE_NAME)
+
+        loaded = ApplicationState.load_data()
+
+        self.assertEqual(truck.id, loaded.find_route_by_id(route.id).assigned_truck_id)
+        self.assertFalse(os.path.exists(application_state.CHECKPOINT_JOURNAL_FILE_NAME))
+
+    def test_checkpoint_refreshesMappedSnapshot(self):
+        ApplicationState.open_journal(self.app_data, snapshot_file_name=application_state.SNAPSHOT_FILE_NAME)
+        with MappedSnapshot(application_state.SNAPSHOT_FILE_NAME) as snapshot:
+            self.assertEqual(0, snapshot.count("routes"))
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+
+        ApplicationState.checkpoint(self.app_data)
+        ApplicationState.wait_for_checkpoint()
+
+        with MappedSnapshot(application_state.SNAPSHOT_FILE_NAME) as snapshot:
+            self.assertEqual(truck.id, snapshot.find("routes", route.id)["assigned_truck_id"])
+        ApplicationState.close(self.app_data)
+
+    def test_checkpoint_keepsSnapshotAndJournal_whenWriteFails(self):
+        ApplicationState.open_journal(self.app_data)
+        truck, route = self.create_assigned_route()
+        ApplicationState.commit(self.app_data)
+        records_count = self.app_data.journal.records_count
+
+        with patch.object(SegmentedStore, "write", side_effect=OSError("disk full")):
+            ApplicationState.checkpoint(self.app_data)
+            ApplicationState.wait_for_checkpoint()
+
+        self.assertEqual(records_count, len(list(Journal.read(application_state.CHECKPOINT_JOURNAL_FILE_NAME))))
+        ApplicationState.close(self.app_data)
+        self.assertFalse(os.path.exists(application_state.CHECKPOINT_JOURNAL_FILE_NAME))
+        loaded = ApplicationState.load_data()
+        self.assertEqual(truck.id, loaded.find_route_by_id(route.id).assigned_truck_id)
+
+    def test_export_data_leavesNoTemporaryFile(self):
+        ApplicationState.export_data(self.app_data, application_state.FILE_NAME)
+
+        self.assertEqual(["app_state.json"], os.listdir())
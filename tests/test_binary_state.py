@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import test_data as td
+from core.application_data import ApplicationData
+from core.binary_state import BinaryState
+from errors.application_error import ApplicationError
+
+
+def without_stops(data):
+    return {**data, "routes": [{key: value for key, value in route.items() if key != "stops"}
+                               for route in data["routes"]]}
+
+
+class BinaryState_Should(unittest.TestCase):
+    def setUp(self):
+        self.app_data = ApplicationData()
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+        truck = list(self.app_data.trucks)[0]
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        self.app_data.create_route("PER,ADL,PER", td.VALID_DEPARTURE_TIME_INPUT)
+        package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 12.5,
+                                               td.VALID_CUSTOMER_EMAIL)
+        self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 3, "other@example.com")
+        self.app_data.assign_truck_to_route(truck.id, route.id)
+        self.app_data.assign_package_to_route(package.id, route.id)
+        self.app_data.create_employee(td.VALID_USERNAME, td.VALID_FIRST_NAME, td.VALID_LAST_NAME,
+                                      td.VALID_PASSWORD, td.VALID_EMPLOYEE_ROLE)
+
+    def test_load_returnsDumpedState(self):
+        data = self.app_data.to_json()
+        f = io.BytesIO()
+
+        BinaryState.dump(data, f)
+        f.seek(0)
+
+        self.assertEqual(without_stops(data), BinaryState.load(f))
+
+    def test_load_roundTripsThroughApplicationData(self):
+        data = self.app_data.to_json()
+        f = io.BytesIO()
+        BinaryState.dump(data, f)
+        f.seek(0)
+
+        self.assertEqual(data, ApplicationData.from_json(BinaryState.load(f)).to_json())
+
+    def test_load_keepsIntegerAndFloatNumbers(self):
+        data = self.app_data.to_json()
+        f = io.BytesIO()
+        BinaryState.dump(data, f)
+        f.seek(0)
+
+        loaded = BinaryState.load(f)
+
+        self.assertEqual([0, 12.5], sorted(route["load"] for route in data["routes"]))
+        self.assertEqual(json.dumps(without_stops(data)), json.dumps(loaded))
+
+    def test_dump_isSmallerThanJson(self):
+        data = self.app_data.to_json()
+        f = io.BytesIO()
+
+        BinaryState.dump(data, f)
+
+        self.assertLess(len(f.getvalue()), len(json.dumps(data, indent=4)))
+
+    def test_load_raisesError_whenNotBinaryState(self):
+        with self.assertRaises(ApplicationError):
+            BinaryState.load(io.BytesIO(b"{}"))
+
+    def test_convert_roundTripsJsonFile(self):
+        data = self.app_data.to_json()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_file_name = os.path.join(temp_dir, "state.json")
+            binary_file_name = os.path.join(temp_dir, "state.bin")
+            converted_file_name = os.path.join(temp_dir, "converted.json")
+            with open(json_file_name, "w") as f:
+                json.dump(data, f)
+
+            BinaryState.convert(json_file_name, binary_file_name)
+            BinaryState.convert(binary_file_name, converted_file_name)
+
+            with open(converted_file_name, "r") as f:
+                self.assertEqual(data, json.load(f))
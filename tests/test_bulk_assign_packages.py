@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import Mock
+import test_data as td
+from commands.bulk_assign_packages import BulkAssignPackagesCommand
+from core.application_data import ApplicationData
+from errors.application_error import ApplicationError
+
+
+class BulkAssignPackagesCommand_Should(unittest.TestCase):
+    def setUp(self):
+        self.app_data = ApplicationData()
+        self.app_data.logged_in_employee = Mock()
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, 100, td.VALID_TRUCK_MAX_RANGE)
+        self.truck = list(self.app_data.trucks)[0]
+
+    def test_execute_raisesError_tooFewParamsCount(self):
+        cmd = BulkAssignPackagesCommand(["1"], self.app_data)
+        with self.assertRaises(ApplicationError):
+            cmd.execute()
+
+    def test_execute_raisesError_whenNoPackageIds(self):
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+
+        for packages_ids in ([], [""]):
+            cmd = BulkAssignPackagesCommand([str(route.id), packages_ids], self.app_data)
+            with self.assertRaises(ApplicationError):
+                cmd.execute()
+
+    def test_execute_assignsAllPackagesToRoute(self):
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        package_1 = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 10,
+                                                 td.VALID_CUSTOMER_EMAIL)
+        package_2 = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 20,
+                                                 td.VALID_CUSTOMER_EMAIL)
+
+        output = BulkAssignPackagesCommand([str(route.id), [str(package_1.id), str(package_2.id)]],
+                                           self.app_data).execute()
+
+        self.assertEqual(f"Bulk assigned Packages to Route ID {route.id}: [{package_1.id}, {package_2.id}]", output)
+        self.assertEqual(30, route.load)
+
+    def test_execute_assignsNothing_whenOnePackageDoesNotFit(self):
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        self.app_data.assign_truck_to_route(self.truck.id, route.id)
+        package_1 = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 60,
+                                                 td.VALID_CUSTOMER_EMAIL)
+        package_2 = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 60,
+                                                 td.VALID_CUSTOMER_EMAIL)
+
+        cmd = BulkAssignPackagesCommand([str(route.id), [str(package_1.id), str(package_2.id)]], self.app_data)
+        with self.assertRaises(ApplicationError):
+            cmd.execute()
+
+        self.assertEqual(0, route.load)
+        self.assertFalse(package_1.is_assigned)
+
+    def test_execute_autoPlan_packsHeaviestPackagesFirst(self):
+        route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        self.app_data.assign_truck_to_route(self.truck.id, route.id)
+        light_package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 30,
+                                                     td.VALID_CUSTOMER_EMAIL)
+        heavy_package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 80,
+                                                     td.VALID_CUSTOMER_EMAIL)
+        wrong_way_package = self.app_data.create_package(td.VALID_END_LOCATION, td.VALID_START_LOCATION, 10,
+                                                         td.VALID_CUSTOMER_EMAIL)
+
+        output = BulkAssignPackagesCommand(["auto", [""]], self.app_data).execute()
+
+        self.assertEqual(f"Bulk assigned 1 Packages to 1 Routes"
+                         f"\nRoute ID {route.id}: 1 Packages"
+                         f"\n2 Packages did not fit in any Route", output)
+        self.assertEqual(route.id, heavy_package.route_id)
+        self.assertFalse(light_package.is_assigned)
+        self.assertFalse(wrong_way_package.is_assigned)
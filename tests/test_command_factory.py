@@ -8,6 +8,8 @@ from commands.assign_truck_to_route import AssignTruckToRouteCommand
 from commands.bulk_assign_packages import BulkAssignPackagesCommand
 from commands.create_package import CreatePackageCommand
 from commands.create_route import CreateRouteCommand
+from commands.dispatch_trucks import DispatchTrucksCommand
+from commands.plan_route import PlanRouteCommand
 from commands.login import LoginCommand
 from commands.logout import LogoutCommand
 from commands.reassign_package import ReassignPackageCommand
@@ -129,6 +131,23 @@ class CommandFactoryTests(unittest.TestCase):
         self.assertIsInstance(command, ShowTrucksCommand)
         self.assertEqual(list(command.params), [])
 
+    def test_create_withDispatchTrucks_createsInstance(self):
+        # Act
+        command = self.factory.create("20")
+
+        # Assert
+        self.assertIsInstance(command, DispatchTrucksCommand)
+        self.assertEqual(list(command.params), [])
+
+    @patch("builtins.input", side_effect=["SYD,MEL,BRI", "SYD", "2023-10-10 10:00", ""])
+    def test_create_withPlanRoute_createsInstance(self, mock_input):
+        # Act
+        command = self.factory.create("21")
+
+        # Assert
+        self.assertIsInstance(command, PlanRouteCommand)
+        self.assertEqual(list(command.params), ["SYD,MEL,BRI", "SYD", "2023-10-10 10:00", ""])
+
     @patch("builtins.input", side_effect=["1", "2"])
     def test_create_withAssignPackageToRoute_createsInstance(self, mock_input):
         # Act
@@ -194,4 +213,54 @@ class CommandFactoryTests(unittest.TestCase):
     def test_create_withInvalidCommand_raisesApplicationError(self):
         # Act & Assert
         with self.assertRaises(ApplicationError):
-            self.factory.create("invalidcommand")
\ No newline at end of file
+            self.factory.create("invalidcommand")
+
+    def test_createFromLine_withQuotedParams_createsInstance(self):
+        # Act
+        command = self.factory.create_from_line('createroute SYD,MEL "2023-10-10 10:00"')
+
+        # Assert
+        self.assertIsInstance(command, CreateRouteCommand)
+        self.assertEqual(list(command.params), ["SYD,MEL", "2023-10-10 10:00"])
+
+    def test_createFromLine_withUnquotedDateTime_joinsLastParam(self):
+        # Act
+        command = self.factory.create_from_line("createroute SYD,MEL 2023-10-10 10:00")
+        set_time_command = self.factory.create_from_line("settime 2030-01-01 06:00")
+
+        # Assert
+        self.assertIsInstance(command, CreateRouteCommand)
+        self.assertEqual(list(command.params), ["SYD,MEL", "2023-10-10 10:00"])
+        self.assertEqual(list(set_time_command.params), ["2030-01-01 06:00"])
+
+    def test_createFromLine_withMenuNumber_createsInstance(self):
+        # Act
+        command = self.factory.create_from_line("5 SYD MEL 10 test@example.com")
+
+        # Assert
+        self.assertIsInstance(command, CreatePackageCommand)
+        self.assertEqual(list(command.params), ["SYD", "MEL", "10", "test@example.com"])
+
+    def test_createFromLine_withJson_createsInstance(self):
+        # Act
+        command = self.factory.create_from_line('{"command": "assignPackageToRoute", "params": [1, 2]}')
+
+        # Assert
+        self.assertIsInstance(command, AssignPackageToRouteCommand)
+        self.assertEqual(list(command.params), ["1", "2"])
+
+    def test_createFromLine_withBulkAssign_splitsPackageIds(self):
+        # Act
+        command = self.factory.create_from_line("bulkassignpackages 1 2,3")
+        auto_command = self.factory.create_from_line("bulkassignpackages auto")
+
+        # Assert
+        self.assertIsInstance(command, BulkAssignPackagesCommand)
+        self.assertEqual(list(command.params), ["1", ["2", "3"]])
+        self.assertEqual(list(auto_command.params), ["auto", [""]])
+
+    def test_createFromLine_withInvalidLine_raisesApplicationError(self):
+        # Act & Assert
+        for line in ("invalidcommand 1", 'createroute "SYD', '{"params": []}', "{not json"):
+            with self.assertRaises(ApplicationError):
+                self.factory.create_from_line(line)
\ No newline at end of file
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+import test_data as td
+from errors.application_error import ApplicationError
+from models.constants.distances import Distance
+from models.route import Route
+
+
+class LineDistance(Distance):
+    DISTANCES = {
+        "A": {"B": 10, "C": 50},
+        "B": {"A": 10, "C": 15},
+        "C": {"A": 50, "B": 15},
+        "D": {}
+    }
+
+
+class Distance_Should(unittest.TestCase):
+
+    def test_get_shortest_distance_matchesDirectDistance(self):
+        self.assertEqual(td.EXPECTED_DISTANCE, Distance.get_shortest_distance(td.VALID_CITY_1, td.VALID_CITY_2))
+
+    def test_get_shortest_distance_usesIntermediateHubs(self):
+        self.assertEqual(25, LineDistance.get_shortest_distance("A", "C"))
+        self.assertEqual(0, LineDistance.get_shortest_distance("A", "A"))
+
+    def test_get_next_hop_returnsFirstHubOnPath(self):
+        self.assertEqual("B", LineDistance.get_next_hop("A", "C"))
+        self.assertEqual(["A", "B", "C"], LineDistance.get_shortest_path("A", "C"))
+
+    def test_unreachableHub(self):
+        self.assertEqual(Distance.UNREACHABLE, LineDistance.get_shortest_distance("A", "D"))
+        self.assertIsNone(LineDistance.get_next_hop("A", "D"))
+        self.assertEqual([], LineDistance.get_shortest_path("A", "D"))
+
+    def test_hub_id_isStable(self):
+        self.assertEqual(LineDistance.hub_id("C"), LineDistance.hub_id("C"))
+        self.assertEqual(3, LineDistance.hub_id("D"))
+
+    def test_load_network_replacesHubs(self):
+        original_distances = Distance.DISTANCES
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "hubs.csv")
+            with open(file_name, "w") as f:
+                f.write("AAA,BBB,100\nBBB,CCC,200\nDDD,EEE,50\n")
+            try:
+                self.assertTrue(Distance.load_network(file_name))
+                self.assertTrue(Distance.is_hub("CCC"))
+                self.assertFalse(Distance.is_hub(td.VALID_CITY_1))
+                self.assertEqual(300, Route("AAA,CCC", td.VALID_DEPARTURE_TIME_INPUT).distance)
+                with self.assertRaises(ApplicationError):
+                    Route("AAA,DDD", td.VALID_DEPARTURE_TIME_INPUT)
+            finally:
+                Distance.DISTANCES = original_distances
+
+    def test_load_network_skipsHeaderAndBlankRows(self):
+        original_distances = Distance.DISTANCES
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "hubs.csv")
+            with open(file_name, "w") as f:
+                f.write("from,to,distance\n\nAAA,BBB,100\n , , \n")
+            try:
+                self.assertTrue(Distance.load_network(file_name))
+                self.assertEqual(100, Distance.get_distance("AAA", "BBB"))
+            finally:
+                Distance.DISTANCES = original_distances
+
+    def test_load_network_reportsInvalidRows(self):
+        original_distances = Distance.DISTANCES
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "hubs.csv")
+            for content in ("AAA,BBB,100\nBBB,CCC\n", "AAA,BBB,100\nBBB,CCC,far\n", "AAA,BBB,100\n,CCC,5\n"):
+                with open(file_name, "w") as f:
+                    f.write(content)
+                with self.assertRaisesRegex(ApplicationError, "line 2"):
+                    Distance.load_network(file_name)
+        self.assertIs(original_distances, Distance.DISTANCES)
+
+    def test_is_hub_doesNotAllocateShortestPathTable(self):
+        class GridDistance(Distance):
+            DISTANCES = {f"H{i}": {f"H{i + 1}": 1} for i in range(100)}
+
+        self.assertTrue(GridDistance.is_hub("H100"))
+        self.assertIsNot(GridDistance.DISTANCES, GridDistance._table_distances)
+        self.assertEqual(5, GridDistance.get_shortest_distance("H0", "H5"))
+        self.assertEqual(101 * 101, len(GridDistance._shortest_distances))
+
+    def test_load_network_whenFileMissing(self):
+        self.assertFalse(Distance.load_network("missing_hubs.csv"))
+        self.assertTrue(Distance.is_hub(td.VALID_CITY_1))
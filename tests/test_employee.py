@@ -95,3 +95,16 @@ class TestEmployee(unittest.TestCase):
         self.assertEqual(employee.__dict__["_last_name"], "Doe")
         self.assertEqual(employee.password, "StrongPass@1")
         self.assertEqual(employee.employee_role, EmployeeRole.MANAGER)
+
+    def test_restore(self):
+        data = {
+            "username": "jane_doe",
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "password": "StrongPass@1",
+            "employee_role": EmployeeRole.MANAGER
+        }
+
+        employee = Employee.restore(data)
+
+        self.assertEqual(data, employee.to_json())
@@ -0,0 +1,77 @@
+import io
+import json
+import unittest
+from core.application_data import ApplicationData
+from core.command_factory import CommandFactory
+from core.engine import Engine
+
+
+class EngineTests(unittest.TestCase):
+    def setUp(self):
+        self.data = ApplicationData()
+        self.engine = Engine(CommandFactory(self.data))
+        self.output = io.StringIO()
+
+    def test_runBatch_withTextLines_executesCommandsInOrder(self):
+        # Arrange
+        lines = ["registeremployee user1 John Doe password1 Manager",
+                 "login user1 password1",
+                 "",
+                 "# comment",
+                 "createroute SYD,MEL \"2055-10-10 06:00\"",
+                 "createpackage SYD MEL 45 customer@example.com"]
+
+        # Act
+        failed_count = self.engine.run_batch(lines, self.output)
+        route_id, package_id = max(route.id for route in self.data.routes), max(package.id for package in self.data.packages)
+        failed_count += self.engine.run_batch([f"assignpackagetoroute {package_id} {route_id}"], self.output)
+
+        # Assert
+        self.assertEqual(0, failed_count, self.output.getvalue())
+        self.assertTrue(self.data.find_package_by_id(package_id).is_assigned)
+        self.assertIn(f"Package with ID {package_id} was assigned to Route with ID {route_id}", self.output.getvalue())
+
+    def test_runBatch_withFailingCommand_continuesAndCountsFailure(self):
+        # Arrange
+        lines = ["createpackage SYD MEL 45 customer@example.com",
+                 "unknown",
+                 "registeremployee user2 Jane Doe password2 Manager"]
+
+        # Act
+        failed_count = self.engine.run_batch(lines, self.output)
+
+        # Assert
+        self.assertEqual(2, failed_count)
+        self.assertIsNotNone(self.data.find_employee_by_username("user2"))
+        self.assertIn("You are not logged in!", self.output.getvalue())
+
+    def test_runBatch_withJsonLines_writesJsonResults(self):
+        # Arrange
+        lines = ['{"command": "registeremployee", "params": ["user3", "Jo", "Doe", "password3", "Manager"]}',
+                 '{"command": "showpackage", "params": [1]}']
+
+        # Act
+        self.engine.run_batch(lines, self.output)
+        results = [json.loads(line) for line in self.output.getvalue().splitlines()]
+
+        # Assert
+        self.assertEqual([1, 2], [result["line"] for result in results])
+        self.assertEqual([True, False], [result["ok"] for result in results])
+
+    def test_runBatch_withExit_stopsBatch(self):
+        # Act
+        self.engine.run_batch(["exit", "registeremployee user4 Jo Doe password4 Manager"], self.output)
+
+        # Assert
+        self.assertIsNone(self.data.find_employee_by_username("user4"))
+
+    def test_runBatch_callsOnCommandDone_afterEveryCommand(self):
+        # Arrange
+        done = []
+        engine = Engine(CommandFactory(self.data), done.append)
+
+        # Act
+        engine.run_batch(["unknown", "", "registeremployee user5 Jo Doe password5 Manager"], self.output)
+
+        # Assert
+        self.assertEqual([self.data, self.data], done)
@@ -0,0 +1,41 @@
+import io
+import json
+import unittest
+from core.json_stream import JsonArrayStream
+
+
+DOCUMENT = {
+    "trucks": [{"id": 1001, "name": "Scania", "capacity": 42000, "assigned_route_id": None}],
+    "version": {"skipped": [1, 2, 3]},
+    "routes": [],
+    "packages": [{"id": i, "weight": 12345.678, "customer_email": "klient@пример.бг"} for i in range(20)],
+    "employees": [{"username": "user1", "first_name": "Ана"}],
+}
+
+
+class JsonArrayStream_Should(unittest.TestCase):
+    def test_iter_yieldsEveryArrayItem_acrossChunkBoundaries(self):
+        content = json.dumps(DOCUMENT, indent=4, ensure_ascii=False).encode()
+
+        items = list(JsonArrayStream(io.BytesIO(content), chunk_size=7))
+
+        expected = [(key, item) for key, value in DOCUMENT.items() if isinstance(value, list) for item in value]
+        self.assertEqual(expected, items)
+
+    def test_iter_reportsBytesRead(self):
+        content = json.dumps(DOCUMENT).encode()
+        progress = []
+
+        list(JsonArrayStream(io.BytesIO(content), chunk_size=100, progress=progress.append))
+
+        self.assertEqual(sorted(progress), progress)
+        self.assertEqual(len(content), progress[-1])
+
+    def test_iter_handlesEmptyObject(self):
+        self.assertEqual([], list(JsonArrayStream(io.BytesIO(b" { } "))))
+
+    def test_iter_raisesError_whenDocumentIsCutShort(self):
+        content = json.dumps(DOCUMENT).encode()[:-20]
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(JsonArrayStream(io.BytesIO(content), chunk_size=16))
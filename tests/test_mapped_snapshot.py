@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+import test_data as td
+from core.application_data import ApplicationData
+from core.application_state import ApplicationState
+from core.mapped_snapshot import MappedSnapshot, NONE
+from errors.application_error import ApplicationError
+
+
+class MappedSnapshot_Should(unittest.TestCase):
+    def setUp(self):
+        self.app_data = ApplicationData()
+        self.app_data.create_truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
+        truck = list(self.app_data.trucks)[0]
+        self.route = self.app_data.create_route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        self.app_data.create_route("PER,ADL,PER", td.VALID_DEPARTURE_TIME_INPUT)
+        self.package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 12.5,
+                                                    td.VALID_CUSTOMER_EMAIL)
+        self.other_package = self.app_data.create_package(td.VALID_START_LOCATION, td.VALID_END_LOCATION, 3,
+                                                          "other@example.com")
+        self.app_data.assign_truck_to_route(truck.id, self.route.id)
+        self.app_data.assign_package_to_route(self.package.id, self.route.id)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.temp_dir.name, "state.snap")
+        MappedSnapshot.write(self.app_data.to_json(), self.file_name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_find_returnsEveryRecordAsSaved(self):
+        data = self.app_data.to_json()
+
+        with MappedSnapshot(self.file_name) as snapshot:
+            for section in ("trucks", "routes", "packages"):
+                for record in data[section]:
+                    record.pop("stops", None)
+                    self.assertEqual(record, snapshot.find(section, record["id"]))
+
+    def test_find_returnsNone_whenIdMissing(self):
+        with MappedSnapshot(self.file_name) as snapshot:
+            self.assertIsNone(snapshot.find("packages", self.other_package.id + 1))
+            self.assertIsNone(snapshot.find("packages", 0))
+
+    def test_column_scansFieldInIdOrder(self):
+        with MappedSnapshot(self.file_name) as snapshot:
+            self.assertEqual(2, snapshot.count("packages"))
+            self.assertEqual([12.5, 3.0], snapshot.column("packages", "weight").tolist())
+            self.assertEqual([self.route.id, NONE], snapshot.column("packages", "route_id").tolist())
+            self.assertEqual([td.VALID_START_LOCATION] * 2,
+                             [snapshot.string(index) for index in snapshot.column("packages", "start_location")])
+
+    def test_column_raisesError_whenFieldMissing(self):
+        with MappedSnapshot(self.file_name) as snapshot:
+            with self.assertRaises(ApplicationError):
+                snapshot.column("employees", "username")
+
+    def test_init_raisesError_whenNotSnapshot(self):
+        with open(self.file_name, "wb") as f:
+            f.write(b"{}" * 16)
+
+        with self.assertRaises(ApplicationError):
+            MappedSnapshot(self.file_name)
+
+    def test_init_raisesError_whenFileEmptyOrTruncated(self):
+        with open(self.file_name, "rb") as f:
+            snapshot_bytes = f.read()
+
+        for content in (b"", snapshot_bytes[:4], snapshot_bytes[:40]):
+            file_name = os.path.join(self.temp_dir.name, "broken.snap")
+            with open(file_name, "wb") as f:
+                f.write(content)
+
+            with self.assertRaises(ApplicationError):
+                MappedSnapshot(file_name)
+
+            os.remove(file_name)
+
+    def test_exportData_writesSnapshot(self):
+        file_name = os.path.join(self.temp_dir.name, "exported.snap")
+
+        ApplicationState.export_data(self.app_data, file_name)
+
+        with MappedSnapshot(file_name) as snapshot:
+            self.assertEqual(self.package.to_json(), snapshot.find("packages", self.package.id))
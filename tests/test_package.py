@@ -172,4 +172,25 @@ class PackageTests(unittest.TestCase):
         result = str(package)
 
         # Assert
-        self.assertEqual(result, expected_output)
\ No newline at end of file
+        self.assertEqual(result, expected_output)
+
+    def test_restore_returnsPackageEqualToSaved_andKeepsIdCounterAbove(self):
+        # Arrange
+        json_data = {
+            "id": 42,
+            "start_location": td.VALID_START_LOCATION,
+            "end_location": td.VALID_END_LOCATION,
+            "weight": float(td.VALID_WEIGHT),
+            "customer_email": td.VALID_CUSTOMER_EMAIL,
+            "departure_time": td.VALID_DEPARTURE_TIME_OUTPUT.isoformat(),
+            "estimated_arrival_time": td.VALID_ESTIMATED_ARRIVAL_TIME_OUTPUT.isoformat(),
+            "is_assigned": True,
+            "route_id": 1
+        }
+
+        # Act
+        package = Package.restore(json_data)
+
+        # Assert
+        self.assertEqual(json_data, package.to_json())
+        self.assertEqual(43, Package.next_id())
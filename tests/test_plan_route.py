@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import Mock
+import test_data as td
+from commands.plan_route import PlanRouteCommand
+from core.application_data import ApplicationData
+from errors.application_error import ApplicationError
+
+
+class PlanRouteCommand_Should(unittest.TestCase):
+    def setUp(self):
+        self.app_data = ApplicationData()
+        self.app_data.logged_in_employee = Mock()
+
+    def test_execute_raisesError_tooFewParamsCount(self):
+        cmd = PlanRouteCommand(["MEL,SYD", "", td.VALID_DEPARTURE_TIME_INPUT], self.app_data)
+        with self.assertRaises(ApplicationError):
+            cmd.execute()
+
+    def test_execute_createsRouteInShortestOrder(self):
+        output = PlanRouteCommand(["BRI, SYD, MEL", "MEL", td.VALID_DEPARTURE_TIME_INPUT, ""],
+                                  self.app_data).execute()
+
+        route = list(self.app_data.routes)[0]
+        self.assertEqual(("MEL", "SYD", "BRI"), route.locations)
+        self.assertIn("MEL,SYD,BRI", output)
+        self.assertIn(f"{route.distance} km", output)
+
+    def test_execute_raisesError_whenRouteExceedsMaxRange(self):
+        cmd = PlanRouteCommand(["BRI,SYD,MEL", "", td.VALID_DEPARTURE_TIME_INPUT, "100"], self.app_data)
+        with self.assertRaises(ApplicationError):
+            cmd.execute()
+
+        self.assertEqual(0, len(self.app_data.routes))
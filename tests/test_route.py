@@ -1,4 +1,5 @@
 import unittest
+from collections import OrderedDict
 from unittest.mock import patch
 from datetime import datetime, timedelta
 import test_data as td
@@ -68,6 +69,12 @@ class Route_Should(unittest.TestCase):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         self.assertEqual(td.VALID_DISTANCE, route.distance)
 
+    def test_distance_between_returnsSegmentDistance(self):
+        route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        self.assertEqual(td.EXPECTED_DISTANCE, route.distance_between(0, 1))
+        self.assertEqual(td.VALID_DISTANCE - td.EXPECTED_DISTANCE, route.distance_between(1, 2))
+        self.assertEqual(td.VALID_DISTANCE, route.distance_between(0, 2))
+
     def test_estimated_arrival_time_returnsCorrectly(self):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         self.assertEqual(td.EXPECTED_ESTIMATED_ARRIVAL_TIME, route.estimated_arrival_time)
@@ -118,8 +125,63 @@ class Route_Should(unittest.TestCase):
 
         self.assertEqual(td.EXPECTED_STOPS, route.stops)
 
+    def test_stops_cachedUntilDepartureTimeChanges(self):
+        route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        stops = route.stops
+
+        self.assertIs(stops, route.stops)
+
+        route.departure_time = "2055-02-17 11:30"
+        self.assertIsNot(stops, route.stops)
+        self.assertEqual(datetime(2055, 2, 17, 11, 30), route.stops[td.VALID_CITY_1])
+
+    def test_remove_package_keepsOrderOfRemainingPackages(self):
+        route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
+        for package_id in (3, 1, 2):
+            route.assign_package(package_id)
+        route.remove_package(1)
+
+        self.assertFalse(route.has_package(1))
+        self.assertTrue(route.has_package(2))
+        self.assertEqual([3, 2], route.to_json()["assigned_package_ids"])
+
     def test_assign_truck(self):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route.assign_truck(truck)
         self.assertEqual(truck, route.assigned_truck_id)
+
+    def test_restore_keepsPastDepartureTime_andKeepsIdCounterAbove(self):
+        data = {"locations": td.VALID_LOCATIONS_INPUT, "departure_time": "2020-01-01T06:00:00", "id": 5000,
+                "assigned_truck_id": 1001, "assigned_package_ids": [1, 2], "load": 20.0}
+
+        with patch.object(Route, "_current_id", 0):
+            route = Route.restore(data)
+
+            self.assertEqual(5001, Route.next_id())
+        self.assertEqual(td.VALID_LOCATIONS_OUTPUT, route.locations)
+        self.assertEqual(datetime(2020, 1, 1, 6), route.departure_time)
+        self.assertEqual(td.VALID_DISTANCE, route.distance)
+        self.assertEqual((1, 2), route.assigned_packages_ids)
+        self.assertEqual(Route.STATUS_FINISHED, route.status)
+
+    def test_restore_recalculatesDistances_whenNetworkIsReplaced(self):
+        data = {"locations": "SYD,MEL", "departure_time": "2020-01-01T06:00:00", "id": 5000}
+        self.assertEqual(877, Route.restore(data).distance)
+
+        with patch.object(Distance, "DISTANCES", {"SYD": {"MEL": 500}, "MEL": {"SYD": 500}}):
+            self.assertEqual(500, Route.restore(data).distance)
+
+        self.assertEqual(877, Route.restore(data).distance)
+
+    def test_restore_dropsLeastRecentlyUsedDistances_whenLimitIsReached(self):
+        def restore(locations):
+            Route.restore({"locations": locations, "departure_time": "2020-01-01T06:00:00", "id": 5000})
+
+        with patch.object(Route, "_restored_distances", OrderedDict()), \
+                patch.object(Route, "_restored_distances_network", Distance.DISTANCES), \
+                patch.object(Route, "_RESTORED_DISTANCES_LIMIT", 2):
+            for locations in ("SYD,MEL", "MEL,ADL", "SYD,MEL", "ADL,SYD"):
+                restore(locations)
+
+            self.assertEqual(["SYD,MEL", "ADL,SYD"], list(Route._restored_distances))
@@ -0,0 +1,59 @@
+import unittest
+from datetime import datetime, timedelta
+from itertools import permutations
+from core.route_planner import RoutePlanner
+from errors.application_error import ApplicationError
+from models.constants.distances import Distance
+from models.route import Route
+
+DEPARTURE_TIME = datetime(2055, 2, 16, 6, 0)
+HUBS = ["SYD", "MEL", "ADL", "ASP", "BRI", "DAR", "PER"]
+
+
+def shortest_length(hubs, start_location=None):
+    return min(sum(Distance.get_distance(order[i], order[i + 1]) for i in range(len(order) - 1))
+               for order in permutations(hubs)
+               if start_location is None or order[0] == start_location)
+
+
+class RoutePlanner_Should(unittest.TestCase):
+    def test_plan_findsShortestOrder(self):
+        plan = RoutePlanner.plan(HUBS, DEPARTURE_TIME)
+
+        self.assertEqual(sorted(HUBS), sorted(plan.locations))
+        self.assertEqual(shortest_length(HUBS), plan.distance)
+
+    def test_plan_startsFromStartLocation(self):
+        plan = RoutePlanner.plan(HUBS, DEPARTURE_TIME, start_location="PER")
+
+        self.assertEqual("PER", plan.locations[0])
+        self.assertEqual(shortest_length(HUBS, "PER"), plan.distance)
+
+    def test_plan_heuristicMatchesExactSearch(self):
+        original_limit = RoutePlanner.EXACT_SEARCH_LIMIT
+        RoutePlanner.EXACT_SEARCH_LIMIT = 2
+        try:
+            plan = RoutePlanner.plan(HUBS, DEPARTURE_TIME)
+        finally:
+            RoutePlanner.EXACT_SEARCH_LIMIT = original_limit
+
+        self.assertEqual(shortest_length(HUBS), plan.distance)
+
+    def test_plan_calculatesStopsWithAverageSpeed(self):
+        plan = RoutePlanner.plan(["SYD", "MEL"], DEPARTURE_TIME, start_location="SYD")
+
+        distance = Distance.get_distance("SYD", "MEL")
+        self.assertEqual({"SYD": DEPARTURE_TIME,
+                          "MEL": DEPARTURE_TIME + timedelta(hours=distance / Route.AVERAGE_SPEED)}, plan.stops)
+
+    def test_plan_raisesError_whenRouteExceedsMaxRange(self):
+        with self.assertRaises(ApplicationError):
+            RoutePlanner.plan(HUBS, DEPARTURE_TIME, max_range=1000)
+
+    def test_plan_raisesError_invalidHub(self):
+        with self.assertRaises(ApplicationError):
+            RoutePlanner.plan(["SYD", "XXX"], DEPARTURE_TIME)
+
+    def test_plan_raisesError_tooFewHubs(self):
+        with self.assertRaises(ApplicationError):
+            RoutePlanner.plan(["SYD", "SYD"], DEPARTURE_TIME)
@@ -47,9 +47,9 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route.assigned_truck_id = truck.id
-        app_data._packages.append(package)
-        app_data._routes.append(route)
-        app_data._trucks.append(truck)
+        app_data._add_package(package)
+        app_data._add_route(route)
+        app_data._add_truck(truck)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
 
@@ -64,9 +64,9 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route.assigned_truck_id = truck.id
-        app_data._packages.append(package)
-        app_data._routes.append(route)
-        app_data._trucks.append(truck)
+        app_data._add_package(package)
+        app_data._add_route(route)
+        app_data._add_truck(truck)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
         expected_message = f"SUITABLE ROUTES:\n{BaseCommand.ROW_SEP}\n{BaseCommand.TABLE_SEP}\n"
@@ -81,9 +81,9 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route.assigned_truck_id = truck.id
-        app_data._packages.append(package)
-        app_data._routes.append(route)
-        app_data._trucks.append(truck)
+        app_data._add_package(package)
+        app_data._add_route(route)
+        app_data._add_truck(truck)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
         expected_message = f"SUITABLE ROUTES:\n{BaseCommand.ROW_SEP}\n{BaseCommand.TABLE_SEP}\n"
@@ -98,9 +98,9 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route.assigned_truck_id = truck.id
-        app_data._packages.append(package)
-        app_data._routes.append(route)
-        app_data._trucks.append(truck)
+        app_data._add_package(package)
+        app_data._add_route(route)
+        app_data._add_truck(truck)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
         expected_message = f"SUITABLE ROUTES:\n{BaseCommand.ROW_SEP}\n{BaseCommand.TABLE_SEP}\n"
@@ -112,7 +112,7 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         app_data.logged_in_employee = Mock()
 
         package = Package(td.VALID_START_LOCATION, "PER", td.VALID_WEIGHT, td.VALID_CUSTOMER_EMAIL)
-        app_data._packages.append(package)
+        app_data._add_package(package)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
         expected_message = f"SUITABLE ROUTES:\n{BaseCommand.ROW_SEP}\n{BaseCommand.TABLE_SEP}\n"
@@ -127,9 +127,9 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         route = Route(td.VALID_LOCATIONS_INPUT, td.VALID_DEPARTURE_TIME_INPUT)
         truck = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route.assigned_truck_id = truck.id
-        app_data._packages.append(package)
-        app_data._routes.append(route)
-        app_data._trucks.append(truck)
+        app_data._add_package(package)
+        app_data._add_route(route)
+        app_data._add_truck(truck)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
         expected_message = (f"SUITABLE ROUTES:"
@@ -157,11 +157,11 @@ class SearchRouteCommandTest_Should(unittest.TestCase):
         truck_2 = Truck(td.VALID_TRUCK_NAME, td.VALID_TRUCK_CAPACITY, td.VALID_TRUCK_MAX_RANGE)
         route_1.assigned_truck_id = truck_1.id
         route_2.assigned_truck_id = truck_2.id
-        app_data._packages.append(package)
-        app_data._routes.append(route_1)
-        app_data._routes.append(route_2)
-        app_data._trucks.append(truck_1)
-        app_data._trucks.append(truck_2)
+        app_data._add_package(package)
+        app_data._add_route(route_1)
+        app_data._add_route(route_2)
+        app_data._add_truck(truck_1)
+        app_data._add_truck(truck_2)
         cmd = SearchRouteCommand([str(package.id)], app_data)
         output = cmd.execute()
         expected_message = (f"SUITABLE ROUTES:"
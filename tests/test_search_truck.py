@@ -3,7 +3,7 @@ from unittest.mock import MagicMock
 from errors.application_error import ApplicationError
 from core.application_data import ApplicationData
 from commands.search_truck import SearchTruckCommand
-from interface_menu import ROW_SEP
+from interface_menu import ROW_SEP, TABLE_SEP
 
 
 class TestSearchTruckCommand(unittest.TestCase):
@@ -75,4 +75,19 @@ class TestSearchTruckCommand(unittest.TestCase):
         expected_output = "No available Truck found" + cmd.ROW_SEP
         output = cmd.execute()
 
-        self.assertEqual(output, expected_output)
\ No newline at end of file
+        self.assertEqual(output, expected_output)
+
+    def test_execute_groupsSuitableTrucksByModel(self):
+        app_data = ApplicationData()
+        app_data.logged_in_employee = MagicMock()
+        app_data.create_truck("Scania", 42000, 8000)
+        route = app_data.create_route("SYD,MEL,BRI", "2055-02-16 11:30")
+        truck_ids = [truck.id for truck in app_data.trucks]
+
+        output = SearchTruckCommand([str(route.id)], app_data).execute()
+
+        expected_output = (f"AVAILABLE SCANIA TRUCKS:\n{TABLE_SEP}"
+                           f"\nIDs:            | {truck_ids[0]}\n{TABLE_SEP}"
+                           f"\nCapacity:       | 42000\n{TABLE_SEP}"
+                           f"\nMax Range:      | 8000\n{TABLE_SEP}")
+        self.assertEqual(expected_output, output)
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from core.segmented_store import SegmentedStore
+
+
+class SegmentedStore_Should(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = SegmentedStore(os.path.join(self.temp_dir.name, "state"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_exists_isFalse_beforeFirstWrite(self):
+        self.assertFalse(self.store.exists())
+
+    def test_read_returnsWrittenEntitiesInIdOrder(self):
+        packages = [{"id": package_id, "weight": 1} for package_id in range(2500, 0, -1)]
+        employees = [{"username": "user1"}, {"username": "user2"}]
+
+        self.store.write({"packages": packages, "employees": employees})
+
+        data = self.store.read()
+        self.assertEqual(list(range(1, 2501)), [package["id"] for package in data["packages"]])
+        self.assertEqual({"user1", "user2"}, {employee["username"] for employee in data["employees"]})
+        self.assertEqual([], data["trucks"])
+
+    def test_write_rewritesOnlySegmentsOfChangedEntities(self):
+        self.store.write({"packages": [{"id": package_id, "weight": 1} for package_id in range(1, 2501)]})
+
+        segments_count = self.store.write({"packages": [{"id": 1500, "weight": 2}, {"id": 1501, "weight": 3}]})
+
+        self.assertEqual(1, segments_count)
+        packages = self.store.read()["packages"]
+        self.assertEqual(2500, len(packages))
+        self.assertEqual([2, 3], [packages[1499]["weight"], packages[1500]["weight"]])
+
+    def test_find_readsEntityFromItsSegment(self):
+        self.store.write({"packages": [{"id": package_id, "weight": 1} for package_id in range(1, 2501)],
+                          "employees": [{"username": "user1"}]})
+
+        self.assertEqual({"id": 1500, "weight": 1}, self.store.find("packages", 1500))
+        self.assertEqual({"username": "user1"}, self.store.find("employees", "user1"))
+        self.assertIsNone(self.store.find("packages", 5000))
+
+    def test_find_readsNewState_afterWrite(self):
+        self.store.write({"packages": [{"id": 1, "weight": 1}]})
+        self.store.find("packages", 1)
+
+        self.store.write({"packages": [{"id": 1, "weight": 2}]})
+
+        self.assertEqual(2, self.store.find("packages", 1)["weight"])
+
+    def test_maxId_returnsLargestIdOfSection(self):
+        self.assertEqual(0, self.store.max_id("packages"))
+
+        self.store.write({"packages": [{"id": package_id, "weight": 1} for package_id in (3, 2100, 1999)]})
+
+        self.assertEqual(2100, self.store.max_id("packages"))
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from core.sqlite_store import SqliteStore
+
+
+def package(package_id: int, is_assigned: bool = False) -> dict:
+    return {"id": package_id, "start_location": "SYD", "end_location": "MEL", "weight": 10.0,
+            "customer_email": "customer@mail.com", "departure_time": None, "estimated_arrival_time": None,
+            "is_assigned": is_assigned, "route_id": 1 if is_assigned else None}
+
+
+class SqliteStore_Should(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = SqliteStore(os.path.join(self.temp_dir.name, "state.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_isEmpty_beforeFirstWrite(self):
+        self.assertTrue(self.store.is_empty())
+
+    def test_find_returnsWrittenEntity(self):
+        route = {"id": 3, "locations": "SYD,MEL", "departure_time": "2055-02-16T11:30:00",
+                 "assigned_truck_id": None, "assigned_package_ids": [1, 2], "load": 20.0}
+
+        self.store.write({"routes": [route], "packages": [package(1, True)]})
+
+        self.assertFalse(self.store.is_empty())
+        self.assertEqual(route, self.store.find("routes", 3))
+        self.assertEqual(package(1, True), self.store.find("packages", 1))
+        self.assertIsNone(self.store.find("packages", 2))
+
+    def test_write_replacesEntitiesWithSameKey(self):
+        self.store.write({"packages": [package(1), package(2)]})
+
+        self.store.write({"packages": [package(2, True)]})
+
+        self.assertEqual([package(1), package(2, True)], list(self.store.iter_section("packages")))
+
+    def test_findPackages_returnsOnlyPackagesWithStatus(self):
+        self.store.write({"packages": [package(1), package(2, True), package(3)]})
+
+        self.assertEqual([1, 3], [data["id"] for data in self.store.find_packages(False)])
+        self.assertEqual([2], [data["id"] for data in self.store.find_packages(True)])
+
+    def test_maxId_returnsLargestId(self):
+        self.assertEqual(0, self.store.max_id("packages"))
+
+        self.store.write({"packages": [package(7), package(3)]})
+
+        self.assertEqual(7, self.store.max_id("packages"))
+
+    def test_write_keepsNothing_whenTransactionFails(self):
+        with self.assertRaises(KeyError):
+            self.store.write({"packages": [package(1)], "trucks": [{"id": 1001}]})
+
+        self.assertTrue(self.store.is_empty())
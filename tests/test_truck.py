@@ -114,4 +114,18 @@ class Truck_Should(unittest.TestCase):
             f"Status: Busy\nRoute ID: 1"
         )
 
-        self.assertEqual(expected_str_busy, str(truck))
\ No newline at end of file
+        self.assertEqual(expected_str_busy, str(truck))
+
+    def test_restore_keepsIdCounterAbove(self):
+        data = {
+            "id": 1050,
+            "name": td.VALID_TRUCK_NAME,
+            "capacity": td.VALID_TRUCK_CAPACITY,
+            "max_range": td.VALID_TRUCK_MAX_RANGE,
+            "assigned_route_id": 3
+        }
+
+        truck = Truck.restore(data)
+
+        self.assertEqual(data, truck.to_json())
+        self.assertEqual(1051, Truck.next_id())